@@ -0,0 +1,107 @@
+"""
+benchmarks/bench_full_text.py
+
+Cost of ``extract_full_text_from_xml`` on deeply nested JATS.
+
+Each fixture is one ``<article>`` whose ``<body>`` holds ``--width`` chains
+of ``depth`` nested ``<sec>``s, every section with a title and a paragraph.
+The single-pass extractor is timed against the previous multi-sweep one,
+kept verbatim below as ``_legacy``: it walked every descendant ``<p>`` of
+every ``<sec>``, so its work – and output – grew with the square of the
+depth.
+
+The best of ``--runs`` timings is reported.  Run with
+``python benchmarks/bench_full_text.py [--runs N] [--width W]``.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import xml.etree.ElementTree as ET
+
+from searchpubmed.pubmed import extract_full_text_from_xml
+
+DEPTHS = (1, 4, 16, 64)
+
+
+def _fixture(depth: int, width: int) -> str:
+    chain = "".join(f"<sec><title>Section {i}</title><p>Paragraph {i} of the "
+                    f"nested section chain.</p>" for i in range(depth))
+    chain += "</sec>" * depth
+    return (f"<article><front><abstract><p>Abstract.</p></abstract></front>"
+            f"<body>{chain * width}</body></article>")
+
+
+def _legacy(xml_string: str) -> str:
+    """``extract_full_text_from_xml`` as it was before the single pass."""
+    # parse (will raise if truly malformed)
+    root = ET.fromstring(xml_string)
+
+    def local_name(elem):
+        # strip namespace, if present
+        return elem.tag.split('}', 1)[-1]
+
+    blocks = []
+
+    # 1) Abstracts (there may be multiple)
+    for abstr in root.iter():
+        if local_name(abstr) == "abstract":
+            # optional title
+            for child in list(abstr):
+                if local_name(child) == "title" and child.text and child.text.strip():
+                    blocks.append(child.text.strip())
+            # all paragraphs under this abstract
+            for p in abstr.iter():
+                if local_name(p) == "p":
+                    text = "".join(p.itertext()).strip()
+                    if text:
+                        blocks.append(text)
+
+    # 2) Body sections
+    for body in root.iter():
+        if local_name(body) == "body":
+            for sec in body.iter():
+                if local_name(sec) == "sec":
+                    # section heading
+                    for child in list(sec):
+                        if (local_name(child) == "title" and child.text
+                                and child.text.strip()):
+                            blocks.append(child.text.strip())
+                    # paragraphs in this section
+                    for p in sec.iter():
+                        if local_name(p) == "p":
+                            text = "".join(p.itertext()).strip()
+                            if text:
+                                blocks.append(text)
+
+    return "\n\n".join(blocks)
+
+
+def _best(fn, xml: str, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn(xml)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(
+        description="Time full-text extraction on nested JATS.")
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--width", type=int, default=20)
+    args = ap.parse_args(argv)
+
+    print(f"{'depth':>5} {'KiB':>7} {'legacy ms':>10} {'single ms':>10} "
+          f"{'legacy out':>11} {'single out':>11}")
+    for depth in DEPTHS:
+        xml = _fixture(depth, args.width)
+        old = _best(_legacy, xml, args.runs)
+        new = _best(extract_full_text_from_xml, xml, args.runs)
+        print(f"{depth:>5} {len(xml) / 1024:7.0f} {old * 1e3:10.2f} {new * 1e3:10.2f} "
+              f"{len(_legacy(xml)):11d} {len(extract_full_text_from_xml(xml)):11d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+benchmarks/bench_html_parse.py
+
+Per-page CPU cost of extracting the ``#maincontent`` text of PMC flat pages.
+
+Pass saved pages (``curl -o PMC1234567.html
+'https://pmc.ncbi.nlm.nih.gov/articles/PMC1234567/?format=flat'``) as
+arguments; without any, a synthetic page shaped like a flat view – long
+navigation and reference lists around a ``#maincontent`` article – is used.
+
+Three extractions are timed on every page:
+
+* ``full-soup`` – the previous code: a full ``html.parser`` BeautifulSoup
+  tree, then ``find(id="maincontent")``
+* ``bs4``       – :mod:`searchpubmed.htmlparse` with the SoupStrainer backend
+* ``lxml``      – :mod:`searchpubmed.htmlparse` with lxml (when installed)
+
+Run with ``python benchmarks/bench_html_parse.py [page.html ...] [--runs N]``.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+import bs4
+
+from searchpubmed import htmlparse
+
+_PARA = ("Observational studies of electronic health records were analysed "
+         "with a <i>prespecified</i> protocol and a common data model. ") * 6
+
+
+def _synthetic_page() -> str:
+    nav = "".join(f'<li><a href="/x{i}">Link {i}</a></li>' for i in range(400))
+    refs = "".join(f"<li><span>Author {i} et al.</span> Journal. 2020;{i}:1-9.</li>"
+                   for i in range(300))
+    body = "".join(f"<section><h2>Section {s}</h2>{f'<p>{_PARA}</p>' * 8}</section>"
+                   for s in range(12))
+    return (f"<html><head><script>{'var a=1;' * 500}</script></head><body>"
+            f"<nav><ul>{nav}</ul></nav><aside><ul>{refs}</ul></aside>"
+            f'<main id="maincontent"><article>{body}</article></main>'
+            f"<footer><ul>{nav}</ul></footer></body></html>")
+
+
+def _full_soup(html: str) -> str:
+    soup = bs4.BeautifulSoup(html, "html.parser")
+    main = soup.find(id="maincontent") or soup
+    return " ".join(p.get_text(" ", strip=True) for p in main.find_all("p")).strip()
+
+
+def _backend(name: str):
+    def run(html: str) -> str:
+        htmlparse.set_html_backend(name)
+        return htmlparse.main_paragraph_text(html)
+    return run
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="Time #maincontent extraction per page.")
+    ap.add_argument("pages", nargs="*", type=Path)
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args(argv)
+
+    pages = [p.read_text(encoding="utf-8", errors="replace") for p in args.pages]
+    pages = pages or [_synthetic_page()]
+    methods = {"full-soup": _full_soup, "bs4": _backend("bs4")}
+    try:
+        import lxml.html  # noqa: F401
+        methods["lxml"] = _backend("lxml")
+    except ImportError:
+        print("lxml not installed – skipping the lxml backend")
+
+    kib = sum(len(p) for p in pages) / len(pages) / 1024
+    print(f"{len(pages)} page(s), {kib:.0f} KiB on average; best of {args.runs} runs")
+    base = None
+    for name, fn in methods.items():
+        per_page = []
+        for page in pages:
+            times = []
+            for _ in range(args.runs):
+                t0 = time.process_time()
+                fn(page)
+                times.append(time.process_time() - t0)
+            per_page.append(min(times))
+        ms = sum(per_page) / len(per_page) * 1e3
+        base = base or ms
+        print(f"{name:>10}: {ms:8.2f} ms CPU per page  ({base / ms:.1f}x)")
+    htmlparse.set_html_backend(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+benchmarks/bench_import.py
+
+Cold-start cost of ``import searchpubmed`` in a fresh interpreter.
+
+Three scenarios, each timed in ``--runs`` new processes (median reported):
+
+* ``lazy``   – ``import searchpubmed`` (what a short-lived worker pays up front)
+* ``pubmed`` – ``from searchpubmed import get_pmid_from_pubmed``
+* ``eager``  – the above plus every module the pre-lazy ``pubmed`` imported
+  at top level (dateparser, pandas, requests, BeautifulSoup and the
+  stdlib), i.e. what the package cost at import time before the lazy surface
+
+Run with ``python benchmarks/bench_import.py [--runs N]``.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "lazy": "import searchpubmed",
+    "pubmed": "from searchpubmed import get_pmid_from_pubmed",
+    "eager": ("from searchpubmed import get_pmid_from_pubmed\n"
+              "import calendar, concurrent.futures, datetime, importlib, logging\n"
+              "import math, re, sys, threading, time, typing, xml.etree.ElementTree\n"
+              "import dateparser, pandas, requests, requests.exceptions, bs4"),
+}
+
+_TIMER = """
+import time
+t0 = time.perf_counter()
+{stmt}
+print(time.perf_counter() - t0)
+"""
+
+
+def _time(stmt: str) -> float:
+    out = subprocess.run([sys.executable, "-c", _TIMER.format(stmt=stmt)],
+                         check=True, capture_output=True, text=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="Time a cold import of searchpubmed.")
+    ap.add_argument("--runs", type=int, default=7)
+    args = ap.parse_args(argv)
+
+    _time(SCENARIOS["eager"])  # warm the OS file cache
+    results = {name: statistics.median(_time(stmt) for _ in range(args.runs))
+               for name, stmt in SCENARIOS.items()}
+    for name, secs in results.items():
+        print(f"{name:>7}: {secs * 1e3:8.1f} ms")
+    speedup = results["eager"] / results["lazy"]
+    print(f"speed-up of 'import searchpubmed': {speedup:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+benchmarks/bench_oa_ingest.py
+
+Throughput of :func:`searchpubmed.oa_bulk.iter_oa_tarballs` against the
+number of worker processes.
+
+A synthetic OA bulk package of ``--articles`` JATS files – each with
+``--sections`` sections of a few paragraphs – is written to a temporary
+``.tar.gz`` once and then ingested with ``processes`` = 1, 2, 4, … up to
+the core count, reporting articles per second.
+
+Run with ``python benchmarks/bench_oa_ingest.py [--articles N] [--sections S]``.
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+
+from searchpubmed.oa_bulk import iter_oa_tarballs
+
+_PARA = ("Observational studies of electronic health records were analysed "
+         "with a prespecified protocol and a common data model. ") * 4
+
+
+def _article(i: int, sections: int) -> bytes:
+    body = "".join(f"<sec><title>Section {s}</title>" + f"<p>{_PARA}</p>" * 3 + "</sec>"
+                   for s in range(sections))
+    return (f'<?xml version="1.0"?><article><front><article-meta>'
+            f'<article-id pub-id-type="pmc">{i}</article-id>'
+            f'<abstract><p>{_PARA}</p></abstract></article-meta></front>'
+            f'<body>{body}</body></article>').encode()
+
+
+def _package(path: Path, articles: int, sections: int) -> Path:
+    with tarfile.open(path, "w:gz") as tar:
+        for i in range(articles):
+            data = _article(i, sections)
+            info = tarfile.TarInfo(f"PMC000xxxxxx/PMC{i}.xml")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return path
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="Time OA bulk ingest per process count.")
+    ap.add_argument("--articles", type=int, default=2000)
+    ap.add_argument("--sections", type=int, default=12)
+    args = ap.parse_args(argv)
+
+    cores = os.cpu_count() or 1
+    counts = [n for n in (1, 2, 4, 8, 16, 32, 64) if n <= cores]
+    with tempfile.TemporaryDirectory() as tmp:
+        package = _package(Path(tmp) / "oa_bench.tar.gz", args.articles, args.sections)
+        print(f"{args.articles} articles, {package.stat().st_size / 2**20:.1f} MiB "
+              f"compressed, {cores} cores")
+        base = None
+        for n in counts:
+            t0 = time.perf_counter()
+            rows = sum(len(f) for f in iter_oa_tarballs([package], processes=n,
+                                                        keep_xml=False))
+            rate = rows / (time.perf_counter() - t0)
+            base = base or rate
+            print(f"processes={n:>3}: {rate:8.0f} articles/s  ({rate / base:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
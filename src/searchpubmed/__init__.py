@@ -13,46 +13,162 @@ from __future__ import annotations
 
 __version__: str = "0.1.0"
 
-# ---------------------------------------------------------------------------
-# Core PubMed functionality
-# ---------------------------------------------------------------------------
-from .pubmed import (
-    get_pmc_full_text,
-    get_pmc_full_xml,
-    get_pmc_html_text,
-    get_pubmed_metadata_pmid,
-    get_pubmed_metadata_pmcid,
-    map_pmids_to_pmcids,
-    get_pmc_licenses
-)
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# ---------------------------------------------------------------------------
-# Query-builder re-exports
-# ---------------------------------------------------------------------------
-from .query_builder import (
-    QueryOptions,
-    build_query,
-    STRATEGY1_OPTS,
-    STRATEGY2_OPTS,
-    STRATEGY3_OPTS,
-    STRATEGY4_OPTS,
-    STRATEGY5_OPTS,
-    STRATEGY6_OPTS,
-)
+# Public names are resolved on first access (PEP 562), so ``import
+# searchpubmed`` stays cheap and free of side effects; each submodule – and
+# the heavy libraries it needs – loads only when one of its names is used.
+_LAZY_EXPORTS: dict[str, str] = {
+    # Core PubMed functionality
+    "get_pmid_from_pubmed": "pubmed",
+    "iter_pmid_pages": "pubmed",
+    "count_pubmed": "pubmed",
+    "get_pmc_full_text": "pubmed",
+    "get_pmc_full_xml": "pubmed",
+    "get_pmc_html_text": "pubmed",
+    "get_pubmed_metadata_pmid": "pubmed",
+    "get_pubmed_metadata_pmcid": "pubmed",
+    "iter_pubmed_metadata_pmid": "pubmed",
+    "iter_pubmed_metadata_pmcid": "pubmed",
+    "map_pmids_to_pmcids": "pubmed",
+    "get_pmc_licenses": "pubmed",
+    # Asyncio client
+    "AsyncPubMed": "aio",
+    # Persistent response cache
+    "ResponseCache": "cache",
+    "RevalidationStats": "cache",
+    # Shared rate limiting
+    "RateLimiter": "ratelimit",
+    "get_rate_limiter": "ratelimit",
+    # Checkpoint / resume
+    "JobJournal": "journal",
+    "run_resumable": "journal",
+    # Parquet output
+    "ParquetSink": "sink",
+    "write_pubmed_metadata": "sink",
+    "write_pmc_full_xml": "sink",
+    # Corpus-level text extraction
+    "chunk_jats_corpus": "corpus",
+    "iter_jats_corpus_chunks": "corpus",
+    # HTML parser backend
+    "set_html_backend": "htmlparse",
+    # Tiered full-text retrieval
+    "TieredFullText": "fulltext",
+    "Tier": "fulltext",
+    # Offline PMC Open Access bulk ingest
+    "iter_oa_tarballs": "oa_bulk",
+    "ingest_oa_tarballs": "oa_bulk",
+    # Offline PMID → PMCID index
+    "PmcIdIndex": "idindex",
+    "build_pmc_id_index": "idindex",
+    # Query-builder re-exports
+    "QueryOptions": "query_builder",
+    "build_query": "query_builder",
+    "STRATEGY1_OPTS": "query_builder",
+    "STRATEGY2_OPTS": "query_builder",
+    "STRATEGY3_OPTS": "query_builder",
+    "STRATEGY4_OPTS": "query_builder",
+    "STRATEGY5_OPTS": "query_builder",
+    "STRATEGY6_OPTS": "query_builder",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later look-ups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+if TYPE_CHECKING:  # static analysers see the eager imports
+    from .aio import AsyncPubMed
+    from .cache import ResponseCache, RevalidationStats
+    from .corpus import chunk_jats_corpus, iter_jats_corpus_chunks
+    from .htmlparse import set_html_backend
+    from .idindex import PmcIdIndex, build_pmc_id_index
+    from .fulltext import Tier, TieredFullText
+    from .journal import JobJournal, run_resumable
+    from .oa_bulk import ingest_oa_tarballs, iter_oa_tarballs
+    from .pubmed import (
+        count_pubmed,
+        get_pmc_full_text,
+        get_pmc_full_xml,
+        get_pmc_html_text,
+        get_pmc_licenses,
+        get_pmid_from_pubmed,
+        get_pubmed_metadata_pmcid,
+        get_pubmed_metadata_pmid,
+        iter_pmid_pages,
+        iter_pubmed_metadata_pmcid,
+        iter_pubmed_metadata_pmid,
+        map_pmids_to_pmcids,
+    )
+    from .query_builder import (
+        STRATEGY1_OPTS,
+        STRATEGY2_OPTS,
+        STRATEGY3_OPTS,
+        STRATEGY4_OPTS,
+        STRATEGY5_OPTS,
+        STRATEGY6_OPTS,
+        QueryOptions,
+        build_query,
+    )
+    from .ratelimit import RateLimiter, get_rate_limiter
+    from .sink import ParquetSink, write_pmc_full_xml, write_pubmed_metadata
 
 # ---------------------------------------------------------------------------
 # Public export list
 # ---------------------------------------------------------------------------
 __all__: list[str] = [
     # PubMed helpers
-    "get_pmid_from_pubmed",  
+    "get_pmid_from_pubmed",
+    "iter_pmid_pages",
+    "count_pubmed",
     "get_pubmed_metadata_pmid",
     "get_pubmed_metadata_pmcid",
+    "iter_pubmed_metadata_pmid",
+    "iter_pubmed_metadata_pmcid",
     "map_pmids_to_pmcids",
     "get_pmc_licenses",
     "get_pmc_full_xml",
     "get_pmc_html_text",
     "get_pmc_full_text",
+    # Asyncio client
+    "AsyncPubMed",
+    # Response cache
+    "ResponseCache",
+    "RevalidationStats",
+    # Rate limiting
+    "RateLimiter",
+    "get_rate_limiter",
+    # Checkpoint / resume
+    "JobJournal",
+    "run_resumable",
+    # Parquet output
+    "ParquetSink",
+    "write_pubmed_metadata",
+    "write_pmc_full_xml",
+    # Corpus-level text extraction
+    "chunk_jats_corpus",
+    "iter_jats_corpus_chunks",
+    # HTML parser backend
+    "set_html_backend",
+    # Tiered full text
+    "TieredFullText",
+    "Tier",
+    # Offline OA bulk ingest
+    "iter_oa_tarballs",
+    "ingest_oa_tarballs",
+    # Offline id index
+    "PmcIdIndex",
+    "build_pmc_id_index",
     # Query-builder helpers
     "QueryOptions",
     "build_query",
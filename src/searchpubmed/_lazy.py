@@ -0,0 +1,47 @@
+"""searchpubmed._lazy – deferred imports of heavy third-party modules.
+
+``pandas``, ``requests`` and ``bs4`` together cost far more to import than
+a short batch job spends talking to NCBI.  :func:`lazy_import` hands back a
+stand-in module that performs the real import on first attribute access, so
+``import searchpubmed.pubmed`` stays cheap and the price is only paid by the
+code paths that need it.
+
+Attribute writes and deletes are forwarded to the real module, which keeps
+``monkeypatch.setattr(pubmed.requests, "get", …)`` patching ``requests``
+itself.
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+
+__all__ = ["lazy_import"]
+
+
+class _LazyModule(types.ModuleType):
+    """Proxy for the module *name*; imported (thread-safely) on first use."""
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__.get("_module")
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value) -> None:
+        setattr(self._load(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """The module *name* if already imported, else a lazy stand-in for it."""
+    return sys.modules.get(name) or _LazyModule(name)
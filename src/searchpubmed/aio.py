@@ -0,0 +1,203 @@
+"""searchpubmed.aio – asyncio front-end to :mod:`searchpubmed.pubmed`.
+
+:class:`AsyncPubMed` exposes coroutine counterparts of the public fetchers.
+Each call is split into per-batch (or, for HTML scraping, per-article) jobs
+that run concurrently in a bounded worker pool and share one pooled,
+keep-alive HTTP session.  Every job goes through the same code path as the
+synchronous API, so response caching and the shared token-bucket rate limit
+apply unchanged – with an API key, a single event loop can keep the full
+10 req s⁻¹ budget busy::
+
+    import asyncio
+    from searchpubmed.aio import AsyncPubMed
+
+    async def main(pmids):
+        async with AsyncPubMed(api_key="…", max_in_flight=10) as client:
+            meta, links = await asyncio.gather(
+                client.get_pubmed_metadata_pmid(pmids),
+                client.map_pmids_to_pmcids(pmids),
+            )
+        return meta, links
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, TypeVar
+
+import pandas as pd
+
+from . import pubmed
+from .cache import ResponseCache
+
+__all__ = ["AsyncPubMed"]
+
+T = TypeVar("T")
+
+
+def _batches(items: Sequence[str], size: int) -> List[List[str]]:
+    return [list(items[i:i + size]) for i in range(0, len(items), size)]
+
+
+def _canonical(pmcid: str) -> str:
+    return pmcid if str(pmcid).upper().startswith("PMC") else f"PMC{pmcid}"
+
+
+def _sum_revalidation(frames: List[pd.DataFrame], out: pd.DataFrame) -> pd.DataFrame:
+    """Add up the ``attrs["revalidation"]`` reports of *frames* onto *out*."""
+    total: Dict[str, float] = {}
+    for frame in frames:
+        for key, value in frame.attrs.get("revalidation", {}).items():
+            total[key] = total.get(key, 0) + value
+    out.attrs["revalidation"] = total
+    return out
+
+
+class AsyncPubMed:
+    """
+    Asyncio client for PubMed / PMC.
+
+    Parameters
+    ----------
+    api_key : str | None, optional
+        NCBI API key, forwarded to every E-utilities call (and selecting the
+        10 req s⁻¹ bucket of the shared rate limiter).
+    max_in_flight : int, default 8
+        Upper bound on concurrent HTTP jobs; also the connection-pool size.
+    cache : ResponseCache, optional
+        Persistent response cache passed to every call.
+
+    Use as ``async with AsyncPubMed(...) as client:`` or call :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        *,
+        api_key: Optional[str] = None,
+        max_in_flight: int = 8,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
+        self.api_key = api_key
+        self.cache = cache
+        self.max_in_flight = max_in_flight
+        self._session = pubmed._pooled_session(max_in_flight)
+        self._pool = ThreadPoolExecutor(max_workers=max_in_flight,
+                                        thread_name_prefix="searchpubmed-aio")
+
+    # ------------------------------------------------------------------ #
+    async def __aenter__(self) -> "AsyncPubMed":
+        return self
+
+    async def __aexit__(self, *_exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+        self._session.close()
+
+    def _call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        token = pubmed._POOLED_SESSION.set(self._session)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            pubmed._POOLED_SESSION.reset(token)
+
+    async def _run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._pool, functools.partial(self._call, fn, *args, **kwargs))
+
+    async def _gather(self, fn: Callable[..., T], batches: List[List[str]],
+                      **kwargs: Any) -> List[T]:
+        return list(await asyncio.gather(
+            *(self._run(fn, batch, **kwargs) for batch in batches)))
+
+    def _eutils_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return {"api_key": self.api_key, "cache": self.cache, **kwargs}
+
+    # ------------------------------------------------------------------ #
+    async def get_pmid_from_pubmed(self, query: str, **kwargs: Any) -> list[str]:
+        """Async :func:`searchpubmed.pubmed.get_pmid_from_pubmed`."""
+        return await self._run(pubmed.get_pmid_from_pubmed, query,
+                               **self._eutils_kwargs(kwargs))
+
+    async def map_pmids_to_pmcids(self, pmids: List[str], *, batch_size: int = 500,
+                                  **kwargs: Any) -> pd.DataFrame:
+        """Async :func:`searchpubmed.pubmed.map_pmids_to_pmcids`."""
+        unique = list(dict.fromkeys(map(str, pmids)))
+        if not unique:
+            return await self._run(pubmed.map_pmids_to_pmcids, [],
+                                   **self._eutils_kwargs(kwargs))
+        frames = await self._gather(pubmed.map_pmids_to_pmcids,
+                                    _batches(unique, batch_size),
+                                    batch_size=batch_size,
+                                    **self._eutils_kwargs(kwargs))
+        merged = pd.concat(frames, ignore_index=True).drop_duplicates(ignore_index=True)
+        return pubmed._merge_reports(frames, merged)
+
+    async def get_pubmed_metadata_pmid(self, pmids: List[str], *, batch_size: int = 200,
+                                       **kwargs: Any) -> pd.DataFrame:
+        """Async :func:`searchpubmed.pubmed.get_pubmed_metadata_pmid`."""
+        unique = list(dict.fromkeys(pmids))
+        if not unique:
+            return await self._run(pubmed.get_pubmed_metadata_pmid, [])
+        frames = await self._gather(pubmed.get_pubmed_metadata_pmid,
+                                    _batches(unique, batch_size),
+                                    batch_size=batch_size,
+                                    **self._eutils_kwargs(kwargs))
+        return pubmed._merge_reports(
+            frames, pd.concat(frames).sort_values("pmid", ignore_index=True))
+
+    async def get_pubmed_metadata_pmcid(self, pmcids: List[str], *,
+                                        batch_size: int = 200,
+                                        **kwargs: Any) -> pd.DataFrame:
+        """Async :func:`searchpubmed.pubmed.get_pubmed_metadata_pmcid`."""
+        unique = list(dict.fromkeys(map(_canonical, pmcids)))
+        if not unique:
+            return await self._run(pubmed.get_pubmed_metadata_pmcid, [])
+        frames = await self._gather(pubmed.get_pubmed_metadata_pmcid,
+                                    _batches(unique, batch_size),
+                                    batch_size=batch_size,
+                                    **self._eutils_kwargs(kwargs))
+        return pubmed._merge_reports(
+            frames, pd.concat(frames).sort_values("pmcid", ignore_index=True))
+
+    async def get_pmc_full_xml(self, pmcids: List[str], *, batch_size: int = 200,
+                               **kwargs: Any) -> pd.DataFrame:
+        """Async :func:`searchpubmed.pubmed.get_pmc_full_xml`."""
+        if not pmcids:
+            return await self._run(pubmed.get_pmc_full_xml, [])
+        frames = await self._gather(pubmed.get_pmc_full_xml,
+                                    _batches(list(pmcids), batch_size),
+                                    batch_size=batch_size,
+                                    **self._eutils_kwargs(kwargs))
+        return pubmed._merge_reports(frames, pd.concat(frames, ignore_index=True))
+
+    async def get_pmc_html_text(self, pmcids: List[str], **kwargs: Any) -> pd.DataFrame:
+        """
+        Async :func:`searchpubmed.pubmed.get_pmc_html_text` – one job per
+        article, rows returned in the caller's order.
+        """
+        first: Dict[str, str] = {}
+        for pid in pmcids:
+            first.setdefault(_canonical(pid), pid)
+        if not first:
+            return await self._run(pubmed.get_pmc_html_text, [])
+        kwargs.setdefault("cache", self.cache)
+        frames = await self._gather(pubmed.get_pmc_html_text,
+                                    [[orig] for orig in first.values()], **kwargs)
+        return _sum_revalidation(frames, pd.concat(frames, ignore_index=True))
+
+    async def get_pmc_licenses(self, pmcids: Iterable[str], *, chunk_size: int = 200,
+                               **kwargs: Any) -> Dict[str, Optional[str]]:
+        """Async :func:`searchpubmed.pubmed.get_pmc_licenses`."""
+        unique = list(dict.fromkeys(_canonical(p.upper()) for p in pmcids))
+        kwargs.setdefault("cache", self.cache)
+        parts = await self._gather(pubmed.get_pmc_licenses,
+                                   _batches(unique, chunk_size),
+                                   chunk_size=chunk_size, **kwargs)
+        out: Dict[str, Optional[str]] = {}
+        for part in parts:
+            out.update(part)
+        return out
@@ -0,0 +1,245 @@
+"""searchpubmed.cache – persistent, compressed on-disk cache for raw HTTP
+response bodies (ESearch, ELink, EFetch, ID Converter, OA service and PMC
+HTML pages).
+
+Every network helper in :mod:`searchpubmed.pubmed` takes a ``cache=``
+argument.  Anything exposing ``get(endpoint, params) -> bytes | None`` and
+``set(endpoint, params, body)`` can be plugged in; :class:`ResponseCache`
+is the stock SQLite implementation::
+
+    from searchpubmed import ResponseCache, get_pmc_full_xml
+    cache = ResponseCache("~/.cache/searchpubmed/http.sqlite")
+    df = get_pmc_full_xml(pmcids, cache=cache)   # second run: no network
+
+:class:`ResponseCache` also keeps the ``ETag`` / ``Last-Modified``
+validators of a response.  Once such an entry expires, the PMC HTML and OA
+helpers revalidate it with a conditional request instead of downloading it
+again; a ``304 Not Modified`` renews the entry (see
+:class:`RevalidationStats`).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
+
+__all__ = ["ResponseCache", "RevalidationStats", "DEFAULT_TTLS"]
+
+# Seconds a stored response stays fresh, per endpoint.  Search results move
+# daily; article records and full text very rarely change.
+DEFAULT_TTLS: Dict[str, float] = {
+    "esearch": 24 * 3600,
+    "elink": 7 * 24 * 3600,
+    "idconv": 7 * 24 * 3600,
+    "efetch": 30 * 24 * 3600,
+    "oa": 7 * 24 * 3600,
+    "pmc-flat": 7 * 24 * 3600,
+    "pmc-html": 7 * 24 * 3600,
+    "fulltext": 30 * 24 * 3600,  # extracted texts of searchpubmed.fulltext
+    # parsed pages keyed by their validators – they cannot go out of date
+    "pmc-html-parsed": 365 * 24 * 3600,
+}
+
+# Parameters that never influence the response body.
+_IGNORED_PARAMS = {"api_key", "tool", "email"}
+
+Params = Union[Mapping[str, object], Sequence[Tuple[str, object]], None]
+
+
+@dataclass
+class RevalidationStats:
+    """
+    What conditional revalidation saved during one call.
+
+    ``requests`` conditional requests were sent for expired entries;
+    ``not_modified`` of them came back ``304`` and were served from the
+    cache, sparing ``bytes_saved`` bytes of download and
+    ``parse_seconds_saved`` seconds of HTML parsing (parsed pages are kept
+    alongside their validators).
+    """
+
+    requests: int = 0
+    not_modified: int = 0
+    bytes_saved: int = 0
+    parse_seconds_saved: float = 0.0
+
+
+# Rows looked at per eviction step, and writes between re-reading the total
+# size from the database (it drifts when other processes share the file).
+_EVICT_STEP = 32
+_RESYNC_EVERY = 1024
+
+
+def _normalise(params: Params) -> list[tuple[str, str]]:
+    items = params.items() if isinstance(params, Mapping) else (params or [])
+    return sorted((str(k), str(v)) for k, v in items if k not in _IGNORED_PARAMS)
+
+
+class ResponseCache:
+    """
+    SQLite-backed response cache with per-endpoint TTLs, a total size cap
+    enforced by least-recently-used eviction, and zlib-compressed bodies.
+
+    Parameters
+    ----------
+    path : path-like, default ``~/.cache/searchpubmed/responses.sqlite``
+        Database file (created on first use).  Safe to share between
+        threads and processes.
+    ttls : dict[str, float], optional
+        Per-endpoint overrides of :data:`DEFAULT_TTLS`, in seconds.
+    default_ttl : float, default 7 days
+        TTL for endpoints missing from both tables.
+    max_bytes : int, default 1 GiB
+        Upper bound on the *compressed* size of all stored bodies.
+    compress_level : int, default 6
+        zlib level (0 stores bodies uncompressed inside the zlib frame).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike, None] = None,
+        *,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 7 * 24 * 3600,
+        max_bytes: int = 1 << 30,
+        compress_level: int = 6,
+    ) -> None:
+        self.path = Path(
+            path or Path.home() / ".cache" / "searchpubmed" / "responses.sqlite"
+        ).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False,
+                                   isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, endpoint TEXT NOT NULL,"
+            " created REAL NOT NULL, accessed REAL NOT NULL,"
+            " size INTEGER NOT NULL, body BLOB NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)")
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(responses)")}
+        if "validators" not in columns:  # databases written by older versions
+            self._db.execute("ALTER TABLE responses ADD COLUMN validators TEXT")
+        self._writes = 0
+        self._total = self._stored_bytes()
+
+    def _stored_bytes(self) -> int:
+        return self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def key(endpoint: str, params: Params = None) -> str:
+        """Stable digest of *endpoint* plus its normalised parameters."""
+        blob = json.dumps([endpoint, _normalise(params)], separators=(",", ":"))
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    def get(self, endpoint: str, params: Params = None) -> Optional[bytes]:
+        """Return the stored body, or ``None`` if absent or expired."""
+        key = self.key(endpoint, params)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT created, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[0] > self.ttls.get(endpoint, self.default_ttl):
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?",
+                             (now, key))
+            self.hits += 1
+        return zlib.decompress(row[1])
+
+    def get_stale(self, endpoint: str,
+                  params: Params = None) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        """
+        Return ``(body, validators)`` of an entry stored with validators,
+        expired or not, for conditional revalidation; ``None`` otherwise.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, validators FROM responses WHERE key = ?",
+                (self.key(endpoint, params),)).fetchone()
+        if row is None or not row[1]:
+            return None
+        return zlib.decompress(row[0]), json.loads(row[1])
+
+    def touch(self, endpoint: str, params: Params = None) -> None:
+        """Restart the TTL of an entry the server confirmed unchanged (HTTP 304)."""
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE responses SET created = ?, accessed = ? WHERE key = ?",
+                (now, now, self.key(endpoint, params)))
+
+    def set(self, endpoint: str, params: Params, body: bytes, *,
+            validators: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Store *body* – with the response's ``ETag`` / ``Last-Modified``
+        *validators*, if any – then evict least-recently-used rows over the cap.
+        """
+        blob = zlib.compress(body, self.compress_level)
+        key = self.key(endpoint, params)
+        now = time.time()
+        with self._lock:
+            old = self._db.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, endpoint, created, accessed, size, body, validators)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, endpoint, now, now, len(blob), blob,
+                 json.dumps(dict(validators)) if validators else None),
+            )
+            self._writes += 1
+            if self._writes % _RESYNC_EVERY == 0:
+                self._total = self._stored_bytes()
+            else:
+                self._total += len(blob) - (old[0] if old else 0)
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least-recently-used rows, a few at a time, until under the cap."""
+        while self._total > self.max_bytes:
+            rows = self._db.execute(
+                "SELECT key, size FROM responses ORDER BY accessed LIMIT ?",
+                (_EVICT_STEP,)).fetchall()
+            if not rows:  # emptied by another process
+                self._total = 0
+                return
+            doomed = []
+            for key, size in rows:
+                doomed.append((key,))
+                self._total -= size
+                if self._total <= self.max_bytes:
+                    break
+            self._db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._total = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,197 @@
+"""searchpubmed.corpus – JATS text extraction and chunking over a corpus.
+
+:func:`~searchpubmed.pubmed.get_jats_text_chunks` and
+:func:`~searchpubmed.pubmed.extract_full_text_from_xml` are pure-Python,
+CPU-bound and handle one article per call.  :func:`chunk_jats_corpus`
+spreads them over a process pool and returns one long-format table – a row
+per chunk, in input order – for any number of ``(pmcid, xml)`` pairs::
+
+    from searchpubmed import get_pmc_full_xml
+    from searchpubmed.corpus import chunk_jats_corpus
+
+    xml = get_pmc_full_xml(pmcids)
+    chunks = chunk_jats_corpus(xml, processes=8, min_len=80)
+
+:func:`chunk_jats_corpus` holds the whole result in memory.  For corpora
+whose chunks do not fit, :func:`iter_jats_corpus_chunks` yields the same
+rows one frame per batch of articles, e.g. straight into a
+:class:`~searchpubmed.sink.ParquetSink`::
+
+    sink = ParquetSink("out/chunks", partition_by=None)
+    for frame in iter_jats_corpus_chunks(pairs, processes=8):
+        sink.write(frame)
+
+Articles that cannot be parsed do not abort the run: each contributes a
+single row whose ``error`` column says why.
+"""
+from __future__ import annotations
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple,
+                    TypeVar, Union)
+
+import pandas as pd
+
+from . import pubmed
+
+__all__ = ["CHUNK_COLUMNS", "chunk_jats_corpus", "iter_jats_corpus_chunks"]
+
+CHUNK_COLUMNS: Dict[str, str] = {
+    "pmcid": "string",
+    "chunk": "Int32",
+    "text": "string",
+    "tag": "string",
+    "section": "string",
+    "parent_sec": "string",
+    "section_type": "string",
+    "error": "string",
+}
+
+_META = ("tag", "section", "parent_sec", "section_type")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _article_rows(task: Tuple[str, Optional[str], bool, Dict[str, Any]]) -> List[dict]:
+    """Chunk rows of one article (runs in a worker process)."""
+    pmcid, xml, full_text, opts = task
+    try:
+        if not isinstance(xml, str) or xml in ("", "N/A"):
+            raise ValueError("no XML")
+        if full_text:
+            return [{"pmcid": pmcid, "chunk": 0,
+                     "text": pubmed.extract_full_text_from_xml(xml)}]
+        chunks = pubmed.get_jats_text_chunks(xml, **opts, text_only=False)
+    except Exception as exc:
+        return [{"pmcid": pmcid, "error": f"{type(exc).__name__}: {exc}"}]
+    return [{"pmcid": pmcid, "chunk": i, "text": text,
+             **{key: meta.get(key, "") for key in _META}}
+            for i, (text, meta) in enumerate(chunks)]
+
+
+def _pairs(articles: Union[pd.DataFrame, Iterable[Tuple[str, str]]],
+           xml_column: str) -> Iterator[Tuple[str, Optional[str]]]:
+    if isinstance(articles, pd.DataFrame):
+        return zip(articles["pmcid"].tolist(), articles[xml_column].tolist())
+    return iter(articles)
+
+
+def _ordered_map(fn: Callable[[T], R], items: Iterable[T], *,
+                 processes: Optional[int] = None, chunksize: int = 16) -> Iterator[R]:
+    """
+    ``map(fn, items)`` across a process pool, results in input order.
+
+    *items* is consumed a window of ``processes × chunksize × 4`` at a time,
+    so an arbitrarily long iterator never sits in memory whole.  ``None``
+    processes means every core; ``0`` or ``1`` maps in the calling process.
+    """
+    workers = (os.cpu_count() or 1) if processes is None else processes
+    if workers <= 1:
+        yield from map(fn, items)
+        return
+    items = iter(items)
+    window = workers * chunksize * 4
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while batch := list(itertools.islice(items, window)):
+            yield from pool.map(fn, batch, chunksize=chunksize)
+
+
+def _chunk_frame(rows: List[dict]) -> pd.DataFrame:
+    return pd.DataFrame(rows).reindex(columns=list(CHUNK_COLUMNS)).astype(CHUNK_COLUMNS)
+
+
+def iter_jats_corpus_chunks(
+    articles: Union[pd.DataFrame, Iterable[Tuple[str, str]]],
+    *,
+    batch_size: int = 1000,
+    processes: Optional[int] = None,
+    chunksize: int = 16,
+    full_text: bool = False,
+    xml_column: str = "fullXML",
+    **chunk_kwargs: Any,
+) -> Iterator[pd.DataFrame]:
+    """
+    Generator counterpart of :func:`chunk_jats_corpus` (same parameters,
+    same columns and dtypes): one frame per *batch_size* input articles,
+    in input order, so only a window of the input and one batch of rows
+    are held in memory at a time.
+    """
+    tasks = ((pmcid, xml, full_text, chunk_kwargs)
+             for pmcid, xml in _pairs(articles, xml_column))
+    rows: List[dict] = []
+    n = 0
+    for article in _ordered_map(_article_rows, tasks, processes=processes,
+                                chunksize=chunksize):
+        rows += article
+        n += 1
+        if n == batch_size:
+            yield _chunk_frame(rows)
+            rows, n = [], 0
+    if n:
+        yield _chunk_frame(rows)
+
+
+def chunk_jats_corpus(
+    articles: Union[pd.DataFrame, Iterable[Tuple[str, str]]],
+    *,
+    processes: Optional[int] = None,
+    chunksize: int = 16,
+    full_text: bool = False,
+    output: str = "pandas",
+    xml_column: str = "fullXML",
+    **chunk_kwargs: Any,
+):
+    """
+    Chunk (or extract the text of) many JATS articles in parallel.
+
+    Parameters
+    ----------
+    articles : DataFrame or iterable of (pmcid, xml)
+        A :func:`~searchpubmed.pubmed.get_pmc_full_xml` frame (its
+        ``pmcid`` and *xml_column* are used) or any iterable of pairs.
+    processes : int | None, default None
+        Worker processes; ``None`` uses every core, ``0`` or ``1`` runs in
+        the calling process.
+    chunksize : int, default 16
+        Articles handed to a worker per task.  Larger values cut IPC
+        overhead, smaller ones balance uneven article sizes better.
+    full_text : bool, default False
+        One row per article holding
+        :func:`~searchpubmed.pubmed.extract_full_text_from_xml` instead of
+        one row per chunk.
+    output : {"pandas", "arrow"}, default "pandas"
+        Return a DataFrame or a ``pyarrow.Table`` (needs pyarrow).
+    **chunk_kwargs
+        Passed to :func:`~searchpubmed.pubmed.get_jats_text_chunks`
+        (``min_len``, ``keywords``, ``include_tables``, …).
+
+    Returns
+    -------
+    pandas.DataFrame | pyarrow.Table
+        Columns of :data:`CHUNK_COLUMNS`: ``pmcid``, ``chunk`` (0-based
+        position within the article), ``text``, the chunk metadata ``tag``,
+        ``section``, ``parent_sec`` and ``section_type``, and ``error`` –
+        set, with every other column but ``pmcid`` null, on the one row of
+        an article that failed.  Rows follow the input order regardless of
+        *processes*; articles without chunks contribute no rows.
+
+        The input is read a window at a time, but every row is collected
+        into the one result; use :func:`iter_jats_corpus_chunks` to keep
+        memory bounded.
+    """
+    if output not in ("pandas", "arrow"):
+        raise ValueError(f"output must be 'pandas' or 'arrow', not {output!r}")
+    frames = list(iter_jats_corpus_chunks(
+        articles, batch_size=10_000, processes=processes, chunksize=chunksize,
+        full_text=full_text, xml_column=xml_column, **chunk_kwargs))
+    df = (pd.concat(frames, ignore_index=True).astype(CHUNK_COLUMNS)
+          if frames else _chunk_frame([]))
+    if output == "pandas":
+        return df
+    from .sink import _require_pyarrow
+
+    pa = _require_pyarrow()[0]
+    return pa.Table.from_pandas(df, preserve_index=False)
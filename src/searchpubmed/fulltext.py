@@ -0,0 +1,291 @@
+"""searchpubmed.fulltext – tiered full-text retrieval with per-tier statistics.
+
+PMC serves the text of an article through several channels of very
+different cost: the flat HTML view, the JATS XML from EFetch (which can be
+batched), and the regular article page.  :class:`TieredFullText` tries
+them in a configurable order – behind a local store of texts already
+found – and stops for each article at the first tier whose text passes a
+quality rule.  Every tier runs with its own timeout and concurrency limit
+and keeps hit-rate, request, byte and latency counters, so the order can be
+tuned to spend the fewest requests and bytes per article::
+
+    from searchpubmed import ResponseCache
+    from searchpubmed.fulltext import Tier, TieredFullText
+
+    fetcher = TieredFullText(
+        [Tier("cache"), Tier("xml", batch_size=200), Tier("flat", max_workers=8),
+         Tier("html", timeout=10)],
+        min_chars=2_000, cache=ResponseCache())
+    texts = fetcher.fetch(pmcids)
+    print(fetcher.stats_frame())
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from . import pubmed
+from .cache import ResponseCache, RevalidationStats
+
+__all__ = ["Tier", "TierStats", "TieredFullText", "DEFAULT_TIERS"]
+
+logger = logging.getLogger(__name__)
+
+# "cache": texts stored by earlier runs (needs ``cache=``; no network);
+# "flat": the ?format=flat HTML view; "xml": JATS <body> from batched EFetch;
+# "html": the regular article page.
+TIER_NAMES = ("cache", "flat", "xml", "html")
+
+
+@dataclass(frozen=True)
+class Tier:
+    """
+    One full-text source and the limits it runs under.
+
+    Parameters
+    ----------
+    name : {"cache", "flat", "xml", "html"}
+    timeout : float, default 20
+        Socket timeout of each request of this tier.
+    max_workers : int, default 4
+        Requests of this tier in flight at once.
+    batch_size : int, default 200
+        PMCIDs per EFetch request; only the ``"xml"`` tier batches.
+    """
+
+    name: str
+    timeout: float = 20.0
+    max_workers: int = 4
+    batch_size: int = 200
+
+    def __post_init__(self) -> None:
+        if self.name not in TIER_NAMES:
+            raise ValueError(f"tier must be one of {TIER_NAMES}, not {self.name!r}")
+
+
+DEFAULT_TIERS = (Tier("cache"), Tier("flat"), Tier("xml"), Tier("html", max_workers=2))
+
+
+@dataclass
+class TierStats:
+    """Counters of one tier, accumulated over the calls of a fetcher."""
+
+    tier: str
+    attempted: int = 0   # articles handed to the tier
+    hits: int = 0        # articles whose text the tier supplied and that passed
+    errors: int = 0      # articles the tier failed on (not merely without text)
+    requests: int = 0    # HTTP requests sent (cache hits excluded)
+    bytes: int = 0       # response bytes received
+    latency: float = 0.0  # summed request latency, seconds
+    seconds: float = 0.0  # wall-clock time spent in the tier
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.attempted if self.attempted else 0.0
+
+
+class _MeteredHTTP:
+    """``get`` forwarding to *http* that books each request on *stats*."""
+
+    def __init__(self, http, stats: TierStats, lock: threading.Lock) -> None:
+        self._http, self._stats, self._lock = http, stats, lock
+
+    def get(self, *args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            resp = self._http.get(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._stats.requests += 1
+                self._stats.latency += time.perf_counter() - t0
+        with self._lock:
+            self._stats.bytes += len(getattr(resp, "content", b"") or b"")
+        return resp
+
+
+class TieredFullText:
+    """
+    Fetch PMC full text tier by tier, short-circuiting per article.
+
+    Parameters
+    ----------
+    tiers : sequence of Tier or tier names, default :data:`DEFAULT_TIERS`
+        Sources in the order they are tried.
+    min_chars : int, default 2_000
+        Default quality rule: a text is accepted once it has this many
+        characters.  An article no tier satisfies keeps its longest text.
+    accept : callable, optional
+        ``accept(text) -> bool`` replacing the *min_chars* rule.
+    cache : ResponseCache, optional
+        Response cache of the network tiers and store of the ``"cache"``
+        tier: accepted texts are written back under the ``"fulltext"``
+        endpoint, so later runs are served without any request.  Expired
+        pages are revalidated with conditional requests.
+    api_key, max_retries, delay
+        EFetch settings of the ``"xml"`` tier.
+
+    Attributes
+    ----------
+    stats : dict[str, TierStats]
+        Per-tier counters, accumulated over every :meth:`fetch`.
+    revalidation : RevalidationStats
+        Savings of the ``304`` answers of the HTML tiers, likewise.
+    """
+
+    def __init__(
+        self,
+        tiers: Sequence[Union[Tier, str]] = DEFAULT_TIERS,
+        *,
+        min_chars: int = 2_000,
+        accept: Optional[Callable[[str], bool]] = None,
+        cache: Optional[ResponseCache] = None,
+        api_key: Optional[str] = None,
+        max_retries: int = 3,
+        delay: float = 0.34,
+    ) -> None:
+        self.tiers = [t if isinstance(t, Tier) else Tier(t) for t in tiers]
+        self.accept = accept or (lambda text: len(text) >= min_chars)
+        self.cache = cache
+        self.api_key = api_key
+        self.max_retries = max_retries
+        self.delay = delay
+        self.stats: Dict[str, TierStats] = {t.name: TierStats(t.name)
+                                            for t in self.tiers}
+        self.revalidation = RevalidationStats()
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------ #
+    def _run_tier(self, tier: Tier, pids: List[str]) -> Dict[str, str]:
+        """Text from *tier* for each of *pids* it could serve."""
+        if tier.name == "cache":
+            bodies = {pid: self.cache.get("fulltext", {"id": pid}) for pid in pids}
+            return {pid: b.decode("utf-8")
+                    for pid, b in bodies.items() if b is not None}
+
+        stats = self.stats[tier.name]
+        http = _MeteredHTTP(pubmed._http(), stats, self._lock)
+        if tier.name == "xml":
+            def one(batch: List[str]) -> Dict[str, str]:
+                texts, errors = pubmed._efetch_body_texts(
+                    batch, http=http, cache=self.cache, timeout=tier.timeout,
+                    max_retries=self.max_retries, delay=self.delay,
+                    api_key=self.api_key)
+                for pid, code in errors.items():
+                    logger.warning(f"{pid}: EFetch failed – {code}")
+                with self._lock:
+                    stats.errors += len(errors)
+                return texts
+
+            jobs = [pids[i:i + tier.batch_size]
+                    for i in range(0, len(pids), tier.batch_size)]
+        else:
+            def one(pid: str) -> Dict[str, str]:
+                if tier.name == "html":
+                    text = pubmed._scrape_pmc_standard_html(
+                        pid, timeout=tier.timeout, cache=self.cache, http=http,
+                        revalidation=self.revalidation)
+                    return {pid: "" if text == "N/A" else text}
+                try:
+                    return {pid: pubmed._flat_html_text(
+                        pid, http=http, cache=self.cache, timeout=tier.timeout,
+                        revalidation=self.revalidation)}
+                except Exception as exc:
+                    logger.warning(f"{pid}: flat view failed – {exc}")
+                    with self._lock:
+                        stats.errors += 1
+                    return {}
+
+            jobs = pids
+
+        out: Dict[str, str] = {}
+        if tier.max_workers > 1 and len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=tier.max_workers) as pool:
+                for part in pool.map(one, jobs):
+                    out.update(part)
+        else:
+            for job in jobs:
+                out.update(one(job))
+        return out
+
+    def fetch(self, pmcids: Union[str, Sequence[str]]) -> pd.DataFrame:
+        """
+        Full text of every PMCID (with or without the "PMC" prefix).
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per unique PMCID, in input order: ``pmcid``, ``text``
+            (``"N/A"`` when no tier found any), ``source`` (tier name, or
+            ``"none"``) and ``accepted`` (whether the quality rule passed).
+        """
+        if isinstance(pmcids, str):
+            pmcids = [pmcids]
+        pids = list(dict.fromkeys(
+            p if str(p).upper().startswith("PMC") else f"PMC{p}" for p in pmcids))
+        best = {pid: ("", "none") for pid in pids}
+        accepted: set = set()
+        pending = pids
+
+        for tier in self.tiers:
+            if not pending:
+                break
+            if tier.name == "cache" and self.cache is None:
+                continue
+            stats = self.stats[tier.name]
+            t0 = time.perf_counter()
+            got = self._run_tier(tier, pending)
+            elapsed = time.perf_counter() - t0
+            stats.seconds += elapsed
+            stats.attempted += len(pending)
+
+            still = []
+            for pid in pending:
+                text = got.get(pid, "")
+                if text and self.accept(text):
+                    best[pid] = (text, tier.name)
+                    accepted.add(pid)
+                    stats.hits += 1
+                    continue
+                if len(text) > len(best[pid][0]):
+                    best[pid] = (text, tier.name)
+                still.append(pid)
+            logger.info(f"Tier {tier.name}: {len(pending) - len(still)}/{len(pending)} "
+                        f"accepted in {elapsed:.1f}s")
+            pending = still
+
+        if self.cache is not None:
+            for pid in accepted:
+                text, source = best[pid]
+                if source != "cache":
+                    self.cache.set("fulltext", {"id": pid}, text.encode("utf-8"))
+
+        df = pd.DataFrame({
+            "pmcid": pids,
+            "text": [best[pid][0] or "N/A" for pid in pids],
+            "source": [best[pid][1] for pid in pids],
+            "accepted": [pid in accepted for pid in pids],
+        }).astype({"pmcid": "string", "text": "string", "source": "string",
+                   "accepted": "boolean"})
+        df.attrs["tier_stats"] = {name: asdict(s) for name, s in self.stats.items()}
+        df.attrs["revalidation"] = asdict(self.revalidation)
+        return df
+
+    def stats_frame(self) -> pd.DataFrame:
+        """
+        :attr:`stats` as a table, one row per tier in order, with derived
+        ``hit_rate``, ``mean_latency`` (seconds per request) and
+        ``requests_per_hit`` / ``bytes_per_hit`` columns.
+        """
+        df = pd.DataFrame([asdict(self.stats[t.name]) for t in self.tiers])
+        hits = df["hits"].where(df["hits"] > 0)
+        df["hit_rate"] = [self.stats[t.name].hit_rate for t in self.tiers]
+        df["mean_latency"] = df["latency"] / df["requests"].where(df["requests"] > 0)
+        df["requests_per_hit"] = df["requests"] / hits
+        df["bytes_per_hit"] = df["bytes"] / hits
+        return df
@@ -0,0 +1,137 @@
+"""searchpubmed.htmlparse – pluggable HTML backend for the PMC page scrapers.
+
+:func:`~searchpubmed.pubmed.get_pmc_html_text`, the flat-HTML step of
+:func:`~searchpubmed.pubmed.get_pmc_full_text` and the standard-page
+scraper only ever need the ``#maincontent`` subtree of a page, minus
+scripts, styles, navigation and comments.  Two backends provide that:
+
+``"bs4"`` (default)
+    BeautifulSoup's pure-Python ``html.parser`` with a ``SoupStrainer``, so
+    only the ``#maincontent`` subtree is turned into a tree (the whole page
+    is parsed when it has no ``#maincontent``).
+``"lxml"``
+    ``lxml.html`` – a C parser, several times faster than BeautifulSoup
+    (``pip install searchpubmed[html]``).
+
+Opt into lxml with ``set_html_backend("lxml")``.  Both extract the same
+text; the HTML of :func:`main_html` may differ in whitespace and attribute
+serialisation.  ``python benchmarks/bench_html_parse.py`` compares their
+per-page cost.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+from ._lazy import lazy_import
+
+bs4 = lazy_import("bs4")
+
+__all__ = ["set_html_backend", "get_html_backend"]
+
+BACKENDS = ("lxml", "bs4")
+_JUNK = ("script", "style", "nav", "footer", "aside")
+
+_backend: Optional[str] = None  # None: the default, bs4
+
+
+def set_html_backend(name: Optional[str]) -> None:
+    """
+    Use backend *name* (``"lxml"`` or ``"bs4"``) for every page parsed from
+    now on; ``None`` restores the default (``"bs4"``).
+    """
+    global _backend
+    if name not in (*BACKENDS, None):
+        raise ValueError(f"backend must be one of {BACKENDS} or None, not {name!r}")
+    if name == "lxml":
+        import lxml.html  # noqa: F401 – fail here, not on the first page
+    _backend = name
+
+
+def get_html_backend() -> str:
+    """Name of the backend in effect."""
+    return _backend or "bs4"
+
+
+def _joined(strings) -> str:
+    """Stripped, non-empty *strings* joined by a space (bs4's ``strip=True``)."""
+    return " ".join(s for s in (t.strip() for t in strings) if s)
+
+
+# --------------------------------------------------------------------------- #
+# lxml                                                                        #
+# --------------------------------------------------------------------------- #
+def _lxml_root(html: str):
+    import lxml.html
+
+    try:
+        return lxml.html.document_fromstring(html)
+    except ValueError:  # str with an XML encoding declaration
+        return lxml.html.document_fromstring(html.encode("utf-8"))
+
+
+def _lxml_clean(el) -> None:
+    for junk in el.xpath(".//script|.//style|.//nav|.//footer|.//aside|.//comment()"):
+        junk.drop_tree()
+
+
+def _lxml_main(html: str):
+    root = _lxml_root(html)
+    main = root.get_element_by_id("maincontent", None)
+    main = root if main is None else main
+    _lxml_clean(main)
+    return main
+
+
+# --------------------------------------------------------------------------- #
+# BeautifulSoup                                                               #
+# --------------------------------------------------------------------------- #
+def _soup_clean(el) -> None:
+    """Drop junk tags and comments, merging the text around them as lxml does."""
+    for tag in el.find_all(list(_JUNK)):
+        tag.decompose()
+    for comment in el.find_all(string=lambda s: isinstance(s, bs4.Comment)):
+        comment.extract()
+    el.smooth()
+
+
+def _soup_main(html: str):
+    soup = bs4.BeautifulSoup(html, "html.parser",
+                             parse_only=bs4.SoupStrainer(id="maincontent"))
+    main = soup.find(id="maincontent")
+    if main is None:  # no #maincontent: fall back to the whole document
+        main = bs4.BeautifulSoup(html, "html.parser")
+    _soup_clean(main)
+    return main
+
+
+# --------------------------------------------------------------------------- #
+# What the scrapers need                                                      #
+# --------------------------------------------------------------------------- #
+def main_html(html: str) -> str:
+    """Markup of ``#maincontent`` (or the whole page) with junk tags removed."""
+    if get_html_backend() == "lxml":
+        import lxml.html
+
+        return lxml.html.tostring(_lxml_main(html), encoding="unicode")
+    return str(_soup_main(html))
+
+
+def main_paragraph_text(html: str) -> str:
+    """Text of every ``<p>`` under ``#maincontent`` (or the page), space-joined."""
+    if get_html_backend() == "lxml":
+        paragraphs = (_joined(p.itertext()) for p in _lxml_main(html).iter("p"))
+    else:
+        paragraphs = (p.get_text(" ", strip=True)
+                      for p in _soup_main(html).find_all("p"))
+    return " ".join(paragraphs).strip()
+
+
+def page_text(html: str) -> str:
+    """Text of the whole page without scripts, styles and navigation."""
+    if get_html_backend() == "lxml":
+        root = _lxml_root(html)
+        _lxml_clean(root)
+        return _joined(root.itertext())
+    soup = bs4.BeautifulSoup(html, "html.parser")
+    _soup_clean(soup)
+    return soup.get_text(" ", strip=True)
@@ -0,0 +1,148 @@
+"""searchpubmed.idindex – offline PMID → PMCID lookups from the PMC bulk
+``PMC-ids.csv.gz`` file.
+
+The bulk file (https://ftp.ncbi.nlm.nih.gov/pub/pmc/PMC-ids.csv.gz) is
+streamed once into a compact ``.npy`` file holding two ``uint32`` rows –
+PMIDs (sorted) and the numeric part of their PMCIDs – which is then
+memory-mapped and queried with vectorised ``numpy.searchsorted``.
+
+Build an index from the command line::
+
+    python -m searchpubmed.idindex PMC-ids.csv.gz pmc-ids.npy
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import io
+import logging
+import os
+from array import array
+from pathlib import Path
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["PmcIdIndex", "build_pmc_id_index"]
+
+logger = logging.getLogger(__name__)
+
+_UINT32_MAX = 2**32 - 1
+
+
+def build_pmc_id_index(
+    source: Union[str, os.PathLike],
+    index_path: Union[str, os.PathLike],
+) -> int:
+    """
+    Stream a ``PMC-ids.csv(.gz)`` file into an on-disk PMID → PMCID index.
+
+    Parameters
+    ----------
+    source : path-like
+        The bulk CSV, gzip-compressed or not.  Only the ``PMCID`` and
+        ``PMID`` columns are read; rows without a PMID are skipped.
+    index_path : path-like
+        Destination ``.npy`` file.  Written to a temporary name first and
+        moved into place, so a crash never leaves a truncated index.
+
+    Returns
+    -------
+    int
+        Number of unique (PMID, PMCID) pairs stored.
+    """
+    source = Path(source)
+    index_path = Path(index_path)
+    opener = gzip.open if source.suffix == ".gz" else open
+
+    pmids, pmcids = array("I"), array("I")
+    with opener(source, "rb") as raw:
+        reader = csv.reader(io.TextIOWrapper(raw, encoding="utf-8", newline=""))
+        header = next(reader)
+        i_pmcid, i_pmid = header.index("PMCID"), header.index("PMID")
+        for row in reader:
+            try:
+                pmid = int(row[i_pmid])
+                pmcid = int(row[i_pmcid].upper().removeprefix("PMC"))
+            except (IndexError, ValueError):
+                continue
+            if 0 < pmid <= _UINT32_MAX and 0 < pmcid <= _UINT32_MAX:
+                pmids.append(pmid)
+                pmcids.append(pmcid)
+
+    # sort by PMID (then PMCID) and drop duplicate pairs in one pass
+    keys = np.unique(
+        (np.frombuffer(pmids, dtype=np.uint32).astype(np.uint64) << np.uint64(32))
+        | np.frombuffer(pmcids, dtype=np.uint32)
+    )
+    table = np.vstack([(keys >> np.uint64(32)).astype(np.uint32),
+                       (keys & np.uint64(_UINT32_MAX)).astype(np.uint32)])
+
+    tmp = index_path.with_name(index_path.name + ".tmp")
+    with open(tmp, "wb") as fh:
+        np.save(fh, table)
+    os.replace(tmp, index_path)
+    logger.info("PMC id index: %d pairs → %s", table.shape[1], index_path)
+    return int(table.shape[1])
+
+
+class PmcIdIndex:
+    """Memory-mapped index written by :func:`build_pmc_id_index`."""
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        self.path = Path(path)
+        table = np.load(self.path, mmap_mode="r")
+        self._pmids = table[0]
+        self._pmcids = table[1]
+
+    def __len__(self) -> int:
+        return int(self._pmids.shape[0])
+
+    def lookup(self, pmids: Sequence[str]) -> Tuple[pd.DataFrame, List[str]]:
+        """
+        Resolve *pmids* against the index.
+
+        Returns
+        -------
+        (hits, missing)
+            ``hits`` – ``pmid`` / ``pmcid`` string frame, one row per pair,
+            in input order.  ``missing`` – input PMIDs absent from the index
+            (including anything that is not a plain integer).
+        """
+        pmids = [str(p) for p in pmids]
+        query = np.array(
+            [int(p) if p.isdigit() and int(p) <= _UINT32_MAX else 0 for p in pmids],
+            dtype=np.uint32,
+        )
+        lo = np.searchsorted(self._pmids, query, side="left")
+        hi = np.searchsorted(self._pmids, query, side="right")
+        n = hi - lo
+
+        # expand every query position to its [lo, hi) run of matches
+        owner = np.repeat(np.arange(len(pmids)), n)
+        starts = np.repeat(np.cumsum(n) - n, n)
+        pos = np.arange(int(n.sum())) - starts + np.repeat(lo, n)
+        hits = pd.DataFrame({
+            "pmid": np.asarray(pmids, dtype=object)[owner],
+            "pmcid": ["PMC" + str(v) for v in self._pmcids[pos].tolist()],
+        }).astype("string")
+        missing = [p for p, k in zip(pmids, n.tolist()) if k == 0]
+        return hits, missing
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m searchpubmed.idindex",
+        description="Build an offline PMID → PMCID index from PMC-ids.csv.gz.",
+    )
+    parser.add_argument("source", help="path to PMC-ids.csv.gz")
+    parser.add_argument("index", help="output .npy index file")
+    args = parser.parse_args(argv)
+    n = build_pmc_id_index(args.source, args.index)
+    print(f"wrote {n:,} PMID/PMCID pairs to {args.index}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
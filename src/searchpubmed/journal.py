@@ -0,0 +1,207 @@
+"""searchpubmed.journal – checkpoint / resume for long bulk fetches.
+
+:func:`run_resumable` splits an ID list into batches, runs one of the
+batch-oriented fetchers (:func:`~searchpubmed.pubmed.get_pubmed_metadata_pmid`,
+:func:`~searchpubmed.pubmed.get_pmc_full_xml`, …) per batch and writes each
+result to its own file under ``<root>/<job_id>/``.  A :class:`JobJournal`
+in the same directory records, per batch, its status and output file.
+Calling again with the same *job_id* skips batches already done and retries
+only failed or missing ones::
+
+    from searchpubmed import get_pmc_full_xml
+    from searchpubmed.journal import run_resumable
+
+    journal = run_resumable(get_pmc_full_xml, pmcids, job_id="oa-2024")
+    df = journal.load()
+
+Batch files and the journal are both written to a temporary name and moved
+into place with ``os.replace``, so a crash never leaves a half-written
+output behind – at worst the batch is fetched again.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+__all__ = ["JobJournal", "run_resumable", "batch_key"]
+
+logger = logging.getLogger(__name__)
+
+_FORMATS = {"parquet": ".parquet", "pickle": ".pkl"}
+
+
+def batch_key(ids: Iterable[str]) -> str:
+    """Stable identifier of one batch: a short hash of its IDs, in order."""
+    return hashlib.sha256(",".join(map(str, ids)).encode()).hexdigest()[:16]
+
+
+def _atomic_write(path: Path, write: Callable[[Path], None]) -> None:
+    """Call ``write(tmp)`` on a hidden sibling of *path*, then rename it over *path*."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+class JobJournal:
+    """
+    Persistent record of the batches of one job.
+
+    The journal lives in ``<root>/<job_id>/_journal.json`` and maps each
+    :func:`batch_key` to ``{"status", "output", "ids", "rows", "error",
+    "updated"}``.  ``status`` is ``"done"`` or ``"failed"``.
+
+    Parameters
+    ----------
+    job_id : str
+        Name of the job; reuse it to resume.
+    root : path-like, default ".searchpubmed-jobs"
+        Directory holding one sub-directory per job.
+    """
+
+    def __init__(self, job_id: str,
+                 root: Union[str, os.PathLike] = ".searchpubmed-jobs") -> None:
+        self.job_id = job_id
+        self.dir = Path(root) / job_id
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.dir / "_journal.json"
+        self.entries: Dict[str, Dict[str, Any]] = (
+            json.loads(self.path.read_text()) if self.path.exists() else {})
+
+    def is_done(self, key: str) -> bool:
+        """True when *key* finished and its output file is still present."""
+        entry = self.entries.get(key)
+        return bool(entry and entry["status"] == "done"
+                    and (self.dir / entry["output"]).exists())
+
+    def record(self, key: str, *, status: str, ids: int,
+               output: Optional[str] = None, rows: Optional[int] = None,
+               error: Optional[str] = None) -> None:
+        """Store the outcome of batch *key* and persist the journal atomically."""
+        self.entries[key] = {"status": status, "output": output, "ids": ids,
+                             "rows": rows, "error": error, "updated": time.time()}
+        payload = json.dumps(self.entries, indent=1)
+        _atomic_write(self.path, lambda tmp: tmp.write_text(payload))
+
+    def outputs(self) -> List[Path]:
+        """Output files of every finished batch, in the order they completed."""
+        return [self.dir / e["output"] for e in self.entries.values()
+                if e["status"] == "done"]
+
+    def failed(self) -> List[str]:
+        """Keys of the batches whose last attempt failed."""
+        return [k for k, e in self.entries.items() if e["status"] == "failed"]
+
+    def load(self) -> pd.DataFrame:
+        """Concatenate the outputs of every finished batch."""
+        frames = [pd.read_parquet(p) if p.suffix == ".parquet" else pd.read_pickle(p)
+                  for p in self.outputs()]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def _failure(frame: pd.DataFrame) -> Optional[str]:
+    """
+    Why the batch behind *frame* must be retried, or ``None`` if it is done.
+
+    Fetchers that report per-ID failures in ``frame.attrs["errors"]`` fail
+    the batch when any ID failed, and only then – an empty or all-``"N/A"``
+    frame with no errors is a genuine "nothing there".  For fetchers without
+    that report, a non-empty frame of nothing but placeholder rows fails.
+    """
+    errors = frame.attrs.get("errors")
+    if errors:
+        codes = sorted(set(map(str, errors.values())))
+        return f"{len(errors)} IDs failed ({', '.join(codes)})"
+    if errors is None and _all_placeholders(frame):
+        return "no data returned"
+    return None
+
+
+def _all_placeholders(frame: pd.DataFrame) -> bool:
+    """True when a fetcher returned rows, all of them ``"N/A"`` stand-ins."""
+    if frame.empty:
+        return False
+    column = next((c for c in ("fullXML", "fullText", "title") if c in frame.columns),
+                  None)
+    return column is not None and bool((frame[column] == "N/A").all())
+
+
+def run_resumable(
+    fetch: Callable[..., pd.DataFrame],
+    ids: Iterable[str],
+    *,
+    job_id: str,
+    root: Union[str, os.PathLike] = ".searchpubmed-jobs",
+    batch_size: int = 200,
+    format: str = "parquet",
+    **kwargs: Any,
+) -> JobJournal:
+    """
+    Run *fetch* batch by batch under the journal of *job_id*.
+
+    Parameters
+    ----------
+    fetch : callable
+        A batch fetcher taking ``(ids, batch_size=…, **kwargs)`` and
+        returning a DataFrame, e.g. ``get_pubmed_metadata_pmid``.
+    ids : iterable of str
+        All IDs of the job; de-duplicated (order kept) and cut into batches
+        of *batch_size*.  Re-run with the same IDs and *batch_size* to resume.
+    job_id, root
+        See :class:`JobJournal`.
+    format : {"parquet", "pickle"}, default "parquet"
+        Per-batch file format (``"parquet"`` needs pyarrow).
+    **kwargs
+        Passed through to *fetch* (``api_key``, ``cache``, …).
+
+    A batch is journalled as ``"failed"`` when *fetch* raises, lists any ID
+    in ``attrs["errors"]``, or – lacking that report – returns only
+    placeholder rows; failed and missing batches are retried on the next
+    call.  Returns the journal.
+    """
+    if format not in _FORMATS:
+        raise ValueError(f"format must be one of {sorted(_FORMATS)}, not {format!r}")
+    journal = JobJournal(job_id, root)
+    unique = list(dict.fromkeys(map(str, ids)))
+    batches = [unique[i:i + batch_size] for i in range(0, len(unique), batch_size)]
+
+    skipped = 0
+    for n, batch in enumerate(batches, start=1):
+        key = batch_key(batch)
+        if journal.is_done(key):
+            skipped += 1
+            continue
+        try:
+            frame = fetch(batch, batch_size=batch_size, **kwargs)
+        except Exception as exc:
+            logger.error(f"Job {job_id}: batch {n}/{len(batches)} failed: {exc}")
+            journal.record(key, status="failed", ids=len(batch), error=repr(exc))
+            continue
+        error = _failure(frame)
+        if error:
+            logger.warning(f"Job {job_id}: batch {n}/{len(batches)}: {error}")
+            journal.record(key, status="failed", ids=len(batch), error=error)
+            continue
+
+        output = f"part-{key}{_FORMATS[format]}"
+        if format == "parquet":
+            _atomic_write(journal.dir / output,
+                          lambda tmp: frame.to_parquet(tmp, index=False))
+        else:
+            _atomic_write(journal.dir / output, frame.to_pickle)
+        journal.record(key, status="done", ids=len(batch), output=output,
+                       rows=len(frame))
+
+    logger.info(f"Job {job_id}: {len(batches)} batches, {skipped} already done, "
+                f"{len(journal.failed())} failed")
+    return journal
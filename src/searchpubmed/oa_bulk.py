@@ -0,0 +1,177 @@
+"""searchpubmed.oa_bulk – offline ingest of PMC Open Access bulk packages.
+
+The PMC OA bulk packages (``oa_comm_xml.*.tar.gz``, ``oa_noncomm_xml.*``,
+…) hold one JATS ``.nxml`` / ``.xml`` file per article.  Ingesting them
+locally avoids millions of EFetch round trips: :func:`iter_oa_tarballs`
+streams the members straight out of the compressed archives – nothing is
+extracted to disk – while worker processes parse them, and yields frames
+with the columns of :func:`~searchpubmed.pubmed.get_pmc_full_xml`::
+
+    from searchpubmed.oa_bulk import ingest_oa_tarballs
+
+    sink = ingest_oa_tarballs(sorted(Path("oa").glob("*.tar.gz")), "out/oa",
+                              keep_xml=False, processes=16)
+
+The archive is read and decompressed by the calling process, so
+throughput grows with *processes* until gunzip becomes the bottleneck;
+``python benchmarks/bench_oa_ingest.py`` measures it on a synthetic
+package.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import re
+import tarfile
+import xml.etree.ElementTree as ET
+from pathlib import PurePosixPath
+from typing import (TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple,
+                    Union)
+
+import pandas as pd
+
+from . import pubmed
+from .corpus import _ordered_map
+
+if TYPE_CHECKING:
+    from .sink import ParquetSink
+
+__all__ = ["iter_oa_tarballs", "ingest_oa_tarballs"]
+
+logger = logging.getLogger(__name__)
+
+_XML_SUFFIXES = (".nxml", ".xml")
+_PMCID_IN_NAME = re.compile(r"PMC\d+")
+
+PathLike = Union[str, os.PathLike]
+
+
+def _iter_members(paths: Iterable[PathLike]) -> Iterator[Tuple[str, bytes]]:
+    """``(member name, bytes)`` of every XML file in *paths*, read as a stream."""
+    for path in paths:
+        with tarfile.open(path, mode="r|*") as tar:
+            for member in tar:
+                if member.isfile() and member.name.endswith(_XML_SUFFIXES):
+                    yield member.name, tar.extractfile(member).read()
+
+
+def _name_pmcid(name: str) -> str:
+    """PMCID taken from a member file name, ``"N/A"`` when it has none."""
+    match = _PMCID_IN_NAME.search(PurePosixPath(name).name)
+    return match.group(0) if match else "N/A"
+
+
+def _member_record(
+    task: Tuple[str, bytes, bool, bool],
+) -> Tuple[str, dict, Optional[str]]:
+    """``(name, get_pmc_full_xml row, error or None)`` of one member (worker side)."""
+    name, data, keep_xml, chunks = task
+    text = data.decode("utf-8", errors="replace")
+    kind = pubmed._classify_pubmed_xml(text)
+    try:
+        if kind != "pmc":
+            raise ValueError(f"not JATS full text ({kind})")
+        root = ET.fromstring(pubmed._strip_default_ns(data))
+        art = root if root.tag == "article" else root.find(".//article")
+        if art is None:
+            raise ValueError("no <article> element")
+        record = pubmed._pmc_xml_record(art, keep_xml=False, chunks=chunks)
+    except (ET.ParseError, ValueError) as exc:
+        return name, {
+            "pmcid": _name_pmcid(name),
+            "fullXML": "N/A",
+            "fullText": "N/A",
+            "isFullText": False,
+            "hasSuppMat": False,
+            "xmlKind": kind,
+            "textChunks": [],
+        }, f"{type(exc).__name__}: {exc}"
+    if record["pmcid"] == "PMCN/A":
+        record["pmcid"] = _name_pmcid(name)
+    if keep_xml:
+        record["fullXML"] = text  # the member as shipped, not re-serialised
+    return name, record, None
+
+
+def iter_oa_tarballs(
+    paths: Iterable[PathLike],
+    *,
+    batch_size: int = 1000,
+    processes: Optional[int] = None,
+    chunksize: int = 16,
+    keep_xml: bool = True,
+    chunks: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream PMC OA bulk ``.tar.gz`` packages as ``get_pmc_full_xml`` frames.
+
+    Parameters
+    ----------
+    paths : iterable of path-like
+        Local ``.tar`` / ``.tar.gz`` packages, read in the order given.
+    batch_size : int, default 1000
+        Rows per yielded frame.
+    processes : int | None, default None
+        Worker processes for parsing; ``None`` uses every core, ``0`` or
+        ``1`` parses in the calling process.
+    chunksize : int, default 16
+        Members handed to a worker per task.
+    keep_xml, chunks : bool
+        As for :func:`~searchpubmed.pubmed.get_pmc_full_xml`.  ``fullXML``
+        is the member exactly as stored in the archive.
+
+    Yields
+    ------
+    pandas.DataFrame
+        The columns (and dtypes) of ``get_pmc_full_xml``, one row per XML
+        member, in archive order.  Members that are not JATS full text or
+        do not parse get an ``"N/A"`` row – its ``xmlKind`` as classified by
+        ``_classify_pubmed_xml``, its ``pmcid`` taken from the file name when
+        possible – and an entry in ``frame.attrs["errors"]``.
+    """
+    dtypes = dict(pubmed._PMC_XML_DTYPES)
+    if not keep_xml:
+        del dtypes["fullXML"]
+    columns = [*dtypes] + (["textChunks"] if chunks else [])
+
+    tasks = ((name, data, keep_xml, chunks) for name, data in _iter_members(paths))
+    results = _ordered_map(_member_record, tasks, processes=processes,
+                           chunksize=chunksize)
+    records: List[dict] = []
+    errors: Dict[str, str] = {}
+
+    def _frame() -> pd.DataFrame:
+        frame = pd.DataFrame(records).reindex(columns=columns).astype(dtypes)
+        return pubmed._batch_report(frame, dict(errors), 0)
+
+    for name, record, error in results:
+        records.append(record)
+        if error is not None:
+            logger.warning(f"{name}: {error}")
+            errors[record["pmcid"] if record["pmcid"] != "N/A" else name] = error
+        if len(records) >= batch_size:
+            yield _frame()
+            records.clear()
+            errors.clear()
+    if records:
+        yield _frame()
+
+
+def ingest_oa_tarballs(
+    paths: Iterable[PathLike],
+    root: PathLike,
+    *,
+    partition_by: Optional[str] = "batch",
+    **kwargs: Any,
+) -> ParquetSink:
+    """
+    Write PMC OA bulk packages into a Parquet dataset with
+    :class:`~searchpubmed.sink.ParquetSink`; *kwargs* go to
+    :func:`iter_oa_tarballs`.  Returns the sink.
+    """
+    from .sink import ParquetSink
+
+    sink = ParquetSink(root, partition_by=partition_by)
+    for frame in iter_oa_tarballs(paths, **kwargs):
+        sink.write(frame)
+    return sink
@@ -3,34 +3,358 @@ from __future__ import annotations
 ##############################################################################
 #  Imports & logger                                                          #
 ##############################################################################
-import logging, sys
-
-logging.basicConfig(
-    level=logging.INFO,  # allow INFO and above
-    stream=sys.stdout,  # send to notebook output
-    format="%(asctime)s %(levelname)s %(name)s - %(message)s",
-    force=True)  # override Databricks defaults
-
-import importlib, searchpubmed.pubmed as pubmed
-
-importlib.reload(pubmed)
-
+import json
+import logging
+import os
 import re
+import threading
 import time
 import xml.etree.ElementTree as ET
+from calendar import monthrange
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import ContextVar
+from dataclasses import asdict
+from datetime import date, timedelta
+from functools import lru_cache
 from math import ceil
-from typing import List, Dict, Tuple, Union, Pattern
+from typing import (TYPE_CHECKING, List, Dict, Iterable, Iterator, Optional, Tuple,
+                    Union, Pattern)
+from xml.parsers import expat
 
-import dateparser
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup
-from requests.exceptions import HTTPError, RequestException
+from . import htmlparse
+from ._lazy import lazy_import
+from .cache import ResponseCache, RevalidationStats
+from .ratelimit import RateLimiter, get_rate_limiter
+
+if TYPE_CHECKING:
+    from .idindex import PmcIdIndex
+
+# Heavy dependencies are imported on first use (see searchpubmed._lazy).
+pd = lazy_import("pandas")
+requests = lazy_import("requests")
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
+_ESEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+
+
+# Pooled session installed by ``searchpubmed.aio`` for the calls it runs in
+# worker threads; ``None`` means "use a fresh Session / module-level requests".
+_POOLED_SESSION: ContextVar[requests.Session | None] = ContextVar(
+    "searchpubmed_pooled_session", default=None)
+
+
+def _pooled_session(size: int) -> requests.Session:
+    """A ``requests.Session`` whose connection pool holds *size* sockets."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _http():
+    """The pooled session if one is installed, else the ``requests`` module."""
+    return _POOLED_SESSION.get() or requests
+
+
+def _limited(limiter: RateLimiter, send, *args, **kwargs):
+    """Draw a token from *limiter*, then issue ``send(*args, **kwargs)``."""
+    limiter.acquire()
+    return send(*args, **kwargs)
+
+
+class _CachedResponse:
+    """
+    Minimal ``requests.Response`` stand-in for a body served from cache;
+    *revalidated* when the server just confirmed it with a ``304``.
+    """
+
+    status_code = 200
+    ok = True
+
+    def __init__(self, content: bytes, *, validators: dict | None = None,
+                 revalidated: bool = False) -> None:
+        self.content = content
+        self.validators = validators or {}
+        self.revalidated = revalidated
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self):
+        return json.loads(self.content)
+
+
+_VALIDATORS = (("ETag", "If-None-Match"), ("Last-Modified", "If-Modified-Since"))
+_REVALIDATION_LOCK = threading.Lock()
+
+
+def _validators(resp) -> dict[str, str]:
+    """``ETag`` / ``Last-Modified`` of *resp*, cached or live."""
+    if isinstance(resp, _CachedResponse):
+        return resp.validators
+    headers = getattr(resp, "headers", None) or {}
+    return {name: headers[name] for name, _ in _VALIDATORS if headers.get(name)}
+
+
+def _revalidates(cache) -> bool:
+    """Whether *cache* keeps validators (see :meth:`ResponseCache.get_stale`)."""
+    return cache is not None and hasattr(cache, "get_stale")
+
+
+def _count(stats: RevalidationStats | None, **amounts) -> None:
+    """Add *amounts* to the fields of *stats*, if any (thread-safe)."""
+    if stats is None:
+        return
+    with _REVALIDATION_LOCK:
+        for name, amount in amounts.items():
+            setattr(stats, name, getattr(stats, name) + amount)
+
+
+def _cached(cache: ResponseCache | None, endpoint: str, params, fetch, *,
+            conditional: bool = False,
+            revalidation: RevalidationStats | None = None):
+    """
+    Serve *endpoint* + *params* from *cache* when possible; otherwise call
+    ``fetch()`` and store the body of any HTTP 200 response it returns.
+
+    With *conditional*, ``fetch(headers)`` is called with the conditional
+    headers to add, and – when *cache* keeps validators – a response's
+    ``ETag`` / ``Last-Modified`` are stored with its body.  An expired entry
+    that kept them is revalidated: a ``304`` renews it and is served from
+    it.  *revalidation*, if given, counts what that saved.
+    """
+    if cache is not None:
+        body = cache.get(endpoint, params)
+        if body is not None:
+            return _CachedResponse(body)
+    if not conditional:
+        resp = fetch()
+    else:
+        stale = cache.get_stale(endpoint, params) if _revalidates(cache) else None
+        headers = {header: stale[1][name] for name, header in _VALIDATORS
+                   if stale and name in stale[1]}
+        resp = fetch(headers)
+        if headers:
+            _count(revalidation, requests=1)
+        if headers and getattr(resp, "status_code", None) == 304:
+            cache.touch(endpoint, params)
+            _count(revalidation, not_modified=1, bytes_saved=len(stale[0]))
+            return _CachedResponse(stale[0], validators=stale[1], revalidated=True)
+    if cache is not None and getattr(resp, "status_code", None) == 200:
+        validators = _validators(resp) if conditional else None
+        if validators and _revalidates(cache):
+            cache.set(endpoint, params, resp.content, validators=validators)
+        else:
+            cache.set(endpoint, params, resp.content)
+    return resp
+
+
+def _parse_page(resp, parser: str, *, cache: ResponseCache | None, params,
+                revalidation: RevalidationStats | None = None):
+    """
+    ``htmlparse.<parser>(resp.text)``, memoised in *cache* under the page's
+    validators, so a page confirmed by a ``304`` is not parsed again either.
+    """
+    parse = getattr(htmlparse, parser)
+    validators = _validators(resp) if _revalidates(cache) else {}
+    if not validators:
+        return parse(resp.text)
+    memo_key = {**params, **validators,
+                "parser": f"{parser}/{htmlparse.get_html_backend()}"}
+    if getattr(resp, "revalidated", False):
+        body = cache.get("pmc-html-parsed", memo_key)
+        if body is not None:
+            memo = json.loads(body)
+            _count(revalidation, parse_seconds_saved=memo["seconds"])
+            return memo["text"]
+    t0 = time.perf_counter()
+    text = parse(resp.text)
+    memo = {"text": text, "seconds": time.perf_counter() - t0}
+    cache.set("pmc-html-parsed", memo_key, json.dumps(memo).encode("utf-8"))
+    return text
+
+
+def _log_revalidation(what: str, stats: RevalidationStats) -> None:
+    if stats.requests:
+        logger.info(f"{what}: {stats.not_modified}/{stats.requests} revalidated "
+                    f"(304), {stats.bytes_saved} bytes and "
+                    f"{stats.parse_seconds_saved:.2f}s of parsing saved")
+
+
+class _BatchFailed(Exception):
+    """A batch request or parse that failed for good."""
+
+    def __init__(self, code: str, bisectable: bool, *,
+                 partial: list | None = None, done: set | None = None) -> None:
+        super().__init__(code)
+        self.code = code              # per-ID error code, e.g. "http-500"
+        self.bisectable = bisectable  # could a smaller batch succeed?
+        self.partial = partial or []  # results parsed before the failure …
+        self.done = done or set()     # … and the IDs they cover
+
+
+_UNSPLITTABLE_STATUS = {429, 502, 503, 504}
+# Extra requests one batch may spend on bisection before its remaining IDs
+# are given up: a single bad ID in 200 costs about 2·log2(200) ≈ 16.
+_MAX_RECOVERY_REQUESTS = 64
+
+
+def _batch_failure(exc: Exception, *, partial: list | None = None,
+                   done: set | None = None) -> _BatchFailed:
+    """
+    Classify *exc*.  Parse errors and other HTTP errors may be caused by one
+    bad record, so splitting the batch can help; throttling, gateway
+    failures (502/503/504 – the server is down, not the batch) and
+    connection failures affect every sub-batch alike.
+    """
+    if isinstance(exc, ET.ParseError):
+        code, bisectable = "parse-error", True
+    else:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+        if status in _UNSPLITTABLE_STATUS:
+            code, bisectable = f"http-{status}", False
+        elif status:
+            code, bisectable = f"http-{status}", True
+        else:
+            code, bisectable = "network-error", False
+    return _BatchFailed(code, bisectable, partial=partial, done=done)
+
+
+def _send_with_retries(send, *, max_retries: int, delay: float, label: str):
+    """
+    ``send()`` until it returns a 2xx response, retrying HTTP 429 / 5xx with
+    exponential back-off; raise :class:`_BatchFailed` once retries run out.
+    """
+    for attempt in range(1, max_retries + 1):
+        try:
+            resp = send()
+            if resp.status_code == 429:
+                raise requests.HTTPError(response=resp)
+            resp.raise_for_status()
+            return resp
+        except requests.RequestException as exc:
+            status = getattr(exc.response, "status_code", None)
+            if status and (status == 429 or
+                           500 <= status < 600) and attempt < max_retries:
+                wait = delay * (2**(attempt - 1))
+                logger.warning(f"{label}: HTTP {status}; "
+                               f"retry {attempt}/{max_retries} in {wait:.1f}s")
+                time.sleep(wait)
+                continue
+            logger.error(f"{label} failed: "
+                         + (f"HTTP {status}" if status else str(exc)))
+            raise _batch_failure(exc) from exc
+    raise _BatchFailed("network-error", False)  # max_retries < 1
+
+
+def _fetch_bisecting(ids: list[str], attempt, *,
+                     max_recovery: int = _MAX_RECOVERY_REQUESTS,
+                     ) -> tuple[list, dict[str, str], int]:
+    """
+    Run ``attempt(ids, first=True)``; if it fails in a way a smaller batch
+    might not, split the IDs in half and try each half once
+    (``first=False``), recursing down to single IDs.
+
+    Results an attempt parsed before failing (``_BatchFailed.partial``)
+    are kept and only the IDs they do not cover are retried.
+
+    Returns ``(results, errors, recovery_requests)``: the concatenated
+    results of every successful attempt, an error code for each ID that
+    failed on its own (or in a sub-batch that cannot be split usefully, or
+    once *max_recovery* extra requests are spent), and the number of extra
+    requests spent on the split.
+    """
+    errors: dict[str, str] = {}
+    recovery = 0
+    planned = 0  # sub-batch requests committed to, sent or not
+
+    def run(part: list[str], first: bool) -> list:
+        nonlocal recovery, planned
+        recovery += not first
+        try:
+            return attempt(part, first)
+        except _BatchFailed as exc:
+            part = [i for i in part if i not in exc.done]
+            if not part:
+                return exc.partial
+            if len(part) == 1 or not exc.bisectable or planned + 2 > max_recovery:
+                errors.update(dict.fromkeys(part, exc.code))
+                return exc.partial
+            planned += 2
+            mid = len(part) // 2
+            return exc.partial + run(part[:mid], False) + run(part[mid:], False)
+
+    results = run(list(ids), True)
+    if recovery:
+        logger.info(f"Recovered batch of {len(ids)} IDs with {recovery} extra "
+                    f"requests; {len(errors)} IDs failed")
+    return results, errors, recovery
+
+
+def _batch_report(frame: pd.DataFrame, errors: dict[str, str],
+                  recovery: int) -> pd.DataFrame:
+    """Attach per-ID error codes and the recovery request count to *frame*."""
+    frame.attrs["errors"] = errors
+    frame.attrs["recovery_requests"] = recovery
+    return frame
+
+
+def _merge_reports(frames: list[pd.DataFrame], out: pd.DataFrame) -> pd.DataFrame:
+    """Combine the ``attrs`` reports of per-batch *frames* onto *out*."""
+    errors: dict[str, str] = {}
+    for f in frames:
+        errors.update(f.attrs.get("errors", {}))
+    return _batch_report(out, errors, sum(f.attrs.get("recovery_requests", 0)
+                                          for f in frames))
+
+
+def _esearch(
+    params: dict,
+    *,
+    timeout: int,
+    max_retries: int,
+    delay: float,
+    cache: ResponseCache | None = None,
+) -> ET.Element:
+    """
+    POST *params* to ESearch, retrying on HTTP 429 / 5xx with exponential
+    back-off, and return the parsed ``<eSearchResult>`` root.
+
+    Raises the last ``HTTPError`` / ``RequestException`` / ``ET.ParseError``
+    once the retries are exhausted, so callers decide how to degrade.
+    """
+    limiter = get_rate_limiter(params.get("api_key"))
+    for attempt in range(1, max_retries + 1):
+        try:
+            resp = _cached(
+                cache, "esearch", params,
+                lambda: _limited(limiter, _http().post, _ESEARCH_URL,
+                                 data=params, timeout=timeout))
+            resp.raise_for_status()
+            break  # success
+        except requests.HTTPError as e:
+            status = getattr(e.response, "status_code", None)
+            if status and (status == 429
+                           or 500 <= status < 600) and attempt < max_retries:
+                wait = delay * (2**(attempt - 1))
+                logger.warning(f"ESearch HTTP {status}; retry {attempt}/"
+                               f"{max_retries} in {wait:.1f}s")
+                time.sleep(wait)
+                continue
+            raise
+
+    xml_payload = getattr(resp, "content", None) or resp.text
+    return ET.fromstring(xml_payload)
+
+
 def get_pmid_from_pubmed(
     query: str,
     *,
@@ -39,6 +363,12 @@ def get_pmid_from_pubmed(
     timeout: int = 20,
     max_retries: int = 5,
     delay: float = 0.34,
+    paginate: bool = False,
+    page_size: int = 500,
+    date_slicing: bool = False,
+    slice_threshold: int = 9_999,
+    max_workers: int = 3,
+    cache: ResponseCache | None = None,
 ) -> list[str]:
     """
     ------------------------------------------------------------------------
@@ -51,6 +381,7 @@ def get_pmid_from_pubmed(
         Any valid PubMed search term (Boolean logic, field tags, etc.).
     retmax : int, default 2 000
         Maximum number of PMIDs to retrieve (ESearch hard-cap = 100 000).
+        Ignored when *paginate* is ``True``.
     api_key : str | None, optional
         NCBI API key – raises the personal rate limit to ~10 req s⁻¹.
     timeout : int, default 20 s
@@ -59,20 +390,75 @@ def get_pmid_from_pubmed(
         How many times to retry on HTTP 429 or 5xx errors.
     delay : float, default 0.34 s
         Base pause between successive retries (doubles each attempt).
+    paginate : bool, default ``False``
+        Walk the *whole* result set through the history server (see
+        :func:`iter_pmid_pages`) instead of a single ``retmax``-capped call.
+    page_size : int, default 500
+        PMIDs per ESearch page when *paginate* is ``True``.
+    date_slicing : bool, default ``False``
+        Ask for the hit count first (``rettype=count``); if it exceeds
+        *slice_threshold*, split the ``[dp]`` range into year / month / day
+        windows until each fits, fetch the windows concurrently and merge
+        them.  Overrides *retmax* and *paginate*.
+    slice_threshold : int, default 9 999
+        Largest window fetched in one call (PubMed will not return more than
+        10 000 IDs per query).
+    max_workers : int, default 3
+        Threads issuing window requests; all share one rate limit
+        (3 req s⁻¹, or 10 req s⁻¹ with *api_key*).
+    cache : ResponseCache, optional
+        Persistent response cache (see :mod:`searchpubmed.cache`).  Not used
+        for history-server pages, whose ``WebEnv`` is session-bound.
 
     Returns
     -------
     list[str]
         Unique PMIDs (as strings).  Empty list if the query matches none or
-        if all retries fail.
+        if all retries fail – with *date_slicing*, also when any one window
+        still fails, so the result is never silently incomplete.
 
     Notes
     -----
     *   The function is deliberately lightweight – no pandas dependency.
     *   It logs its progress and failures through the *logging* module; hook
         this into your existing logger configuration if needed.
+    *   With ``paginate=True`` a failure part-way through keeps the PMIDs
+        collected so far; use :func:`iter_pmid_pages` directly to resume.
     """
-    base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+    if date_slicing:
+        try:
+            return _get_pmids_date_sliced(
+                query,
+                threshold=slice_threshold,
+                max_workers=max_workers,
+                api_key=api_key,
+                timeout=timeout,
+                max_retries=max_retries,
+                delay=delay,
+                cache=cache,
+            )
+        except (requests.RequestException, ET.ParseError) as e:
+            logger.error(f"ESearch date slicing failed: {e}")
+            return []
+
+    if paginate:
+        collected: set[str] = set()
+        out: list[str] = []
+        try:
+            for page in iter_pmid_pages(
+                query,
+                page_size=page_size,
+                api_key=api_key,
+                timeout=timeout,
+                max_retries=max_retries,
+                delay=delay,
+            ):
+                out.extend(p for p in page
+                           if not (p in collected or collected.add(p)))
+        except (requests.RequestException, ET.ParseError) as e:
+            logger.error(f"ESearch paging stopped after {len(out)} PMIDs: {e}")
+        return out
+
     params = {
         "db": "pubmed",
         "term": query,
@@ -82,40 +468,336 @@ def get_pmid_from_pubmed(
     if api_key:
         params["api_key"] = api_key
 
-    for attempt in range(1, max_retries + 1):
-        try:
-            resp = requests.post(base_url, data=params, timeout=timeout)
-            resp.raise_for_status()
-            break  # success
-        except HTTPError as e:
-            status = getattr(e.response, "status_code", None)
-            if status and (status == 429
-                           or 500 <= status < 600) and attempt < max_retries:
-                wait = delay * (2**(attempt - 1))
-                logger.warning(
-                    f"ESearch HTTP {status}; retry {attempt}/{max_retries} in {wait:.1f}s"
-                )
-                time.sleep(wait)
-                continue
-            logger.error(f"ESearch failed (HTTP {status}): {e}")
-            return []
-        except RequestException as e:
-            logger.error(f"ESearch network error: {e}")
-            return []
-
     try:
-        xml_payload = getattr(resp, "content", None) or resp.text
-        root = ET.fromstring(xml_payload)
-        pmids = [
-            id_el.text for id_el in root.findall(".//IdList/Id") if id_el.text
-        ]
-        # Deduplicate while preserving order
-        seen: set[str] = set()
-        return [p for p in pmids if not (p in seen or seen.add(p))]
+        root = _esearch(params,
+                        timeout=timeout,
+                        max_retries=max_retries,
+                        delay=delay,
+                        cache=cache)
+    except requests.HTTPError as e:
+        status = getattr(e.response, "status_code", None)
+        logger.error(f"ESearch failed (HTTP {status}): {e}")
+        return []
+    except requests.RequestException as e:
+        logger.error(f"ESearch network error: {e}")
+        return []
     except ET.ParseError as e:
         logger.error(f"ESearch XML parse error: {e}")
         return []
 
+    pmids = [id_el.text for id_el in root.findall(".//IdList/Id") if id_el.text]
+    # Deduplicate while preserving order
+    seen: set[str] = set()
+    return [p for p in pmids if not (p in seen or seen.add(p))]
+
+
+def iter_pmid_pages(
+    query: str,
+    *,
+    page_size: int = 500,
+    retstart: int = 0,
+    api_key: str | None = None,
+    timeout: int = 20,
+    max_retries: int = 5,
+    delay: float = 0.34,
+) -> Iterator[list[str]]:
+    """
+    ------------------------------------------------------------------------
+    Stream the PMIDs of a search page by page via the Entrez history server.
+    ------------------------------------------------------------------------
+
+    The first ESearch call is issued with ``usehistory=y``; every following
+    page re-addresses the stored result set (``WebEnv`` + ``query_key``) at
+    the next ``retstart`` offset, so only one page is ever held in memory.
+
+    Parameters
+    ----------
+    query : str
+        Any valid PubMed search term.
+    page_size : int, default 500
+        PMIDs requested per page (``retmax`` of each call).
+    retstart : int, default 0
+        Offset of the first PMID to return.  To resume after a failure,
+        pass the number of PMIDs already consumed.
+    api_key, timeout, max_retries, delay
+        As for :func:`get_pmid_from_pubmed`.
+
+    Yields
+    ------
+    list[str]
+        One page of PMIDs, in PubMed's result order.
+
+    Raises
+    ------
+    requests.RequestException, xml.etree.ElementTree.ParseError
+        When a page cannot be fetched after *max_retries* attempts.  Pages
+        already yielded stay valid; restart with the matching *retstart*.
+    """
+    params: dict = {
+        "db": "pubmed",
+        "term": query,
+        "usehistory": "y",
+        "retstart": retstart,
+        "retmax": page_size,
+        "retmode": "xml",
+    }
+    if api_key:
+        params["api_key"] = api_key
+
+    root = _esearch(params, timeout=timeout, max_retries=max_retries, delay=delay)
+    count = int(root.findtext("Count") or 0)
+    webenv = root.findtext("WebEnv")
+    query_key = root.findtext("QueryKey")
+    logger.info("ESearch history: %d hits, starting at %d", count, retstart)
+
+    while True:
+        page = [el.text for el in root.findall(".//IdList/Id") if el.text]
+        root = None  # drop the parsed page before handing it over
+        if not page:
+            return
+        yield page
+
+        retstart += len(page)
+        if retstart >= count:
+            return
+
+        if webenv and query_key:
+            # address the stored result set instead of re-running the query
+            params.update(term=f"#{query_key}", WebEnv=webenv)
+        params["retstart"] = retstart
+        root = _esearch(params,
+                        timeout=timeout,
+                        max_retries=max_retries,
+                        delay=delay)
+
+
+# normalised query → (monotonic timestamp, hit count)
+_COUNT_CACHE: dict[str, tuple[float, int]] = {}
+_COUNT_CACHE_LOCK = threading.Lock()
+
+
+def count_pubmed(
+    query: str,
+    *,
+    api_key: str | None = None,
+    timeout: int = 20,
+    max_retries: int = 5,
+    delay: float = 0.34,
+    ttl: float = 3_600,
+    cache: ResponseCache | None = None,
+) -> int | None:
+    """
+    ------------------------------------------------------------------------
+    Return the number of PubMed records matching *query* – no IDs fetched.
+    ------------------------------------------------------------------------
+
+    Parameters
+    ----------
+    query : str
+        Any valid PubMed search term, e.g. ``build_query(STRATEGY2_OPTS)``.
+    api_key, timeout, max_retries, delay
+        As for :func:`get_pmid_from_pubmed`.
+    ttl : float, default 3 600 s
+        How long a count stays in the in-process cache.  ``0`` forces a
+        fresh request (and refreshes the cached value).
+    cache : ResponseCache, optional
+        Persistent response cache consulted after the in-process one.
+
+    Returns
+    -------
+    int | None
+        Hit count, or ``None`` if the request failed after all retries.
+
+    Notes
+    -----
+    *   Uses ``rettype=count`` so the response carries only ``<Count>``.
+    *   The cache key is the query with its whitespace collapsed, so the
+        same expression built on different lines shares one entry.
+        Failures are never cached.
+    """
+    key = " ".join(query.split())
+    now = time.monotonic()
+    if ttl > 0:
+        with _COUNT_CACHE_LOCK:
+            hit = _COUNT_CACHE.get(key)
+        if hit is not None and now - hit[0] < ttl:
+            return hit[1]
+
+    params = {"db": "pubmed", "term": key, "rettype": "count", "retmode": "xml"}
+    if api_key:
+        params["api_key"] = api_key
+    try:
+        root = _esearch(params,
+                        timeout=timeout,
+                        max_retries=max_retries,
+                        delay=delay,
+                        cache=cache if ttl > 0 else None)
+        count = int(root.findtext("Count") or 0)
+    except (requests.RequestException, ET.ParseError, ValueError) as e:
+        logger.error(f"ESearch count failed: {e}")
+        return None
+
+    with _COUNT_CACHE_LOCK:
+        _COUNT_CACHE[key] = (now, count)
+    return count
+
+
+# ``("2010"[dp] : "3000"[dp])`` as emitted by ``build_query``; month / day
+# precision ("2010/06/01") is accepted as well.
+_DP_RANGE_RE = re.compile(
+    r'\(\s*"(\d{4}(?:/\d{1,2}){0,2})"\[dp\]\s*:\s*'
+    r'"(\d{4}(?:/\d{1,2}){0,2})"\[dp\]\s*\)',
+    re.IGNORECASE,
+)
+
+
+def _parse_dp(value: str, *, end: bool) -> date:
+    """Expand a ``YYYY[/MM[/DD]]`` bound to the first / last day it covers."""
+    parts = [int(x) for x in value.split("/")]
+    year = parts[0]
+    if len(parts) == 1:
+        return date(year, 12, 31) if end else date(year, 1, 1)
+    month = parts[1]
+    if len(parts) == 2:
+        return date(year, month, monthrange(year, month)[1] if end else 1)
+    return date(year, month, parts[2])
+
+
+def _split_window(start: date, end: date) -> list[tuple[date, date]] | None:
+    """
+    Bisect a date window on the coarsest boundary available: years first,
+    then months, then days.  ``None`` once the window is a single day.
+    """
+    if start.year != end.year:
+        mid = (start.year + end.year) // 2
+        return [(start, date(mid, 12, 31)), (date(mid + 1, 1, 1), end)]
+    if start.month != end.month:
+        mid = (start.month + end.month) // 2
+        last = monthrange(start.year, mid)[1]
+        return [(start, date(start.year, mid, last)),
+                (date(start.year, mid + 1, 1), end)]
+    if start != end:
+        mid = start + (end - start) // 2
+        return [(start, mid), (mid + timedelta(days=1), end)]
+    return None
+
+
+def _get_pmids_date_sliced(
+    query: str,
+    *,
+    threshold: int,
+    max_workers: int,
+    api_key: str | None,
+    timeout: int,
+    max_retries: int,
+    delay: float,
+    cache: ResponseCache | None = None,
+) -> list[str]:
+    """
+    Backend of ``get_pmid_from_pubmed(date_slicing=True)``.
+
+    Counts the query, and if it is too large, bisects its ``[dp]`` window
+    until every slice holds at most *threshold* hits.  Counting and fetching
+    run concurrently in a thread pool behind the shared rate limiter; the
+    slices are merged in chronological order and de-duplicated.  A window
+    that keeps failing is retried *max_retries* times with exponential
+    back-off, then its error is raised rather than its PMIDs dropped.
+    """
+    base = {"db": "pubmed", "retmode": "xml"}
+    if api_key:
+        base["api_key"] = api_key
+
+    def _call(params: dict) -> ET.Element:
+        return _esearch({**base, **params},
+                        timeout=timeout,
+                        max_retries=max_retries,
+                        delay=delay,
+                        cache=cache)
+
+    def _ids(root: ET.Element) -> list[str]:
+        return [el.text for el in root.findall(".//IdList/Id") if el.text]
+
+    total = int(_call({"term": query, "rettype": "count"}).findtext("Count") or 0)
+    if total <= threshold:
+        return list(dict.fromkeys(_ids(_call({"term": query, "retmax": threshold}))))
+
+    match = _DP_RANGE_RE.search(query)
+    if match:
+        lo, hi = _parse_dp(match[1], end=False), _parse_dp(match[2], end=True)
+    else:
+        lo, hi = date(1800, 1, 1), date.max
+    # open-ended ranges ("3000"[dp]) stop at the end of next year
+    hi = min(hi, date(date.today().year + 1, 12, 31))
+
+    def _term(win: tuple[date, date]) -> str:
+        dp = f'("{win[0]:%Y/%m/%d}"[dp] : "{win[1]:%Y/%m/%d}"[dp])'
+        if match:
+            return _DP_RANGE_RE.sub(lambda _m: dp, query, count=1)
+        return f"({query}) AND {dp}"
+
+    def _count(win: tuple[date, date],
+               pause: float = 0.0) -> tuple[str, tuple, object]:
+        time.sleep(pause)
+        try:
+            root = _call({"term": _term(win), "rettype": "count"})
+            return "count", win, int(root.findtext("Count") or 0)
+        except (requests.RequestException, ET.ParseError) as e:
+            return "error", win, (_count, e)
+
+    def _fetch(win: tuple[date, date],
+               pause: float = 0.0) -> tuple[str, tuple, object]:
+        time.sleep(pause)
+        try:
+            return "ids", win, _ids(_call({"term": _term(win), "retmax": threshold}))
+        except (requests.RequestException, ET.ParseError) as e:
+            return "error", win, (_fetch, e)
+
+    logger.info("ESearch: %d hits > %d; slicing %s – %s", total, threshold, lo, hi)
+    slices: dict[tuple[date, date], list[str]] = {}
+    attempts: dict[tuple, int] = {}
+    failure: Exception | None = None
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = {
+            pool.submit(_count, win)
+            for win in (_split_window(lo, hi) or [(lo, hi)])
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                kind, win, value = fut.result()
+                if failure is not None:
+                    continue
+                if kind == "error":
+                    step, exc = value
+                    attempt = attempts[step, win] = attempts.get((step, win), 0) + 1
+                    if attempt < max_retries:
+                        pause = delay * (2**(attempt - 1))
+                        logger.warning("ESearch slice %s – %s failed (%s); retry "
+                                       "%d/%d in %.1fs", *win, exc, attempt,
+                                       max_retries, pause)
+                        pending.add(pool.submit(step, win, pause))
+                    else:
+                        # a missing window would silently drop its PMIDs
+                        logger.error("ESearch slice %s – %s failed: %s", *win, exc)
+                        failure = exc
+                        pending = {f for f in pending if not f.cancel()}
+                elif kind == "ids":
+                    slices[win] = value
+                elif value:
+                    halves = _split_window(*win) if value > threshold else None
+                    if halves:
+                        pending |= {pool.submit(_count, h) for h in halves}
+                        continue
+                    if value > threshold:
+                        logger.warning("ESearch slice %s has %d hits; keeping "
+                                       "the first %d", win[0], value, threshold)
+                    pending.add(pool.submit(_fetch, win))
+
+    if failure is not None:
+        raise failure
+    logger.info("ESearch: merged %d date slices", len(slices))
+    return list(dict.fromkeys(pmid for win in sorted(slices) for pmid in slices[win]))
+
 
 ##############################################################################
 #  Utility: PMID → PMCID mapping                                             #
@@ -128,6 +810,10 @@ def map_pmids_to_pmcids(
     timeout: int = 20,
     max_retries: int = 5,
     delay: float = 0.34,
+    backend: str = "elink",
+    max_workers: int = 3,
+    index: str | os.PathLike | PmcIdIndex | None = None,
+    cache: ResponseCache | None = None,
 ) -> pd.DataFrame:
     """
     ------------------------------------------------------------------------
@@ -149,6 +835,19 @@ def map_pmids_to_pmcids(
         ``pmcid = <NA>`` for the affected PMIDs.
     delay : float, default 0.34 s
         Base pause between retries (exponential back-off).
+    backend : {"elink", "idconv"}, default "elink"
+        ``"idconv"`` uses the PMC ID Converter API instead of ELink: at most
+        200 PMIDs per request, batches sent concurrently, and an extra
+        ``doi`` column in the result.
+    max_workers : int, default 3
+        Concurrent requests for the ``"idconv"`` backend (all share one rate
+        limit).  Ignored by ``"elink"``.
+    index : path-like | PmcIdIndex, optional
+        Offline index built by :func:`searchpubmed.idindex.build_pmc_id_index`
+        from ``PMC-ids.csv.gz``.  PMIDs found there are answered locally;
+        only the rest go to *backend*.
+    cache : ResponseCache, optional
+        Persistent response cache (see :mod:`searchpubmed.cache`).
 
     Returns
     -------
@@ -156,6 +855,7 @@ def map_pmids_to_pmcids(
         Columns
         ``pmid``   | string  
         ``pmcid``  | string  (``<NA>`` if no PMC record exists)
+        ``doi``    | string  (``"idconv"`` backend only; ``<NA>`` if unknown)
 
         The DataFrame contains **one row per unique (pmid, pmcid) pair**.
 
@@ -163,22 +863,60 @@ def map_pmids_to_pmcids(
     -----
     * Uses **ELink** (``dbfrom=pubmed``, ``db=pmc``) under the hood.
     * Rate-limit friendly (≤3 req s⁻¹ without key, ~10 req s⁻¹ with key).
-    * XML parse errors on individual batches degrade gracefully to
-      ``pmcid = <NA>`` for the PMIDs in that batch.
+    * Failed ELink batches are split and retried down to single PMIDs (as
+      in :func:`get_pubmed_metadata_pmid`); PMIDs that still fail get
+      ``pmcid = <NA>`` and are listed in ``df.attrs["errors"]``, with the
+      extra requests counted in ``df.attrs["recovery_requests"]``.
     """
+    if index is not None:
+        from .idindex import PmcIdIndex
+
+        if not isinstance(index, PmcIdIndex):
+            index = PmcIdIndex(index)
+        hits, missing = index.lookup(list(dict.fromkeys(map(str, pmids))))
+        logger.info("PMC id index: %d hits, %d PMIDs left for %s",
+                    hits["pmid"].nunique(), len(missing), backend)
+        rest = map_pmids_to_pmcids(
+            missing,
+            api_key=api_key,
+            batch_size=batch_size,
+            timeout=timeout,
+            max_retries=max_retries,
+            delay=delay,
+            backend=backend,
+            max_workers=max_workers,
+            cache=cache,
+        )
+        return (pd.concat([hits.reindex(columns=rest.columns), rest],
+                          ignore_index=True)
+                .astype("string").drop_duplicates(ignore_index=True))
+
+    if backend == "idconv":
+        return _map_pmids_idconv(
+            pmids,
+            api_key=api_key,
+            batch_size=min(batch_size, 200),
+            timeout=timeout,
+            max_retries=max_retries,
+            delay=delay,
+            max_workers=max_workers,
+            cache=cache,
+        )
+    if backend != "elink":
+        raise ValueError(f"Unknown backend {backend!r}; use 'elink' or 'idconv'")
+
     # ── Guard clause ────────────────────────────────────────────
     if not pmids:
         return pd.DataFrame(columns=["pmid", "pmcid"]).astype("string")
 
     base_elink = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/elink.fcgi"
-    session = requests.Session()
+    session = _POOLED_SESSION.get() or requests.Session()
+    limiter = get_rate_limiter(api_key)
     records: list[tuple[str, str | None]] = []
+    errors: dict[str, str] = {}
+    recovery = 0
 
-    total_batches = ceil(len(pmids) / batch_size)
-
-    for idx in range(total_batches):
-        chunk = pmids[idx * batch_size:(idx + 1) * batch_size]
-
+    def _attempt(ids: list[str], first: bool) -> list[tuple[str, str | None]]:
         # Build URL-encoded body once; add each PMID as a separate "id"
         data = [
             ("dbfrom", "pubmed"),
@@ -187,53 +925,25 @@ def map_pmids_to_pmcids(
         ]
         if api_key:
             data.append(("api_key", api_key))
-        data.extend(("id", pmid) for pmid in chunk)
-
-        logger.info("ELink batch %d/%d (size=%d)", idx + 1, total_batches,
-                    len(chunk))
-
-        # ── HTTP with retry ─────────────────────────────────────
-        response = None
-        for attempt in range(1, max_retries + 1):
-            try:
-                response = session.post(base_elink, data=data, timeout=timeout)
-                if response.status_code == 429:
-                    raise HTTPError(response=response)
-                response.raise_for_status()
-                break  # success
-            except (HTTPError, RequestException) as exc:
-                status = getattr(exc.response, "status_code", None)
-                if status and (status == 429 or
-                               500 <= status < 600) and attempt < max_retries:
-                    wait = delay * (2**(attempt - 1))
-                    logger.warning(
-                        "Batch %d: HTTP %s, retry %d/%d in %.1fs",
-                        idx + 1,
-                        status,
-                        attempt,
-                        max_retries,
-                        wait,
-                    )
-                    time.sleep(wait)
-                    continue
-                logger.error("Batch %d failed: %s", idx + 1, exc)
-                break  # fall through
+        data.extend(("id", pmid) for pmid in ids)
 
-        # On total failure → all PMIDs in chunk get <NA>
-        if response is None or not response.ok:
-            records.extend((pmid, None) for pmid in chunk)
-            continue
+        response = _send_with_retries(
+            lambda: _cached(
+                cache, "elink", data,
+                lambda: _limited(limiter, session.post, base_elink,
+                                 data=data, timeout=timeout)),
+            max_retries=max_retries if first else 1, delay=delay,
+            label=f"ELink of {len(ids)} PMIDs from {ids[0]}")
 
         # ── XML parse ──────────────────────────────────────────
         try:
             root = ET.fromstring(response.content)
         except ET.ParseError as e:
-            logger.error("XML parse error for batch %d: %s", idx + 1, e)
-            records.extend((pmid, None) for pmid in chunk)
-            time.sleep(delay)
-            continue
+            logger.error("XML parse error for ELink PMIDs %s: %s", ids, e)
+            raise _batch_failure(e) from e
 
         # ── Extract mappings ──────────────────────────────────
+        rows: list[tuple[str, str | None]] = []
         for linkset in root.findall("LinkSet"):
             pmid_text = linkset.findtext("IdList/Id")
             if not pmid_text:
@@ -244,18 +954,511 @@ def map_pmids_to_pmcids(
                 for link in db.findall("Link/Id") if link.text
             ]
             if pmcids:
-                records.extend((pmid_text, pmcid) for pmcid in pmcids)
+                rows.extend((pmid_text, pmcid) for pmcid in pmcids)
             else:  # preserve the PMID even if it lacks a PMC record
-                records.append((pmid_text, None))
+                rows.append((pmid_text, None))
+        return rows
+
+    total_batches = ceil(len(pmids) / batch_size)
 
-        time.sleep(delay)
+    for idx in range(total_batches):
+        chunk = pmids[idx * batch_size:(idx + 1) * batch_size]
+        logger.info("ELink batch %d/%d (size=%d)", idx + 1, total_batches,
+                    len(chunk))
+        rows, batch_errors, batch_recovery = _fetch_bisecting(chunk, _attempt)
+        records.extend(rows)
+        # PMIDs that failed on their own → <NA>
+        records.extend((pmid, None) for pmid in batch_errors)
+        errors.update(batch_errors)
+        recovery += batch_recovery
 
     # Always deduplicate before returning
     df = (pd.DataFrame(records, columns=[
         "pmid", "pmcid"
     ]).astype("string").drop_duplicates(ignore_index=True))
 
-    return df
+    return _batch_report(df, errors, recovery)
+
+
+_IDCONV_URL = "https://pmc.ncbi.nlm.nih.gov/tools/idconv/api/v1/articles/"
+
+
+def _map_pmids_idconv(
+    pmids: List[str],
+    *,
+    api_key: str | None,
+    batch_size: int,
+    timeout: int,
+    max_retries: int,
+    delay: float,
+    max_workers: int,
+    cache: ResponseCache | None = None,
+) -> pd.DataFrame:
+    """
+    ``map_pmids_to_pmcids(backend="idconv")`` – PMC ID Converter backend.
+
+    Batches of ≤200 PMIDs are sent concurrently from a pooled session behind
+    one shared rate limiter; each JSON payload yields PMID, PMCID and DOI.
+    Failed batches degrade to ``pmcid = doi = <NA>`` for their PMIDs.
+    """
+    cols = ["pmid", "pmcid", "doi"]
+    unique_pmids = list(dict.fromkeys(str(p) for p in pmids))
+    if not unique_pmids:
+        return pd.DataFrame(columns=cols).astype("string")
+
+    session = _POOLED_SESSION.get() or requests.Session()
+    limiter = get_rate_limiter(api_key)
+    chunks = [
+        unique_pmids[i:i + batch_size]
+        for i in range(0, len(unique_pmids), batch_size)
+    ]
+
+    def _convert(idx: int) -> list[tuple[str, str | None, str | None]]:
+        chunk = chunks[idx]
+        params = {
+            "ids": ",".join(chunk),
+            "idtype": "pmid",
+            "format": "json",
+            "tool": "searchpubmed",
+        }
+        payload = None
+        for attempt in range(1, max_retries + 1):
+            try:
+                resp = _cached(
+                    cache, "idconv", params,
+                    lambda: _limited(limiter, session.get, _IDCONV_URL,
+                                     params=params, timeout=timeout))
+                resp.raise_for_status()
+                payload = resp.json()
+                break
+            except requests.HTTPError as exc:
+                status = getattr(exc.response, "status_code", None)
+                if status and (status == 429 or
+                               500 <= status < 600) and attempt < max_retries:
+                    pause = delay * (2**(attempt - 1))
+                    logger.warning("idconv batch %d: HTTP %s, retry %d/%d in %.1fs",
+                                   idx + 1, status, attempt, max_retries, pause)
+                    time.sleep(pause)
+                    continue
+                logger.error("idconv batch %d failed: %s", idx + 1, exc)
+                break
+            except (requests.RequestException, ValueError) as exc:
+                logger.error("idconv batch %d failed: %s", idx + 1, exc)
+                break
+
+        if payload is None:
+            return [(pmid, None, None) for pmid in chunk]
+
+        rows: list[tuple[str, str | None, str | None]] = []
+        found: set[str] = set()
+        for rec in payload.get("records", []):
+            pmid = str(rec.get("pmid") or rec.get("requested-id") or "")
+            if not pmid:
+                continue
+            found.add(pmid)
+            rows.append((pmid, rec.get("pmcid") or None, rec.get("doi") or None))
+        rows.extend((pmid, None, None) for pmid in chunk if pmid not in found)
+        return rows
+
+    logger.info("idconv: %d PMIDs in %d batches", len(unique_pmids), len(chunks))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        records = [row for rows in pool.map(_convert, range(len(chunks)))
+                   for row in rows]
+
+    return (pd.DataFrame(records, columns=cols).astype("string")
+            .drop_duplicates(ignore_index=True))
+
+
+##############################################################################
+#  EFetch article parsing                                                    #
+##############################################################################
+_MEDLINE_FIELDS = ("title", "abstract", "journal", "publicationDate", "doi",
+                   "firstAuthor", "lastAuthor", "authorAffiliations",
+                   "meshTags", "keywords")
+_PMID_METADATA_COLS = ("pmid", *_MEDLINE_FIELDS)
+_PMCID_METADATA_COLS = ("pmcid", "pmid", *_MEDLINE_FIELDS)
+
+
+def _metadata_frame(records: list[dict], cols: tuple[str, ...]) -> pd.DataFrame:
+    """All-``string`` DataFrame of *records* with exactly the columns *cols*."""
+    return pd.DataFrame(records, columns=list(cols)).astype("string")
+
+
+def _iter_body(resp, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+    """Yield a response body in chunks – off the socket for streamed responses."""
+    if hasattr(resp, "iter_content"):
+        yield from resp.iter_content(chunk_size)
+    else:
+        yield resp.content
+
+
+def _iter_articles(resp, tag: str, *, stream: bool = False) -> Iterator[ET.Element]:
+    """
+    Yield every ``<tag>`` element of an EFetch response, with the document's
+    default namespace removed from tag names.
+
+    ``stream=False`` parses the whole body at once.  ``stream=True`` feeds the
+    body chunk by chunk into an ``XMLPullParser`` and yields each element as
+    soon as its end tag arrives; once the consumer moves on the element is
+    cleared and detached from its parent, so only one article is ever held in
+    memory.  Malformed input raises ``ET.ParseError`` – in streaming mode
+    possibly after some articles have already been yielded.
+    """
+    if not stream:
+        root = ET.fromstring(_strip_default_ns(resp.content))
+        yield from root.findall(f".//{tag}")
+        return
+
+    parser = ET.XMLPullParser(events=("start-ns", "start", "end"))
+    default_ns: str | None = None
+    open_elems: list[ET.Element] = []
+
+    def _events():
+        for chunk in _iter_body(resp):
+            parser.feed(chunk)
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+
+    for event, item in _events():
+        if event == "start":
+            open_elems.append(item)
+        elif event == "end":
+            open_elems.pop()
+            if default_ns and item.tag.startswith(default_ns):
+                item.tag = item.tag[len(default_ns):]
+            if item.tag == tag and open_elems:
+                yield item
+                item.clear()
+                open_elems[-1].remove(item)
+        elif default_ns is None and not item[0]:  # first xmlns="…"
+            default_ns = f"{{{item[1]}}}"
+
+
+def _iter_article_slices(resp, tag: str, *,
+                         stream: bool = False) -> Iterator[Tuple[ET.Element, str]]:
+    """
+    Like :func:`_iter_articles`, but yield ``(element, raw)`` pairs where
+    *raw* is the element's markup sliced verbatim out of the response body.
+
+    The body is parsed in a single expat pass that builds the tree and notes
+    the byte offsets of each ``<tag>``, so there is no namespace-stripping
+    copy of the whole body and no ``ET.tostring`` per article: *raw* keeps
+    the original prefixes, namespace declarations and formatting.  Without
+    *stream* it is decoded straight from a memoryview of ``resp.content``;
+    with it, only the unfinished tail of the body is buffered.
+    """
+    parser = expat.ParserCreate(namespace_separator="}")
+    parser.buffer_text = True
+    builder = ET.TreeBuilder()
+    default_ns: list[str] = []  # first xmlns="…", stripped as _strip_default_ns does
+    open_elems: list[ET.Element] = []
+    starts: list[int] = []
+    done: list[Tuple[ET.Element, ET.Element, str]] = []
+    buf = bytearray() if stream else resp.content
+    base = last_end = 0  # absolute offsets of buf[0] and of the last article's end
+    fresh = False  # was the last event a start tag? then an end closes <x/>
+
+    def _name(raw: str) -> str:
+        if "}" not in raw:
+            return raw
+        if default_ns and raw.startswith(default_ns[0]):
+            return raw[len(default_ns[0]):]
+        return "{" + raw
+
+    def _ns(prefix, uri):
+        if prefix is None and not default_ns:
+            default_ns.append(f"{uri}}}")
+
+    def _start(name, attrs):
+        nonlocal fresh
+        fresh = True
+        name = _name(name)
+        if any("}" in key for key in attrs):
+            attrs = {_name(k): v for k, v in attrs.items()}
+        open_elems.append(builder.start(name, attrs))
+        if name == tag:
+            starts.append(parser.CurrentByteIndex)
+
+    def _other(*_args):
+        nonlocal fresh
+        fresh = False
+
+    def _data(text):
+        _other()
+        builder.data(text)
+
+    def _end(name):
+        nonlocal last_end, fresh
+        empty, fresh = fresh, False
+        name = _name(name)
+        elem = builder.end(name)
+        open_elems.pop()
+        if name == tag and open_elems:
+            start = starts.pop() - base
+            pos = parser.CurrentByteIndex - base
+            # expat reports </tag> at its "</", whose ">" cannot be inside a
+            # quoted value, and <tag …/> just past the "/>" – where the
+            # parent's "</" may follow, so only a childless "/>" counts as one
+            closed = empty and buf[pos - 2:pos] == b"/>"
+            if buf.startswith(b"</", pos) and not closed:
+                end = buf.index(b">", pos) + 1
+            else:
+                end = pos
+            with memoryview(buf) as view:
+                raw = str(view[start:end], "utf-8")
+            done.append((elem, open_elems[-1], raw))
+            last_end = base + end
+
+    parser.StartNamespaceDeclHandler = _ns
+    parser.StartElementHandler = _start
+    parser.EndElementHandler = _end
+    parser.CharacterDataHandler = _data
+    parser.CommentHandler = parser.ProcessingInstructionHandler = _other
+    parser.StartCdataSectionHandler = _other
+
+    chunks = _iter_body(resp) if stream else [buf]
+    try:
+        for chunk in chunks:
+            if stream:
+                buf += chunk
+            parser.Parse(chunk, False)
+            for elem, parent, raw in done:
+                yield elem, raw
+                elem.clear()
+                parent.remove(elem)
+            done.clear()
+            if stream:  # drop what precedes the next (possibly unreported) article
+                keep = (starts[0] if starts else last_end) - base
+                del buf[:keep]
+                base += keep
+        parser.Parse(b"", True)
+    except expat.ExpatError as exc:
+        raise ET.ParseError(str(exc)) from exc
+
+
+##############################################################################
+#  Publication-date normalisation                                            #
+##############################################################################
+_MONTH_NAMES = ("january", "february", "march", "april", "may", "june", "july",
+                "august", "september", "october", "november", "december")
+# every spelling PubMed / JATS use for a month → 1…12
+_MONTHS: dict[str, int] = {
+    key: num
+    for num, name in enumerate(_MONTH_NAMES, start=1)
+    for key in (name, name[:3], str(num), f"{num:02d}")
+} | {"sept": 9}
+
+_MEDLINE_DATE_RE = re.compile(r"^\s*(\d{4})(?:\s+([A-Za-z]+)\.?(?:\s+(\d{1,2})\b)?)?")
+
+
+@lru_cache(maxsize=8192)
+def _iso_date(year: str, month: str = "", day: str = "") -> str:
+    """
+    ``YYYY[-MM-DD]`` for a (year, month, day) triple as found in PubMed
+    and JATS XML.  Month may be a name, an abbreviation or a number; a
+    month without a day means its 1st, as dateparser used to assume.
+
+    Unknown month spellings fall back to ``dateparser`` (imported on first
+    need); anything still unparseable comes back as the parts joined by "-".
+    """
+    raw = "-".join(p for p in (year, month, day) if p)
+    mon = _MONTHS.get(month.strip().rstrip(".").lower()) if month else None
+    if month and mon is None:
+        try:
+            import dateparser  # slow import – only for exotic month strings
+
+            return dateparser.parse(
+                f"{year} {month} {day or '1'}").date().isoformat()
+        except Exception:
+            return raw
+    try:
+        if not year.isdigit() or len(year) != 4:
+            return raw
+        if mon:
+            return date(int(year), mon, int(day or 1)).isoformat()
+        return year
+    except (ValueError, TypeError):
+        return raw
+
+
+def _medline_pubdate(elem: ET.Element | None) -> str:
+    """ISO date of a MEDLINE ``<PubDate>`` (``<MedlineDate>`` → first month)."""
+    if elem is None:
+        return "N/A"
+    y = elem.findtext("Year")
+    m = elem.findtext("Month") or ""
+    d = elem.findtext("Day") or ""
+    if y and m:
+        return _iso_date(y, m, d)
+    medline = elem.findtext("MedlineDate")
+    if medline:
+        # "1998 Dec-1999 Jan", "2000 Spring", "2019 Mar 4-8" …
+        hit = _MEDLINE_DATE_RE.match(medline)
+        if hit is None:
+            return medline
+        y, m, d = hit.group(1), hit.group(2) or "", hit.group(3) or ""
+        if m.lower().rstrip(".") not in _MONTHS:
+            return y
+        return _iso_date(y, m, d)
+    return y or "N/A"
+
+
+def _jats_pubdate(elem: ET.Element | None) -> str:
+    """ISO date of a JATS ``<pub-date>``."""
+    if elem is None:
+        return "N/A"
+    y = (elem.findtext("year") or "").strip()
+    m = (elem.findtext("month") or "").strip()
+    d = (elem.findtext("day") or "").strip()
+    if not y:
+        return "-".join(p for p in (m, d) if p) or "N/A"
+    return _iso_date(y, m, d)
+
+
+def _medline_fullname(author: ET.Element) -> str:
+    fore = author.findtext("ForeName") or author.findtext("Initials") or ""
+    last = author.findtext("LastName") or ""
+    name = f"{fore} {last}".strip()
+    return name or "N/A"
+
+
+def _jats_fullname(author: ET.Element) -> str:
+    fore = author.findtext("given-names") or author.findtext(
+        "initials") or ""
+    last = author.findtext("surname") or ""
+    name = f"{fore} {last}".strip()
+    return name or "N/A"
+
+
+def _jats_pmcid(art: ET.Element) -> str:
+    """Canonical ``PMC…`` identifier of a JATS ``<article>`` (or ``"PMCN/A"``)."""
+    pmcid = next(
+        (art.findtext(f'.//article-id[@pub-id-type="{t}"]')
+         for t in ("pmcid", "pmc", "pmcid-ver", "pmcaid")
+         if art.find(f'.//article-id[@pub-id-type="{t}"]') is not None),
+        "N/A",
+    )
+    if "." in pmcid:  # drop version suffix
+        pmcid = pmcid.split(".", 1)[0]
+    if not pmcid.upper().startswith("PMC"):
+        pmcid = f"PMC{pmcid}"
+    return pmcid
+
+
+def _pubmed_article_record(art: ET.Element) -> dict:
+    """One ``get_pubmed_metadata_pmid`` row from a ``<PubmedArticle>``."""
+    authors = art.findall(".//AuthorList/Author")
+    affiliations = [
+        aff.text for a in authors
+        for aff in a.findall("AffiliationInfo/Affiliation") if aff.text
+    ]
+    return {
+        "pmid": art.findtext(".//PMID", default="N/A"),
+        "title": art.findtext(".//ArticleTitle", default="N/A").strip(),
+        "abstract": " ".join(t.text or "" for t in art.findall(
+            ".//Abstract/AbstractText")).strip() or "N/A",
+        "journal": art.findtext(".//Journal/Title", default="N/A"),
+        "publicationDate": _medline_pubdate(art.find(".//JournalIssue/PubDate")),
+        "doi": art.findtext('.//ArticleIdList/ArticleId[@IdType="doi"]',
+                            default="N/A"),
+        "firstAuthor": _medline_fullname(authors[0]) if authors else "N/A",
+        "lastAuthor": _medline_fullname(authors[-1]) if authors else "N/A",
+        "authorAffiliations": "; ".join(affiliations) or "N/A",
+        "meshTags": ", ".join(
+            mh.text for mh in art.findall(".//MeshHeading/DescriptorName")
+            if mh.text) or "N/A",
+        "keywords": ", ".join(
+            kw.text for kw in art.findall(".//KeywordList/Keyword")
+            if kw.text) or "N/A",
+    }
+
+
+def _pmc_article_record(art: ET.Element) -> dict:
+    """One ``get_pubmed_metadata_pmcid`` row from a JATS ``<article>``."""
+    title = (art.findtext(".//article-title", default="N/A") or "").strip()
+
+    # Publication date (take <pub-date publication-format="electronic"> if present)
+    publication_date = _jats_pubdate(
+        art.find('.//pub-date[@pub-type="epub"]')
+        or art.find('.//pub-date[@pub-type="pub"]')
+        or art.find(".//pub-date"))
+
+    authors = art.findall(".//contrib-group/contrib[@contrib-type='author']")
+    affiliations = [aff.text for aff in art.findall(".//aff") if aff.text]
+
+    # MeSH in JATS appears under <kwd-group kwd-group-type="MeSH">
+    mesh_tags = ", ".join(  # modern kwd-group layout
+        kw.text
+        for kg in art.findall('.//kwd-group[@kwd-group-type="MeSH"]')
+        for kw in kg.findall(".//kwd")
+        if kw.text) or ", ".join(  # ← fallback for fixture
+            mh.text for mh in art.findall(
+                ".//mesh-heading-list/mesh-heading/descriptor-name")
+            if mh.text) or "N/A"
+
+    # Author‐provided keywords → any kwd-group **without** @kwd-group-type
+    keywords = ", ".join(kw.text for kg in art.findall(".//kwd-group")
+                         if "kwd-group-type" not in kg.attrib
+                         for kw in kg.findall(".//kwd")
+                         if kw.text) or "N/A"
+
+    return {
+        "pmcid": _jats_pmcid(art),
+        "pmid": art.findtext('.//article-id[@pub-id-type="pmid"]',
+                             default="N/A"),
+        "title": title,
+        # Abstract paragraphs joined
+        "abstract": " ".join(
+            p.text or "" for p in art.findall(".//abstract//p")).strip() or "N/A",
+        "journal": art.findtext(".//journal-title", default="N/A"),
+        "publicationDate": publication_date,
+        "doi": art.findtext('.//article-id[@pub-id-type="doi"]', default="N/A"),
+        "firstAuthor": _jats_fullname(authors[0]) if authors else "N/A",
+        "lastAuthor": _jats_fullname(authors[-1]) if authors else "N/A",
+        "authorAffiliations": "; ".join(affiliations) or "N/A",
+        "meshTags": mesh_tags,
+        "keywords": keywords,
+    }
+
+
+_PMC_XML_DTYPES = {
+    "pmcid": "string",
+    "fullXML": "string",
+    "fullText": "string",
+    "isFullText": "boolean",
+    "hasSuppMat": "boolean",
+    "xmlKind": "string",
+}
+
+
+def _pmc_xml_record(art: ET.Element, *, keep_xml: bool = True,
+                    chunks: bool = False) -> dict:
+    """
+    One ``get_pmc_full_xml`` row from a JATS ``<article>``.  Text (and
+    chunks) come from the live element, so the article is parsed only once;
+    ``keep_xml=False`` skips serialising it.
+    """
+    has_supp = any(
+        art.find(path) is not None
+        for path in (
+            ".//supplementary-material",
+            ".//inline-supplementary-material",
+            ".//sub-article[@article-type='supplementary-material']",
+        )
+    )
+    record = {
+        "pmcid": _jats_pmcid(art),
+        "isFullText": art.find(".//body") is not None,
+        "hasSuppMat": has_supp,
+        "xmlKind": "pmc",  # a JATS <article>, as _classify_pubmed_xml would say
+        "fullText": _full_text_from_element(art),
+    }
+    if keep_xml:
+        record["fullXML"] = ET.tostring(art, encoding="unicode")
+    if chunks:
+        record["textChunks"] = _jats_chunks_from_element(art, text_only=True)
+    return record
 
 
 def get_pubmed_metadata_pmid(
@@ -266,6 +1469,8 @@ def get_pubmed_metadata_pmid(
     timeout: int = 20,
     max_retries: int = 3,
     delay: float = 0.34,
+    cache: ResponseCache | None = None,
+    stream: bool = False,
 ) -> pd.DataFrame:
     """
     ------------------------------------------------------------------------
@@ -286,6 +1491,12 @@ def get_pubmed_metadata_pmid(
         Attempts per batch on HTTP-429 / 5xx before giving up.
     delay : float, default 0.34 s
         Base back-off (doubles each retry).
+    cache : ResponseCache, optional
+        Persistent response cache (see :mod:`searchpubmed.cache`).
+    stream : bool, default False
+        Parse each batch incrementally off the socket, one article at a
+        time, so peak memory follows the largest article rather than the
+        batch size.
 
     Returns
     -------
@@ -296,7 +1507,7 @@ def get_pubmed_metadata_pmid(
         title                | string | Article title (sentence case)
         abstract             | string | Abstract (paragraphs joined)
         journal              | string | Full journal title
-        publicationDate      | string | ISO-8601 date (YYYY-MM-DD / YYYY-MM)
+        publicationDate      | string | ISO-8601 date (YYYY-MM-DD / YYYY)
         doi                  | string | Digital Object Identifier
         firstAuthor          | string | “Given Surname” of first author
         lastAuthor           | string | “Given Surname” of last author
@@ -310,166 +1521,93 @@ def get_pubmed_metadata_pmid(
     Notes
     -----
     * Only **one HTTP round-trip per *batch***; results are concatenated.
-    * Parsing failures for individual articles degrade gracefully to rows
-      filled with ``"N/A"``.
+    * A batch that fails (HTTP error or malformed XML) is split in half and
+      each half retried once, down to single PMIDs, so one bad record only
+      costs itself.  PMIDs that still fail get a row filled with ``"N/A"``;
+      ``df.attrs["errors"]`` maps each of them to an error code
+      (``"http-500"``, ``"parse-error"``, ``"network-error"`` …) and
+      ``df.attrs["recovery_requests"]`` counts the extra requests spent.
+    * :func:`iter_pubmed_metadata_pmid` yields the same rows batch by batch
+      for result sets too large to hold at once.
+    """
+    frames = list(iter_pubmed_metadata_pmid(
+        pmids, api_key=api_key, batch_size=batch_size, timeout=timeout,
+        max_retries=max_retries, delay=delay, cache=cache, stream=stream))
+    if not frames:
+        return _metadata_frame([], _PMID_METADATA_COLS)
+    return _merge_reports(frames, pd.concat(frames, ignore_index=True)
+                          .sort_values("pmid", ignore_index=True))
+
+
+def iter_pubmed_metadata_pmid(
+    pmids: List[str],
+    *,
+    api_key: str | None = None,
+    batch_size: int = 200,
+    timeout: int = 20,
+    max_retries: int = 3,
+    delay: float = 0.34,
+    cache: ResponseCache | None = None,
+    stream: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """
+    ------------------------------------------------------------------------
+    Stream PubMed metadata one EFetch batch at a time.
+    ------------------------------------------------------------------------
+
+    Generator counterpart of :func:`get_pubmed_metadata_pmid` (same
+    parameters, same columns and dtypes).  Each batch is yielded as soon as
+    it is parsed, so a writer can persist results incrementally while only
+    one batch is held in memory.
+
+    Yields
+    ------
+    pandas.DataFrame
+        One all-``string`` frame per batch of *batch_size* unique PMIDs, in
+        EFetch order (not sorted), with that batch's ``attrs["errors"]`` and
+        ``attrs["recovery_requests"]``; PMIDs that fail yield ``"N/A"`` rows.
     """
-    # ── Guard clause ────────────────────────────────────────────
     unique_pmids = list(dict.fromkeys(pmids))  # de-dup, keep order
-    if not unique_pmids:
-        return pd.DataFrame(columns=[
-            "pmid",
-            "title",
-            "abstract",
-            "journal",
-            "publicationDate",
-            "doi",
-            "firstAuthor",
-            "lastAuthor",
-            "authorAffiliations",
-            "meshTags",
-            "keywords",
-        ]).astype("string")
 
     base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
-    session = requests.Session()
-    records: list[dict] = []
+    session = _POOLED_SESSION.get() or requests.Session()
+    limiter = get_rate_limiter(api_key)
 
-    # ── Helpers ─────────────────────────────────────────────────
-    def _parse_pubdate(elem: ET.Element | None) -> str:
-        if elem is None:
-            return "N/A"
-        y = elem.findtext("Year")
-        m = elem.findtext("Month") or ""
-        d = elem.findtext("Day") or ""
-        if y and m:
-            try:
-                return dateparser.parse(
-                    f"{y} {m} {d or '1'}").date().isoformat()
-            except Exception:
-                return "-".join(p for p in (y, m, d) if p)
-        return elem.findtext("MedlineDate") or y or "N/A"
-
-    def _fullname(author: ET.Element) -> str:
-        fore = author.findtext("ForeName") or author.findtext("Initials") or ""
-        last = author.findtext("LastName") or ""
-        name = f"{fore} {last}".strip()
-        return name or "N/A"
-
-    # ── Main loop ───────────────────────────────────────────────
-    for start in range(0, len(unique_pmids), batch_size):
-        batch = unique_pmids[start:start + batch_size]
+    def _attempt(ids: list[str], first: bool) -> list[dict]:
         params = {
             "db": "pubmed",
             "retmode": "xml",
-            "id": ",".join(batch),
+            "id": ",".join(ids),
         }
         if api_key:
             params["api_key"] = api_key
-
-        # ---- HTTP with retry ----------------------------------
-        resp = None
-        for attempt in range(1, max_retries + 1):
-            try:
-                resp = session.get(base_url, params=params, timeout=timeout)
-                resp.raise_for_status()
-                break
-            except HTTPError as e:
-                status = getattr(e.response, "status_code", None)
-                if status and (status == 429 or
-                               500 <= status < 600) and attempt < max_retries:
-                    wait = delay * (2**(attempt - 1))
-                    logger.warning(
-                        f"Batch {start//batch_size+1}: HTTP {status}; retry in {wait:.1f}s "
-                        f"(attempt {attempt}/{max_retries})")
-                    time.sleep(wait)
-                    continue
-                logger.error(f"EFetch HTTP error for PMIDs {batch}: {e}")
-                break
-            except RequestException as e:
-                logger.error(f"Network error for PMIDs {batch}: {e}")
-                break
-
-        if resp is None or not resp.ok:
-            # total failure → placeholder rows
-            for pmid in batch:
-                records.append({
-                    k: "N/A"
-                    for k in ("title", "abstract", "journal",
-                              "publicationDate", "doi", "firstAuthor",
-                              "lastAuthor", "authorAffiliations", "meshTags",
-                              "keywords")
-                } | {"pmid": "N/A"})
-            continue
-
-        # ---- XML parse ----------------------------------------
+        resp = _send_with_retries(
+            lambda: _cached(
+                cache, "efetch", params,
+                lambda: _limited(limiter, session.get, base_url,
+                                 params=params, timeout=timeout,
+                                 stream=stream)),
+            max_retries=max_retries if first else 1, delay=delay,
+            label=f"EFetch of {len(ids)} PMIDs from {ids[0]}")
+        parsed: list[dict] = []
         try:
-            root = ET.fromstring(resp.content)
-        except ET.ParseError as e:
-            logger.error(f"XML parse error for PMIDs {batch}: {e}")
-            for pmid in batch:
-                records.append({
-                    k: "N/A"
-                    for k in ("title", "abstract", "journal",
-                              "publicationDate", "doi", "firstAuthor",
-                              "lastAuthor", "authorAffiliations", "meshTags",
-                              "keywords")
-                } | {"pmid": "N/A"})
-            time.sleep(delay)
-            continue
-
-        # ---- Extract article info -----------------------------
-        for art in root.findall(".//PubmedArticle"):
-            pmid = art.findtext(".//PMID", default="N/A")
+            for art in _iter_articles(resp, "PubmedArticle", stream=stream):
+                parsed.append(_pubmed_article_record(art))
+        except (ET.ParseError, requests.RequestException) as e:
+            logger.error(f"XML parse error for PMIDs {ids}: {e}")
+            raise _batch_failure(e, partial=parsed,
+                                 done={r["pmid"] for r in parsed}) from e
+        return parsed
 
-            title = art.findtext(".//ArticleTitle", default="N/A").strip()
-
-            abstract = " ".join(t.text or "" for t in art.findall(
-                ".//Abstract/AbstractText")).strip() or "N/A"
-
-            journal = art.findtext(".//Journal/Title", default="N/A")
-
-            pubdate_elem = art.find(".//JournalIssue/PubDate")
-            publication_date = _parse_pubdate(pubdate_elem)
-
-            doi = art.findtext('.//ArticleIdList/ArticleId[@IdType="doi"]',
-                               default="N/A")
-
-            authors = art.findall(".//AuthorList/Author")
-            first_author = _fullname(authors[0]) if authors else "N/A"
-            last_author = _fullname(authors[-1]) if authors else "N/A"
-
-            affiliations = [
-                aff.text for a in authors
-                for aff in a.findall("AffiliationInfo/Affiliation") if aff.text
-            ]
-            author_affiliations = "; ".join(affiliations) or "N/A"
-
-            mesh_tags = ", ".join(
-                mh.text for mh in art.findall(".//MeshHeading/DescriptorName")
-                if mh.text) or "N/A"
-
-            keywords = ", ".join(
-                kw.text for kw in art.findall(".//KeywordList/Keyword")
-                if kw.text) or "N/A"
-
-            records.append({
-                "pmid": pmid,
-                "title": title,
-                "abstract": abstract,
-                "journal": journal,
-                "publicationDate": publication_date,
-                "doi": doi,
-                "firstAuthor": first_author,
-                "lastAuthor": last_author,
-                "authorAffiliations": author_affiliations,
-                "meshTags": mesh_tags,
-                "keywords": keywords,
-            })
-
-        time.sleep(delay)
-
-    return (pd.DataFrame(records).astype("string").sort_values(
-        "pmid", ignore_index=True))
+    # ── Main loop ───────────────────────────────────────────────
+    for start in range(0, len(unique_pmids), batch_size):
+        batch = unique_pmids[start:start + batch_size]
+        records, errors, recovery = _fetch_bisecting(batch, _attempt)
+        # IDs that failed on their own → placeholder rows
+        records.extend({"pmid": pmid, **dict.fromkeys(_MEDLINE_FIELDS, "N/A")}
+                       for pmid in errors)
+        yield _batch_report(_metadata_frame(records, _PMID_METADATA_COLS),
+                            errors, recovery)
 
 
 def get_pubmed_metadata_pmcid(
@@ -480,6 +1618,8 @@ def get_pubmed_metadata_pmcid(
     timeout: int = 20,
     max_retries: int = 3,
     delay: float = 0.34,
+    cache: ResponseCache | None = None,
+    stream: bool = False,
 ) -> pd.DataFrame:
     """
     Fetch structured metadata for one or many PubMed Central IDs (PMCIDs).
@@ -498,25 +1638,35 @@ def get_pubmed_metadata_pmcid(
     ``authorAffiliations`` | string  
     ``meshTags`` | string  
     ``keywords`` | string
+
+    Parameters are as for :func:`get_pubmed_metadata_pmid`, including the
+    optional persistent ``cache`` and incremental ``stream`` parsing.
     """
-    # ── Guard clause ────────────────────────────────────────────
-    if not pmcids:
-        cols = [
-            "pmcid",
-            "pmid",
-            "title",
-            "abstract",
-            "journal",
-            "publicationDate",
-            "doi",
-            "firstAuthor",
-            "lastAuthor",
-            "authorAffiliations",
-            "meshTags",
-            "keywords",
-        ]
-        return pd.DataFrame(columns=cols).astype("string")
+    frames = list(iter_pubmed_metadata_pmcid(
+        pmcids, api_key=api_key, batch_size=batch_size, timeout=timeout,
+        max_retries=max_retries, delay=delay, cache=cache, stream=stream))
+    if not frames:
+        return _metadata_frame([], _PMCID_METADATA_COLS)
+    return _merge_reports(frames, pd.concat(frames, ignore_index=True)
+                          .sort_values("pmcid", ignore_index=True))
+
 
+def iter_pubmed_metadata_pmcid(
+    pmcids: list[str],
+    *,
+    api_key: str | None = None,
+    batch_size: int = 200,
+    timeout: int = 20,
+    max_retries: int = 3,
+    delay: float = 0.34,
+    cache: ResponseCache | None = None,
+    stream: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """
+    Generator counterpart of :func:`get_pubmed_metadata_pmcid`: yields one
+    all-``string`` frame per EFetch batch as soon as it is parsed (IDs
+    normalised and de-duplicated, rows in EFetch order).
+    """
     # Normalise IDs (“12345” → “PMC12345”)
     norm_ids = [
         pid if str(pid).upper().startswith("PMC") else f"PMC{pid}"
@@ -524,169 +1674,45 @@ def get_pubmed_metadata_pmcid(
     ]
     unique_ids = list(dict.fromkeys(norm_ids))  # de-dup, keep order
 
-    # Helpers ───────────────────────────────────────────────────
-    def _strip_default_ns(xml_bytes: bytes) -> bytes:
-        """Remove first xmlns=… to simplify tag addressing."""
-        return re.sub(rb'\sxmlns="[^"]+"', b"", xml_bytes, count=1)
-
-    def _fullname(author: ET.Element) -> str:
-        fore = author.findtext("given-names") or author.findtext(
-            "initials") or ""
-        last = author.findtext("surname") or ""
-        name = f"{fore} {last}".strip()
-        return name or "N/A"
-
     # API plumbing ──────────────────────────────────────────────
     base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
-    session = requests.Session()
-    records: list[dict] = []
+    session = _POOLED_SESSION.get() or requests.Session()
+    limiter = get_rate_limiter(api_key)
 
-    total_batches = ceil(len(unique_ids) / batch_size)
-    for idx in range(total_batches):
-        chunk = unique_ids[idx * batch_size:(idx + 1) * batch_size]
+    def _attempt(ids: list[str], first: bool) -> list[dict]:
         params = {
             "db": "pmc",
-            "id": ",".join(cid.removeprefix("PMC") for cid in chunk),
+            "id": ",".join(cid.removeprefix("PMC") for cid in ids),
             "retmode": "xml",
         }
         if api_key:
             params["api_key"] = api_key
-
-        # ── HTTP with retry ───────────────────────────────────
-        resp = None
-        for attempt in range(1, max_retries + 1):
-            try:
-                resp = session.get(base_url, params=params, timeout=timeout)
-                resp.raise_for_status()
-                break
-            except requests.HTTPError as e:
-                status = e.response.status_code
-                if status in (429, *range(500, 600)) and attempt < max_retries:
-                    wait = delay * (2**(attempt - 1))
-                    logger.warning(
-                        f"Batch {idx+1}: HTTP {status}; "
-                        f"retry {attempt}/{max_retries} in {wait:.1f}s")
-                    time.sleep(wait)
-                    continue
-                logger.error(f"Batch {idx+1}: HTTP error {e}")
-                break
-            except requests.RequestException as e:
-                logger.error(f"Batch {idx+1}: network error {e}")
-                break
-
-        if resp is None or not resp.ok:
-            # total failure → placeholder rows
-            for cid in chunk:
-                records.append({
-                    "pmcid": cid,
-                    **{
-                        k: "N/A"
-                        for k in ("pmid", "title", "abstract", "journal", "publicationDate", "doi", "firstAuthor", "lastAuthor", "authorAffiliations", "meshTags", "keywords")
-                    }
-                })
-            continue
-
-        # ── XML parse ─────────────────────────────────────────
+        resp = _send_with_retries(
+            lambda: _cached(
+                cache, "efetch", params,
+                lambda: _limited(limiter, session.get, base_url,
+                                 params=params, timeout=timeout,
+                                 stream=stream)),
+            max_retries=max_retries if first else 1, delay=delay,
+            label=f"EFetch of {len(ids)} PMCIDs from {ids[0]}")
+        parsed: list[dict] = []
         try:
-            root = ET.fromstring(_strip_default_ns(resp.content))
-        except ET.ParseError as e:
-            logger.error(f"Batch {idx+1}: XML parse error {e}")
-            for cid in chunk:
-                records.append({
-                    "pmcid": cid,
-                    **{
-                        k: "N/A"
-                        for k in ("pmid", "title", "abstract", "journal", "publicationDate", "doi", "firstAuthor", "lastAuthor", "authorAffiliations", "meshTags", "keywords")
-                    }
-                })
-            time.sleep(delay)
-            continue
-
-        # ── Extract per-article metadata ──────────────────────
-        for art in root.findall(".//article"):
-            pmcid = next(
-                (art.findtext(f'.//article-id[@pub-id-type="{t}"]')
-                 for t in ("pmcid", "pmc", "pmcid-ver", "pmcaid")
-                 if art.find(f'.//article-id[@pub-id-type="{t}"]') is not None
-                 ),
-                "N/A",
-            )
-            if pmcid and "." in pmcid:
-                pmcid = pmcid.split(".", 1)[0]
-            if pmcid and not pmcid.upper().startswith("PMC"):
-                pmcid = f"PMC{pmcid}"
-            pmid = art.findtext('.//article-id[@pub-id-type="pmid"]',
-                                default="N/A")
-            title = (art.findtext(".//article-title", default="N/A")
-                     or "").strip()
-
-            # Abstract paragraphs joined
-            abstract = " ".join(
-                p.text or ""
-                for p in art.findall(".//abstract//p")).strip() or "N/A"
-
-            journal = art.findtext(".//journal-title", default="N/A")
-
-            # Publication date (take <pub-date publication-format="electronic"> if present)
-            pub_date_elem = (art.find('.//pub-date[@pub-type="epub"]')
-                             or art.find('.//pub-date[@pub-type="pub"]')
-                             or art.find(".//pub-date"))
-            if pub_date_elem is not None:
-                y = pub_date_elem.findtext("year") or ""
-                m = pub_date_elem.findtext("month") or ""
-                d = pub_date_elem.findtext("day") or ""
-                publication_date = "-".join(p for p in (y, m, d) if p) or "N/A"
-            else:
-                publication_date = "N/A"
-
-            doi = art.findtext('.//article-id[@pub-id-type="doi"]',
-                               default="N/A")
-
-            authors = art.findall(
-                ".//contrib-group/contrib[@contrib-type='author']")
-            first_author = _fullname(authors[0]) if authors else "N/A"
-            last_author = _fullname(authors[-1]) if authors else "N/A"
-
-            affiliations = [
-                aff.text for aff in art.findall(".//aff") if aff.text
-            ]
-            author_affiliations = "; ".join(affiliations) or "N/A"
-
-            # MeSH in JATS appears under <kwd-group kwd-group-type="MeSH">
-            mesh_tags = ", ".join(  # modern kwd-group layout
-                kw.text
-                for kg in art.findall('.//kwd-group[@kwd-group-type="MeSH"]')
-                for kw in kg.findall(".//kwd")
-                if kw.text) or ", ".join(  # ← fallback for fixture
-                    mh.text for mh in art.findall(
-                        ".//mesh-heading-list/mesh-heading/descriptor-name")
-                    if mh.text) or "N/A"
-
-            # Author‐provided keywords → any kwd-group **without** @kwd-group-type
-            keywords = ", ".join(kw.text for kg in art.findall(".//kwd-group")
-                                 if "kwd-group-type" not in kg.attrib
-                                 for kw in kg.findall(".//kwd")
-                                 if kw.text) or "N/A"
-
-            records.append({
-                "pmcid": pmcid,
-                "pmid": pmid,
-                "title": title,
-                "abstract": abstract,
-                "journal": journal,
-                "publicationDate": publication_date,
-                "doi": doi,
-                "firstAuthor": first_author,
-                "lastAuthor": last_author,
-                "authorAffiliations": author_affiliations,
-                "meshTags": mesh_tags,
-                "keywords": keywords,
-            })
-
-        time.sleep(delay)
-
-    return (pd.DataFrame(records).astype("string").sort_values(
-        "pmcid", ignore_index=True))
+            for art in _iter_articles(resp, "article", stream=stream):
+                parsed.append(_pmc_article_record(art))
+        except (ET.ParseError, requests.RequestException) as e:
+            logger.error(f"XML parse error for PMCIDs {ids}: {e}")
+            raise _batch_failure(e, partial=parsed,
+                                 done={r["pmcid"] for r in parsed}) from e
+        return parsed
+
+    for start in range(0, len(unique_ids), batch_size):
+        chunk = unique_ids[start:start + batch_size]
+        records, errors, recovery = _fetch_bisecting(chunk, _attempt)
+        records.extend(
+            {"pmcid": cid, **dict.fromkeys(("pmid", *_MEDLINE_FIELDS), "N/A")}
+            for cid in errors)
+        yield _batch_report(_metadata_frame(records, _PMCID_METADATA_COLS),
+                            errors, recovery)
 
 
 def _strip_default_ns(xml_bytes: bytes) -> bytes:
@@ -724,6 +1750,11 @@ def get_pmc_full_xml(
     timeout: int = 20,
     max_retries: int = 3,
     delay: float = 0.34,
+    cache: ResponseCache | None = None,
+    stream: bool = False,
+    keep_xml: bool = True,
+    chunks: bool = False,
+    slice_xml: bool = False,
 ) -> pd.DataFrame:
     """
     ------------------------------------------------------------------------
@@ -744,6 +1775,24 @@ def get_pmc_full_xml(
         Attempts per batch on HTTP-429 / 5xx before giving up.
     delay : float, default 0.34 s
         Base pause between retries (doubles each attempt).
+    cache : ResponseCache, optional
+        Persistent response cache (see :mod:`searchpubmed.cache`).
+    stream : bool, default False
+        Parse each batch incrementally off the socket, one article at a
+        time, so peak memory follows the largest article rather than the
+        batch size.
+    keep_xml : bool, default True
+        ``False`` drops the ``fullXML`` column – articles are never
+        serialised back to text – for pipelines that only need the text.
+    chunks : bool, default False
+        Add a ``textChunks`` column: :func:`get_jats_text_chunks`
+        (``text_only=True``) of each article, computed from the same parse.
+    slice_xml : bool, default False
+        Take ``fullXML`` verbatim from the response bytes – located by their
+        offsets during a single expat parse – instead of stripping the
+        default namespace and re-serialising each article.  Cheaper, and
+        byte-exact: original prefixes, namespace declarations and
+        whitespace are kept.
 
     Returns
     -------
@@ -752,34 +1801,25 @@ def get_pmc_full_xml(
         -------
         pmcid       | string   (canonical “PMC…” identifier)
         fullXML     | string   (entire `<article>` subtree or "N/A")
+        fullText    | string   (:func:`extract_full_text_from_xml` or "N/A")
         isFullText  | boolean  (True ⇢ a <body> element exists)
         hasSuppMat  | boolean  (True ⇢ supplementary material present)
         xmlKind     | string   ("pmc", "medline", or "unknown")
+        textChunks  | object   (list[str]; only with ``chunks=True``)
 
         Every PMC ID you supplied is represented exactly once—even if the
-        record is missing, withdrawn, or the request fails.
+        record is missing, withdrawn, or the request fails.  Failed batches
+        are split and retried down to single IDs; ``df.attrs["errors"]`` and
+        ``df.attrs["recovery_requests"]`` report the outcome as for
+        :func:`get_pubmed_metadata_pmid`.
     """
+    dtypes = dict(_PMC_XML_DTYPES)
+    if not keep_xml:
+        del dtypes["fullXML"]
+
     # ── Guard clause ───────────────────────────────────────────
     if not pmcids:
-        return (
-            pd.DataFrame(
-                columns=[
-                    "pmcid",
-                    "fullXML",
-                    "isFullText",
-                    "hasSuppMat",
-                    "xmlKind",
-                ]
-            ).astype(
-                {
-                    "pmcid": "string",
-                    "fullXML": "string",
-                    "isFullText": "boolean",
-                    "hasSuppMat": "boolean",
-                    "xmlKind": "string",
-                }
-            )
-        )
+        return pd.DataFrame(columns=list(dtypes)).astype(dtypes)
 
     # --- Prefix-safe normalisation ----------------------------
     norm_ids = [
@@ -788,147 +1828,71 @@ def get_pmc_full_xml(
     ]
 
     base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
-    session = requests.Session()
+    session = _POOLED_SESSION.get() or requests.Session()
+    limiter = get_rate_limiter(api_key)
     records: list[dict] = []
+    errors: dict[str, str] = {}
+    recovery = 0
 
-    total_batches = ceil(len(norm_ids) / batch_size)
-
-    # ── Main loop ─────────────────────────────────────────────
-    for b_idx in range(total_batches):
-        chunk = norm_ids[b_idx * batch_size : (b_idx + 1) * batch_size]
-        params = {"db": "pmc", "retmode": "xml", "id": ",".join(chunk)}
+    def _attempt(ids: list[str], first: bool) -> list[dict]:
+        params = {"db": "pmc", "retmode": "xml", "id": ",".join(ids)}
         if api_key:
             params["api_key"] = api_key
-
-        # ── Fetch with retries ────────────────────────────────
-        response = None
-        for attempt in range(1, max_retries + 1):
-            try:
-                response = session.get(base_url, params=params, timeout=timeout)
-                response.raise_for_status()
-                break
-            except (HTTPError, RequestException) as exc:
-                status = getattr(exc.response, "status_code", None)
-                if (
-                    status
-                    and (status == 429 or 500 <= status < 600)
-                    and attempt < max_retries
-                ):
-                    wait = delay * (2 ** (attempt - 1))
-                    logger.warning(
-                        f"Batch {b_idx+1}: HTTP {status}; retry "
-                        f"{attempt}/{max_retries} in {wait:.1f}s"
-                    )
-                    time.sleep(wait)
-                    continue
-                logger.error(f"Batch {b_idx+1} failed: {exc}")
-                break
-
-        # ── On complete failure, emit placeholders ────────────
-        if response is None or not response.ok:
-            records.extend(
-                {
-                    "pmcid": cid,
-                    "fullXML": "N/A",
-                    "isFullText": False,
-                    "hasSuppMat": False,
-                    "xmlKind": "unknown",
-                }
-                for cid in chunk
-            )
-            continue
-
-        # ── Parse / strip namespace ───────────────────────────
+        response = _send_with_retries(
+            lambda: _cached(
+                cache, "efetch", params,
+                lambda: _limited(limiter, session.get, base_url,
+                                 params=params, timeout=timeout,
+                                 stream=stream)),
+            max_retries=max_retries if first else 1, delay=delay,
+            label=f"EFetch of {len(ids)} PMC articles from {ids[0]}")
+        # ── Parse (namespace stripped) & extract <article> records ──
+        parsed: list[dict] = []
         try:
-            root = ET.fromstring(_strip_default_ns(response.content))
-        except ET.ParseError as e:
-            logger.error(f"XML parse error in batch {b_idx+1}: {e}")
-            records.extend(
-                {
-                    "pmcid": cid,
-                    "fullXML": "N/A",
-                    "isFullText": False,
-                    "hasSuppMat": False,
-                    "xmlKind": "unknown",
-                }
-                for cid in chunk
-            )
-            time.sleep(delay)
-            continue
-
-        # ── Extract <article> records ─────────────────────────
-        seen: set[str] = set()
-        for art in root.findall(".//article"):
-            # Robust PMCID extraction & normalisation
-            pmcid_text = next(
-                (
-                    art.findtext(f'.//article-id[@pub-id-type="{t}"]')
-                    for t in ("pmcid", "pmc", "pmcid-ver", "pmcaid")
-                    if art.find(f'.//article-id[@pub-id-type="{t}"]')
-                    is not None
-                ),
-                "N/A",
-            )
-            if "." in pmcid_text:  # drop version suffix
-                pmcid_text = pmcid_text.split(".", 1)[0]
-            if not pmcid_text.upper().startswith("PMC"):
-                pmcid_text = f"PMC{pmcid_text}"
-
-            xml_str = ET.tostring(art, encoding="unicode")
-            has_body = art.find(".//body") is not None
-            has_supp = any(
-                art.find(path) is not None
-                for path in (
-                    ".//supplementary-material",
-                    ".//inline-supplementary-material",
-                    ".//sub-article[@article-type='supplementary-material']",
-                )
-            )
-
-            records.append(
-                {
-                    "pmcid": pmcid_text,
-                    "fullXML": xml_str,
-                    "isFullText": has_body,
-                    "hasSuppMat": has_supp,
-                    "xmlKind": _classify_pubmed_xml(xml_str),
-                }
-            )
-            seen.add(pmcid_text)
-                     
+            if slice_xml:
+                for art, raw in _iter_article_slices(response, "article",
+                                                     stream=stream):
+                    parsed.append(_pmc_xml_record(art, keep_xml=False, chunks=chunks))
+                    if keep_xml:
+                        parsed[-1]["fullXML"] = raw
+            else:
+                for art in _iter_articles(response, "article", stream=stream):
+                    parsed.append(_pmc_xml_record(art, keep_xml=keep_xml,
+                                                  chunks=chunks))
+        except (ET.ParseError, requests.RequestException) as e:
+            logger.error(f"XML parse error for {ids}: {e}")
+            raise _batch_failure(e, partial=parsed,
+                                 done={r["pmcid"] for r in parsed}) from e
+        return parsed
 
-        # ── Placeholder rows for IDs not returned ─────────────
+    # ── Main loop ─────────────────────────────────────────────
+    for start in range(0, len(norm_ids), batch_size):
+        chunk = norm_ids[start:start + batch_size]
+        batch_records, batch_errors, batch_recovery = _fetch_bisecting(chunk, _attempt)
+        records.extend(batch_records)
+        errors.update(batch_errors)
+        recovery += batch_recovery
+
+        # ── Placeholder rows: failed IDs, then IDs not returned ──
+        seen = {rec["pmcid"] for rec in batch_records}
         for cid in chunk:
-            if cid not in seen:
+            if cid in batch_errors or cid not in seen:
+                failed = cid in batch_errors
                 records.append(
                     {
                         "pmcid": cid,
                         "fullXML": "N/A",
-                        "isFullText": pd.NA,
-                        "hasSuppMat": pd.NA,
+                        "fullText": "N/A",
+                        "isFullText": False if failed else pd.NA,
+                        "hasSuppMat": False if failed else pd.NA,
                         "xmlKind": "unknown",
+                        "textChunks": [],
                     }
                 )
 
-        time.sleep(delay)
-        
-    # 1) build the DataFrame
-    df = pd.DataFrame(records)
-
-    # 2) add the extracted text column
-    df['fullText'] = df['fullXML'].apply(extract_full_text_from_xml)
-
-    # 3) enforce your nullable dtypes (including fullText) and return
-    return df.astype(
-        {
-            "pmcid": "string",
-            "fullXML": "string",
-            "fullText": "string",
-            "isFullText": "boolean",
-            "hasSuppMat": "boolean",
-            "xmlKind": "string",
-        }
-    )
+    columns = [*dtypes] + (["textChunks"] if chunks else [])
+    df = pd.DataFrame(records).reindex(columns=columns)
+    return _batch_report(df, errors, recovery).astype(dtypes)
 
 
 
@@ -939,6 +1903,8 @@ def get_pmc_html_text(
     timeout: int = 20,
     max_retries: int = 3,
     delay: float = 0.5,
+    cache: ResponseCache | None = None,
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """
     ------------------------------------------------------------------------
@@ -956,6 +1922,11 @@ def get_pmc_html_text(
         Attempts per article on HTTP 429 / 5xx before giving up.
     delay : float, default 0.5 s
         Base pause between retries (multiplied by 2**attempt).
+    cache : ResponseCache, optional
+        Persistent response cache (see :mod:`searchpubmed.cache`).
+    max_workers : int, default 1
+        Fetch and parse this many articles concurrently, through one pooled
+        keep-alive session.  The per-host rate limit still applies.
 
     Returns
     -------
@@ -967,7 +1938,9 @@ def get_pmc_html_text(
         ``scrapeMsg``  | string   (empty on success, diagnostic message on failure)
 
         The frame always contains one row per requested PMCID, in the order
-        they were supplied.
+        they were supplied.  Expired cache entries are revalidated with
+        ``If-None-Match`` / ``If-Modified-Since``; ``frame.attrs["revalidation"]``
+        holds the :class:`~searchpubmed.cache.RevalidationStats` of the call.
     """
     # ── Guard clause ────────────────────────────────────────────
     if not pmcids:
@@ -985,23 +1958,34 @@ def get_pmc_html_text(
             canon_ids.append(canon)
             seen.add(canon)
         canon_to_orig.setdefault(canon, orig)  # first occurrence wins
-    records = []
 
     base_tpl = "https://pmc.ncbi.nlm.nih.gov/articles/{pid}/?format=flat"
     headers = {
         "User-Agent": ("Mozilla/5.0 (compatible; PubMedCrawler/1.0; "
                        "+https://github.com/you/yourrepo)")
     }
-
-    # ── Main loop over individual IDs ───────────────────────────
-    for pid in canon_ids:  # use canonical value for the URL
+    limiter = get_rate_limiter(scope="pmc-html")
+    revalidation = RevalidationStats()
+    # concurrent mode: one keep-alive pool shared by all worker threads,
+    # closed on return unless it is the one installed by searchpubmed.aio
+    own = (_pooled_session(max_workers)
+           if max_workers > 1 and _POOLED_SESSION.get() is None else None)
+    http = _POOLED_SESSION.get() or own if max_workers > 1 else None
+
+    # ── Fetch + clean one article (runs in a worker thread) ─────
+    def _scrape(pid: str) -> tuple[str | None, str]:
         url = base_tpl.format(pid=pid)
         html_text: str | None = None
         msg = ""
 
         for attempt in range(1, max_retries + 1):
             try:
-                resp = requests.get(url, headers=headers, timeout=timeout)
+                resp = _cached(
+                    cache, "pmc-flat", {"id": pid},
+                    lambda extra: _limited(limiter, (http or _http()).get, url,
+                                           headers={**headers, **extra},
+                                           timeout=timeout),
+                    conditional=True, revalidation=revalidation)
                 if resp.status_code in (403, 429) and attempt < max_retries:
                     wait = delay * (2**(attempt - 1))
                     logger.warning(
@@ -1011,20 +1995,15 @@ def get_pmc_html_text(
                     continue
 
                 resp.raise_for_status()
-                soup = BeautifulSoup(resp.text, "html.parser")
-
-                # Prefer the content under #maincontent; fall back to full doc
-                main = soup.find(id="maincontent") or soup
-                # Keep HTML (with basic cleanup), not plain text:
-                #   – drop <script>, <style>, navigation junk
-                for tag in main.find_all(
-                    ["script", "style", "nav", "footer", "aside"]):
-                    tag.decompose()
-
-                html_text = str(main)  # raw HTML as str
+                # Keep HTML (with basic cleanup), not plain text: the
+                # #maincontent subtree (or the full doc) without <script>,
+                # <style> and navigation junk
+                html_text = _parse_page(resp, "main_html", cache=cache,
+                                        params={"id": pid},
+                                        revalidation=revalidation)
                 break  # success – leave retry loop
 
-            except (HTTPError, RequestException) as exc:
+            except (requests.HTTPError, requests.RequestException) as exc:
                 msg = f"{type(exc).__name__}: {exc}"
                 if attempt < max_retries:
                     wait = delay * (2**(attempt - 1))
@@ -1033,32 +2012,122 @@ def get_pmc_html_text(
                 logger.error(
                     f"{pid}: giving up after {max_retries} attempts – {msg}")
                 html_text = None
-            except Exception as exc:  # BeautifulSoup / unexpected
+            except Exception as exc:  # HTML parser / unexpected
                 msg = f"{type(exc).__name__}: {exc}"
                 logger.error(f"{pid}: parsing error – {msg}")
                 html_text = None
-            finally:
-                # avoid flooding PMC with rapid requests
-                time.sleep(0.1)
 
-        # map back to the exact value supplied by the caller
-        records.append({
+        return html_text, msg
+
+    # ── Main loop over individual IDs (order preserved) ─────────
+    try:
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(_scrape, canon_ids))
+        else:
+            results = [_scrape(pid) for pid in canon_ids]
+    finally:
+        if own is not None:
+            own.close()
+
+    # map back to the exact value supplied by the caller
+    records = [
+        {
             "pmcid": canon_to_orig.get(pid, pid),
             "htmlText": html_text or "N/A",
             "scrapeMsg": msg,
-        })
+        }
+        for pid, (html_text, msg) in zip(canon_ids, results)
+    ]
+
+    _log_revalidation("PMC flat HTML", revalidation)
+    df = pd.DataFrame(records).astype("string")
+    df.attrs["revalidation"] = asdict(revalidation)
+    return df
+
+
+_FULL_TEXT_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (compatible; PubMedCrawler/1.1; "
+                   "+https://github.com/OHDSI/searchpubmed)")
+}
+
 
-    return pd.DataFrame(records).astype("string")
+def _flat_html_text(pid: str, *, http, cache: ResponseCache | None,
+                    timeout: float,
+                    revalidation: RevalidationStats | None = None) -> str:
+    """Text of the ``<p>``s of the flat view of *pid*; raises on failure."""
+    url = f"https://pmc.ncbi.nlm.nih.gov/articles/{pid}/?format=flat"
+    r = _cached(cache, "pmc-flat", {"id": pid},
+                lambda extra: _limited(
+                    get_rate_limiter(scope="pmc-html"), http.get, url,
+                    headers={**_FULL_TEXT_HEADERS, **extra}, timeout=timeout),
+                conditional=True, revalidation=revalidation)
+    r.raise_for_status()
+    return _parse_page(r, "main_paragraph_text", cache=cache,
+                       params={"id": pid}, revalidation=revalidation)
+
+
+def _efetch_body_texts(ids: list[str], *, http, cache: ResponseCache | None,
+                       timeout: float, max_retries: int, delay: float,
+                       api_key: str | None = None,
+                       ) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    Text of the JATS ``<body>`` of each PMC article in *ids*, fetched with
+    one EFetch request (split and retried on failure, see
+    :func:`_fetch_bisecting`).  Returns ``(texts, errors)`` keyed by pmcid;
+    articles EFetch did not return are in neither.
+    """
+    url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+    limiter = get_rate_limiter(api_key)
+
+    def _attempt(part: list[str], first: bool) -> list[tuple[str, str]]:
+        params = {"db": "pmc", "id": ",".join(part), "retmode": "xml"}
+        if api_key:
+            params["api_key"] = api_key
+        r = _send_with_retries(
+            lambda: _cached(cache, "efetch", params,
+                            lambda: _limited(limiter, http.get, url, params=params,
+                                             headers=_FULL_TEXT_HEADERS,
+                                             timeout=timeout)),
+            max_retries=max_retries if first else 1, delay=delay,
+            label=f"EFetch of {len(part)} PMC articles from {part[0]}")
+        try:
+            root = ET.fromstring(_strip_default_ns(r.content))
+        except ET.ParseError as exc:
+            raise _batch_failure(exc) from exc
+        arts = [root] if root.tag == "article" else root.findall(".//article")
+        found = []
+        for n, art in enumerate(arts):
+            pid = _jats_pmcid(art)
+            if pid not in part and len(arts) == len(part):
+                pid = part[n]  # no usable <article-id>: rely on request order
+            body = art.find(".//body")
+            found.append((pid, ET.tostring(body, encoding="unicode",
+                                           method="text").strip()
+                          if body is not None else ""))
+        return found
+
+    found, errors, _ = _fetch_bisecting(ids, _attempt)
+    return dict(found), errors
 
 
 def get_pmc_full_text(pmcids: List[str] | str,
                       *,
                       xml_fallback_min_chars: int = 2_000,
-                      timeout: int = 20) -> dict[str, str]:
+                      timeout: int = 20,
+                      cache: ResponseCache | None = None,
+                      max_workers: int = 4,
+                      xml_batch_size: int = 200,
+                      max_retries: int = 3,
+                      delay: float = 0.34,
+                      return_source: bool = False,
+                      revalidation: RevalidationStats | None = None,
+                      ) -> dict[str, str] | dict[str, tuple[str, str]]:
     """
     Retrieve plain full-text for one or many PMCIDs:
-      1) try the “flat” HTML view,
-      2) fall back to the JATS <body> from EFetch.
+      1) try the “flat” HTML view of every article (concurrently),
+      2) fall back to the JATS <body> from EFetch for the articles whose
+         flat text is too short – in batches, not one request per article.
 
     Parameters
     ----------
@@ -1068,6 +2137,23 @@ def get_pmc_full_text(pmcids: List[str] | str,
         If the flat view yields fewer chars, we attempt XML and keep the longer.
     timeout : int, default 20
         Socket timeout for each HTTP request.
+    cache : ResponseCache, optional
+        Persistent response cache (see :mod:`searchpubmed.cache`).
+    max_workers : int, default 4
+        Flat-HTML pages fetched concurrently; the per-host rate limit still
+        applies.
+    xml_batch_size : int, default 200
+        PMCIDs per EFetch request of the XML fallback.  Failed batches are
+        split and retried as in :func:`get_pmc_full_xml`.
+    max_retries, delay
+        Retry policy of the EFetch requests (HTTP 429 / 5xx back-off).
+    return_source : bool, default False
+        Map each pmcid to ``(text, source)`` instead of the text alone;
+        *source* is ``"flat-html"``, ``"xml"`` or ``"none"``.
+    revalidation : RevalidationStats, optional
+        Expired flat pages in *cache* are always revalidated with conditional
+        requests; pass a stats object to read what that saved (bytes not
+        downloaded, parse time not spent) – the result is a plain dict.
 
     Returns
     -------
@@ -1077,69 +2163,61 @@ def get_pmc_full_text(pmcids: List[str] | str,
     # normalize to list
     if isinstance(pmcids, str):
         pmcids = [pmcids]
-
-    flat_tpl = "https://pmc.ncbi.nlm.nih.gov/articles/{pid}/?format=flat"
-    headers = {
-        "User-Agent": ("Mozilla/5.0 (compatible; PubMedCrawler/1.1; "
-                       "+https://github.com/OHDSI/searchpubmed)")
-    }
-
-    out: dict[str, str] = {}
-
-    for raw_id in pmcids:
-        pid = raw_id if str(raw_id).upper().startswith(
-            "PMC") else f"PMC{raw_id}"
-        text = ""
-        success = False
-
-        # ── step 1: flat HTML ──────────────────────────────────
-        try:
-            url = flat_tpl.format(pid=pid)
-            r = requests.get(url, headers=headers, timeout=timeout)
-            r.raise_for_status()
-            soup = BeautifulSoup(r.text, "html.parser")
-            main = soup.find(id="maincontent") or soup
-            flat_text = " ".join(
-                p.get_text(" ", strip=True) for p in main.find_all("p"))
-            text = flat_text.strip()
-            success = len(text) >= xml_fallback_min_chars
-            if success:
-                logger.info(f"{pid}: used flat HTML ({len(text):,} chars)")
-        except Exception as exc:
-            logger.warning(f"{pid}: flat view failed – {exc}")
-
-        # ── step 2: XML fallback if needed ─────────────────────
-        if not success:
+    pids = list(dict.fromkeys(
+        pid if str(pid).upper().startswith("PMC") else f"PMC{pid}" for pid in pmcids))
+
+    # captured here: worker threads do not see the context var.  Without a
+    # session from searchpubmed.aio, both phases share one of our own.
+    pooled = _POOLED_SESSION.get()
+    http = pooled or _pooled_session(max(max_workers, 1))
+    stats = revalidation if revalidation is not None else RevalidationStats()
+    try:
+        # ── phase 1: flat HTML, concurrently ───────────────────────
+        def _flat(pid: str) -> str:
             try:
-                # build a single URL so we don’t pass a params= kwarg
-                xml_url = (
-                    "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
-                    f"?db=pmc&id={pid}&retmode=xml")
-                r = requests.get(xml_url, headers=headers, timeout=timeout)
-                r.raise_for_status()
-
-                # strip default namespace and parse
-                xml_content = _strip_default_ns(r.content)
-                root = ET.fromstring(xml_content)
-                body = root.find(".//body")
-                xml_text = (ET.tostring(
-                    body, encoding="unicode", method="text").strip()
-                            if body is not None else "")
-
-                # keep whichever text is longer
-                if len(xml_text) > len(text):
-                    text = xml_text
-                logger.info(f"{pid}: XML fallback used ({len(text):,} chars)")
+                return _flat_html_text(pid, http=http, cache=cache, timeout=timeout,
+                                       revalidation=stats)
             except Exception as exc:
-                logger.error(f"{pid}: XML fallback failed – {exc}")
-
-        out[pid] = text or "N/A"
-        time.sleep(0.1)  # courtesy delay
-
-    return out
-
-
-def _scrape_pmc_standard_html(pmcid: str, *, timeout: int = 20) -> str:
+                logger.warning(f"{pid}: flat view failed – {exc}")
+                return ""
+
+        if max_workers > 1 and len(pids) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                texts = dict(zip(pids, pool.map(_flat, pids)))
+        else:
+            texts = {pid: _flat(pid) for pid in pids}
+        sources = {pid: "flat-html" if text else "none" for pid, text in texts.items()}
+        short = [pid for pid in pids if len(texts[pid]) < xml_fallback_min_chars]
+        logger.info(f"Flat HTML sufficed for {len(pids) - len(short)}/{len(pids)} "
+                    f"articles; {len(short)} need the XML fallback")
+        _log_revalidation("PMC flat HTML", stats)
+
+        # ── phase 2: batched XML fallback ──────────────────────────
+        for start in range(0, len(short), xml_batch_size):
+            found, errors = _efetch_body_texts(
+                short[start:start + xml_batch_size], http=http, cache=cache,
+                timeout=timeout, max_retries=max_retries, delay=delay)
+            for pid, xml_text in found.items():
+                # keep whichever text is longer
+                if pid in texts and len(xml_text) > len(texts[pid]):
+                    texts[pid], sources[pid] = xml_text, "xml"
+            for pid, code in errors.items():
+                logger.error(f"{pid}: XML fallback failed – {code}")
+    finally:
+        if pooled is None:
+            http.close()
+
+    if return_source:
+        return {pid: (texts[pid] or "N/A", sources[pid]) for pid in pids}
+    return {pid: texts[pid] or "N/A" for pid in pids}
+
+
+def _scrape_pmc_standard_html(pmcid: str,
+                              *,
+                              timeout: int = 20,
+                              cache: ResponseCache | None = None,
+                              http=None,
+                              revalidation: RevalidationStats | None = None) -> str:
     """
     Fetch the *regular* PMC HTML (not the `?format=flat` view) and return
     plain text.  Used only when both XML and flat-HTML versions are tiny.
@@ -1147,14 +2225,15 @@ def _scrape_pmc_standard_html(pmcid: str, *, timeout: int = 20) -> str:
     url = f"https://www.ncbi.nlm.nih.gov/pmc/articles/{pmcid}/"
     headers = {"User-Agent": "Mozilla/5.0 (PubMedCrawler/2.0)"}
     try:
-        r = requests.get(url, headers=headers, timeout=timeout)
+        r = _cached(cache, "pmc-html", {"id": pmcid},
+                    lambda extra: _limited(
+                        get_rate_limiter(scope="pmc-html"), (http or _http()).get,
+                        url, headers={**headers, **extra}, timeout=timeout),
+                    conditional=True, revalidation=revalidation)
         r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
-        # drop nav / scripts
-        for tag in soup.find_all(["script", "style", "nav", "footer",
-                                  "aside"]):
-            tag.decompose()
-        return soup.get_text(" ", strip=True)
+        return _parse_page(r, "page_text",  # minus nav / scripts
+                           cache=cache, params={"id": pmcid},
+                           revalidation=revalidation)
     except Exception as exc:
         logger.warning(f"{pmcid}: standard HTML scrape failed – {exc}")
         return "N/A"
@@ -1162,7 +2241,11 @@ def _scrape_pmc_standard_html(pmcid: str, *, timeout: int = 20) -> str:
 
 def get_pmc_licenses(pmcids: Iterable[str],
                      chunk_size: int = 200,
-                     timeout: int = 30) -> Dict[str, Optional[str]]:
+                     timeout: int = 30,
+                     *,
+                     cache: ResponseCache | None = None,
+                     revalidation: RevalidationStats | None = None,
+                     ) -> Dict[str, Optional[str]]:
     """
     Query the PMC OA Web-service and return the licence string
     (e.g. 'CC BY', 'CC BY-NC', 'NO-CC CODE', …) for every PMCID.
@@ -1173,6 +2256,10 @@ def get_pmc_licenses(pmcids: Iterable[str],
     chunk_size  : how many IDs to send in one HTTP request
                   (the service accepts up to ≈300; 200 is a safe default)
     timeout     : per-request timeout in seconds
+    cache       : optional persistent response cache (see searchpubmed.cache);
+                  expired entries are revalidated with a conditional request
+    revalidation: optional RevalidationStats the call's 304 savings are
+                  added to (expired entries are revalidated either way)
 
     Returns
     -------
@@ -1203,15 +2290,23 @@ def get_pmc_licenses(pmcids: Iterable[str],
 
     # hit the OA endpoint in chunks
     base = "https://www.ncbi.nlm.nih.gov/pmc/utils/oa/oa.fcgi"
+    limiter = get_rate_limiter()
+    stats = revalidation if revalidation is not None else RevalidationStats()
     for i in range(0, len(unique_ids), chunk_size):
         chunk = unique_ids[i:i + chunk_size]
+        params = {"id": ",".join(chunk)}
         try:
-            r = requests.get(
-                base,
-                params={"id": ",".join(chunk)},
-                timeout=timeout,
-                headers={"User-Agent": "pmc-licence-check/0.1"},
-            )
+            r = _cached(
+                cache, "oa", params,
+                lambda extra: _limited(
+                    limiter,
+                    _http().get,
+                    base,
+                    params=params,
+                    timeout=timeout,
+                    headers={"User-Agent": "pmc-licence-check/0.1", **extra},
+                ),
+                conditional=True, revalidation=stats)
             r.raise_for_status()
         except requests.RequestException as exc:
             # if the call fails, leave those IDs as None and continue
@@ -1225,6 +2320,7 @@ def get_pmc_licenses(pmcids: Iterable[str],
             if pid:
                 out[pid] = lic
 
+    _log_revalidation("PMC OA service", stats)
     return out
 
 
@@ -1238,45 +2334,47 @@ def extract_full_text_from_xml(xml_string: str) -> str:
     with double-newlines separating logical blocks.
     """
     # parse (will raise if truly malformed)
-    root = ET.fromstring(xml_string)
-
-    def local_name(elem):
-        # strip namespace, if present
-        return elem.tag.split('}', 1)[-1]
-
-    blocks = []
-
-    # 1) Abstracts (there may be multiple)
-    for abstr in root.iter():
-        if local_name(abstr) == "abstract":
-            # optional title
-            for child in list(abstr):
-                if local_name(child) == "title" and child.text and child.text.strip():
-                    blocks.append(child.text.strip())
-            # all paragraphs under this abstract
-            for p in abstr.iter():
-                if local_name(p) == "p":
-                    text = "".join(p.itertext()).strip()
-                    if text:
-                        blocks.append(text)
-
-    # 2) Body sections
-    for body in root.iter():
-        if local_name(body) == "body":
-            for sec in body.iter():
-                if local_name(sec) == "sec":
-                    # section heading
-                    for child in list(sec):
-                        if local_name(child) == "title" and child.text and child.text.strip():
-                            blocks.append(child.text.strip())
-                    # paragraphs in this section
-                    for p in sec.iter():
-                        if local_name(p) == "p":
-                            text = "".join(p.itertext()).strip()
-                            if text:
-                                blocks.append(text)
-
-    return "\n\n".join(blocks)
+    return _full_text_from_element(ET.fromstring(xml_string))
+
+
+def _full_text_from_element(root: ET.Element) -> str:
+    """
+    :func:`extract_full_text_from_xml` on an already parsed element.
+
+    One depth-first walk with an explicit stack: every element is visited
+    once, the section context travels with it, and a ``<p>`` is emitted
+    whole and not descended into – so nested ``<sec>``s and ``<p>``s never
+    repeat a paragraph, and the work stays linear in the size of the tree.
+    """
+    abstract_blocks: List[str] = []
+    body_blocks: List[str] = []
+
+    # (element, local name of parent, inside <abstract>, inside <body>,
+    #  inside a body <sec>)
+    stack = [(root, "", False, False, False)]
+    while stack:
+        elem, parent, in_abstract, in_body, in_sec = stack.pop()
+        name = elem.tag.split("}", 1)[-1] if isinstance(elem.tag, str) else ""
+        blocks = abstract_blocks if in_abstract else body_blocks
+
+        if name == "title" and (parent == "abstract" or (parent == "sec" and in_sec
+                                                         and not in_abstract)):
+            if elem.text and elem.text.strip():
+                blocks.append(elem.text.strip())
+            continue
+        if name == "p" and (in_abstract or in_sec):
+            text = "".join(elem.itertext()).strip()
+            if text:
+                blocks.append(text)
+            continue
+
+        in_abstract = in_abstract or name == "abstract"
+        in_body = in_body or name == "body"
+        in_sec = in_sec or (in_body and name == "sec")
+        stack.extend((child, name, in_abstract, in_body, in_sec)
+                     for child in reversed(elem))
+
+    return "\n\n".join(abstract_blocks + body_blocks)
 
 
 
@@ -1368,6 +2466,30 @@ def get_jats_text_chunks(
         fixed = re.sub(r"&(?!amp;|lt;|gt;|apos;|quot;)", "&amp;", xml_string)
         root = ET.fromstring(fixed)
 
+    return _jats_chunks_from_element(
+        root,
+        min_len=min_len,
+        keywords=keywords,
+        include_table_cells=include_table_cells,
+        include_tables=include_tables,
+        text_only=text_only,
+        include_abstract_headings=include_abstract_headings,
+        include_section_headings=include_section_headings,
+    )
+
+
+def _jats_chunks_from_element(
+    root: ET.Element,
+    *,
+    min_len: int = 40,
+    keywords: Union[None, str, Pattern, List[Union[str, Pattern]]] = None,
+    include_table_cells: bool = False,
+    include_tables: bool = False,
+    text_only: bool = False,
+    include_abstract_headings: bool = True,
+    include_section_headings: bool = True,
+) -> Union[List[str], List[Tuple[str, Dict[str, str]]]]:
+    """:func:`get_jats_text_chunks` on an already parsed ``<article>``."""
     # ------------------------------------------------------------------ #
     # 2.  Compile keyword regexes                                        #
     # ------------------------------------------------------------------ #
@@ -0,0 +1,143 @@
+"""searchpubmed.ratelimit – token-bucket limiter shared by threads *and*
+processes on one host.
+
+NCBI allows 3 E-utilities requests per second per IP, or 10 with an API
+key.  Every request site in :mod:`searchpubmed.pubmed` draws a token from
+the bucket returned by :func:`get_rate_limiter` right before it touches the
+network, so idle time is never wasted and concurrent notebooks or workers
+sharing one key stay within its budget together.
+
+Bucket state (tokens, timestamp) lives in a tiny file under the temp
+directory and is updated under an exclusive ``fcntl`` lock.  On platforms
+without ``fcntl`` the bucket is shared between threads only.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+try:  # POSIX only
+    import fcntl
+except ImportError:  # pragma: no cover – Windows
+    fcntl = None  # type: ignore[assignment]
+
+__all__ = ["RateLimiter", "get_rate_limiter"]
+
+_STATE = struct.Struct("<dd")  # tokens, wall-clock time of last update
+
+# Requests per second for the flat / standard PMC web pages, which sit
+# outside the E-utilities key budget.
+PMC_HTML_RATE = 5.0
+
+
+class RateLimiter:
+    """
+    Token bucket refilled at *rate* tokens per second, holding at most
+    *burst* tokens.
+
+    :meth:`acquire` reserves a token and sleeps only for as long as the
+    bucket is in debt, so callers queue up fairly instead of polling.
+
+    Parameters
+    ----------
+    rate : float
+        Sustained requests per second.
+    burst : float, default 1
+        Bucket capacity – how many requests may go out back-to-back after
+        an idle period.  ``1`` never exceeds *rate* in any one-second window.
+    path : path-like, optional
+        State file shared by every process using the same bucket.  ``None``
+        keeps the bucket in-process.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        burst: float = 1.0,
+        path: Union[str, os.PathLike, None] = None,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.path = Path(path) if path is not None and fcntl is not None else None
+        self._lock = threading.Lock()
+        self._state: Tuple[float, float] = (self.burst, 0.0)
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _reserve(self, tokens: float, last: float, now: float) -> Tuple[float, float]:
+        if last:
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+        else:
+            tokens = self.burst
+        return tokens - 1.0, now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available.  Returns the wait."""
+        with self._lock:
+            if self.path is None:
+                self._state = self._reserve(*self._state, time.time())
+                tokens = self._state[0]
+            else:
+                # a fresh descriptor per call: flock() does not separate
+                # descriptors inherited across fork()
+                with open(self.path, "a+b") as fh:
+                    fcntl.flock(fh, fcntl.LOCK_EX)
+                    fh.seek(0)
+                    raw = fh.read(_STATE.size)
+                    state = _STATE.unpack(raw) if len(raw) == _STATE.size else (
+                        self.burst, 0.0)
+                    tokens, now = self._reserve(*state, time.time())
+                    fh.seek(0)
+                    fh.truncate()
+                    fh.write(_STATE.pack(tokens, now))
+                    fh.flush()
+        wait = -tokens / self.rate if tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+_REGISTRY: Dict[Tuple[str, Optional[str]], RateLimiter] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_rate_limiter(
+    api_key: Optional[str] = None,
+    *,
+    scope: str = "eutils",
+) -> RateLimiter:
+    """
+    Return the process-wide limiter for *scope* (and *api_key*).
+
+    ``"eutils"`` – E-utilities, ID Converter and OA service: 3 req s⁻¹, or
+    10 req s⁻¹ when *api_key* is set, shared by every process on the host
+    using the same key.  ``"pmc-html"`` – PMC article pages:
+    ``PMC_HTML_RATE`` req s⁻¹ per host.
+
+    The state directory defaults to ``<tmp>/searchpubmed-ratelimit`` and
+    can be moved with the ``SEARCHPUBMED_RATELIMIT_DIR`` environment variable.
+    """
+    if scope == "eutils":
+        rate = 10.0 if api_key else 3.0
+        tag = hashlib.sha256(api_key.encode()).hexdigest()[:16] if api_key else "anon"
+    else:
+        api_key, rate, tag = None, PMC_HTML_RATE, "host"
+
+    with _REGISTRY_LOCK:
+        limiter = _REGISTRY.get((scope, api_key))
+        if limiter is None:
+            state_dir = Path(os.environ.get(
+                "SEARCHPUBMED_RATELIMIT_DIR",
+                Path(tempfile.gettempdir()) / "searchpubmed-ratelimit"))
+            limiter = RateLimiter(rate, path=state_dir / f"{scope}-{tag}.bucket")
+            _REGISTRY[(scope, api_key)] = limiter
+        return limiter
@@ -0,0 +1,242 @@
+"""searchpubmed.sink – stream results into a partitioned Parquet dataset.
+
+The fetchers return all-``string`` pandas frames; for corpus-sized pulls
+those frames (and their ``fullXML`` / ``fullText`` columns in particular)
+are better written out batch by batch than concatenated in memory.
+:class:`ParquetSink` appends each batch to a hive-partitioned dataset –
+by batch number or by publication year – as Arrow ``string`` columns, or
+``large_string`` for the full-text columns, and keeps a unified schema in
+``_common_metadata`` so later batches may add columns::
+
+    import pyarrow.dataset as ds
+    from searchpubmed.sink import write_pubmed_metadata
+
+    sink = write_pubmed_metadata(pmids, "out/metadata", partition_by="year")
+    table = sink.dataset().to_table(filter=ds.field("year") == "2021")
+
+Requires the optional ``pyarrow`` dependency
+(``pip install 'searchpubmed[parquet]'``).
+"""
+from __future__ import annotations
+
+import os
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Sequence, Union
+
+from . import pubmed
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+__all__ = ["ParquetSink", "write_pubmed_metadata", "write_pmc_full_xml"]
+
+# Columns stored as ``large_string`` – one batch of full texts can outgrow the
+# 2 GiB offset limit of a plain ``string`` array.
+LARGE_TEXT_COLUMNS = frozenset({"fullXML", "fullText", "htmlText"})
+
+_PARTITION_TYPES = {"batch": "int32", "year": "string"}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError(
+            "searchpubmed.sink needs pyarrow – "
+            "pip install 'searchpubmed[parquet]'") from exc
+    return pa, pc, ds, pq
+
+
+class ParquetSink:
+    """
+    Append-only writer for a hive-partitioned Parquet dataset.
+
+    Parameters
+    ----------
+    root : path-like
+        Dataset directory; created if missing.  An existing dataset is
+        appended to, its schema taken from ``root/_common_metadata``.
+    partition_by : {"batch", "year", None}, default "batch"
+        ``"batch"`` writes every :meth:`write` call to ``batch=<n>/``;
+        ``"year"`` splits rows into ``year=<YYYY>/`` by the first four
+        characters of *date_column* (``year=unknown`` when not a year);
+        ``None`` writes flat files.
+    date_column : str, default "publicationDate"
+        Source column for ``partition_by="year"``.
+    compression : str, default "zstd"
+        Parquet codec.
+
+    Attributes
+    ----------
+    schema : pyarrow.Schema | None
+        Union of every batch schema written so far (partition column
+        excluded).
+    batches, rows : int
+        Batches and rows written through this sink (``batches`` continues
+        the numbering of an existing ``batch=`` dataset).
+    """
+
+    def __init__(
+        self,
+        root: Union[str, os.PathLike],
+        *,
+        partition_by: Optional[str] = "batch",
+        date_column: str = "publicationDate",
+        compression: str = "zstd",
+    ) -> None:
+        if partition_by not in (*_PARTITION_TYPES, None):
+            raise ValueError(f"partition_by must be 'batch', 'year' or None, "
+                             f"not {partition_by!r}")
+        self._pa, self._pc, self._ds, self._pq = _require_pyarrow()
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.partition_by = partition_by
+        self.date_column = date_column
+        self.compression = compression
+
+        meta = self.root / "_common_metadata"
+        self.schema: Optional[pa.Schema] = (
+            self._pq.read_schema(meta) if meta.exists() else None)
+        self.batches = (len(list(self.root.glob("batch=*")))
+                        if partition_by == "batch" else 0)
+        self.rows = 0
+        self._token = uuid.uuid4().hex[:8]  # keeps appended file names unique
+
+    # ------------------------------------------------------------------ #
+    def _to_arrow(self, data: Any) -> pa.Table:
+        """Arrow table with string / large_string text columns, no pandas metadata."""
+        pa = self._pa
+        if isinstance(data, pa.Table):
+            table = data
+        elif isinstance(data, list):
+            table = pa.Table.from_pylist(data)
+        else:
+            table = pa.Table.from_pandas(data, preserve_index=False)
+
+        known = set(self.schema.names) if self.schema is not None else set()
+        fields = []
+        for field in table.schema:
+            typ = field.type
+            if pa.types.is_null(typ) and field.name in known:
+                typ = self.schema.field(field.name).type  # all-null batch
+            elif pa.types.is_string(typ) or pa.types.is_large_string(typ) or \
+                    pa.types.is_null(typ):
+                typ = (pa.large_string() if field.name in LARGE_TEXT_COLUMNS
+                       else pa.string())
+            fields.append(pa.field(field.name, typ))
+        return table.cast(pa.schema(fields))
+
+    def _partition_column(self, table: pa.Table) -> pa.Array:
+        pa, pc = self._pa, self._pc
+        if self.partition_by == "batch":
+            return pa.array([self.batches] * table.num_rows, pa.int32())
+        if self.date_column not in table.column_names:
+            raise ValueError(f"partition_by='year' needs a {self.date_column!r} column")
+        year = pc.utf8_slice_codeunits(table[self.date_column], 0, 4)
+        is_year = pc.fill_null(pc.match_substring_regex(year, r"^\d{4}$"), False)
+        return pc.if_else(is_year, year, "unknown")
+
+    def write(self, data: Union[pd.DataFrame, pa.Table, List[dict]]) -> int:
+        """
+        Append one batch – a DataFrame, Arrow table or list of records – and
+        return the number of rows written.
+
+        New columns extend the dataset schema; a column whose type changes
+        raises ``pyarrow.ArrowTypeError``.
+        """
+        pa, ds = self._pa, self._ds
+        table = self._to_arrow(data)
+        if table.num_rows == 0:
+            return 0
+        schema = (table.schema if self.schema is None
+                  else pa.unify_schemas([self.schema, table.schema]))
+
+        partitioning = None
+        if self.partition_by is not None:
+            table = table.append_column(self.partition_by,
+                                        self._partition_column(table))
+            partitioning = ds.partitioning(
+                pa.schema([(self.partition_by,
+                            _PARTITION_TYPES[self.partition_by])]),
+                flavor="hive")
+
+        ds.write_dataset(
+            table, self.root,
+            format="parquet",
+            partitioning=partitioning,
+            basename_template=f"part-{self._token}-{self.batches:05d}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+            file_options=ds.ParquetFileFormat().make_write_options(
+                compression=self.compression),
+        )
+        self._pq.write_metadata(schema, self.root / "_common_metadata")
+        self.schema = schema
+        self.batches += 1
+        self.rows += table.num_rows
+        return table.num_rows
+
+    def dataset(self) -> ds.Dataset:
+        """The dataset written so far, read with the unified schema."""
+        pa, ds = self._pa, self._ds
+        if self.schema is None:
+            raise ValueError(f"no batches written to {self.root}")
+        schema, partitioning = self.schema, None
+        if self.partition_by is not None:
+            part = pa.field(self.partition_by, _PARTITION_TYPES[self.partition_by])
+            schema = schema.append(part)
+            partitioning = ds.partitioning(pa.schema([part]), flavor="hive")
+        return ds.dataset(self.root, format="parquet", schema=schema,
+                          partitioning=partitioning)
+
+
+def write_pubmed_metadata(
+    ids: Iterable[str],
+    root: Union[str, os.PathLike],
+    *,
+    id_type: str = "pmid",
+    partition_by: Optional[str] = "year",
+    **kwargs: Any,
+) -> ParquetSink:
+    """
+    Fetch PubMed metadata batch by batch straight into a Parquet dataset.
+
+    *ids* are PMIDs (``id_type="pmid"``) or PMCIDs (``id_type="pmcid"``);
+    *kwargs* go to :func:`~searchpubmed.pubmed.iter_pubmed_metadata_pmid` /
+    :func:`~searchpubmed.pubmed.iter_pubmed_metadata_pmcid`.  Only one batch
+    is in memory at a time.  Returns the sink for reading the result back.
+    """
+    if id_type not in ("pmid", "pmcid"):
+        raise ValueError(f"id_type must be 'pmid' or 'pmcid', not {id_type!r}")
+    fetch = (pubmed.iter_pubmed_metadata_pmid if id_type == "pmid"
+             else pubmed.iter_pubmed_metadata_pmcid)
+    sink = ParquetSink(root, partition_by=partition_by)
+    for frame in fetch(list(ids), **kwargs):
+        sink.write(frame)
+    return sink
+
+
+def write_pmc_full_xml(
+    pmcids: Sequence[str],
+    root: Union[str, os.PathLike],
+    *,
+    batch_size: int = 200,
+    partition_by: Optional[str] = "batch",
+    **kwargs: Any,
+) -> ParquetSink:
+    """
+    Fetch JATS XML (and its extracted ``fullText``) batch by batch with
+    :func:`~searchpubmed.pubmed.get_pmc_full_xml` straight into a Parquet
+    dataset.  Returns the sink.
+    """
+    pmcids = list(pmcids)
+    sink = ParquetSink(root, partition_by=partition_by)
+    for start in range(0, len(pmcids), batch_size):
+        sink.write(pubmed.get_pmc_full_xml(pmcids[start:start + batch_size],
+                                           batch_size=batch_size, **kwargs))
+    return sink
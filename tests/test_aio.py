@@ -0,0 +1,116 @@
+"""
+tests/test_aio.py
+
+AsyncPubMed runs batches concurrently on one pooled session and returns
+the same frames as the synchronous API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+import requests
+from pandas.testing import assert_frame_equal
+
+import searchpubmed.pubmed as p
+from searchpubmed.aio import AsyncPubMed
+
+
+class _Resp:
+    def __init__(self, content: bytes):
+        self.content = content
+        self.text = content.decode()
+        self.status_code = 200
+        self.ok = True
+
+    def raise_for_status(self):
+        pass
+
+
+def _efetch(pmids):
+    arts = "".join(
+        f"<PubmedArticle><MedlineCitation><PMID>{i}</PMID><Article>"
+        f"<ArticleTitle>T{i}</ArticleTitle></Article></MedlineCitation></PubmedArticle>"
+        for i in pmids)
+    return _Resp(f"<PubmedArticleSet>{arts}</PubmedArticleSet>".encode())
+
+
+@pytest.fixture
+def fake_network(monkeypatch):
+    monkeypatch.setattr(p.time, "sleep", lambda *_: None)
+    seen = {"sessions": set(), "active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def fake_get(session, url, params=None, **_kw):
+        with lock:
+            seen["sessions"].add(id(session))
+            seen["active"] += 1
+            seen["peak"] = max(seen["peak"], seen["active"])
+        threading.Event().wait(0.05)  # time.sleep is patched out
+        with lock:
+            seen["active"] -= 1
+        if "efetch" in url:
+            return _efetch(params["id"].split(","))
+        pid = url.split("/articles/")[1].split("/")[0]
+        return _Resp(f"<div id='maincontent'><p>{pid}</p></div>".encode())
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    return seen
+
+
+def test_metadata_matches_sync(fake_network):
+    pmids = [str(i) for i in range(10, 0, -1)]
+
+    async def run():
+        async with AsyncPubMed(max_in_flight=4) as client:
+            return await client.get_pubmed_metadata_pmid(pmids, batch_size=2)
+
+    got = asyncio.run(run())
+    expected = p.get_pubmed_metadata_pmid(pmids)
+
+    assert_frame_equal(got, expected)
+    assert fake_network["peak"] > 1  # batches overlapped
+
+
+def test_html_keeps_order_and_pools_session(fake_network):
+    ids = ["PMC3", "1", "PMC2", "PMC1"]
+
+    async def run():
+        client = AsyncPubMed(max_in_flight=3)
+        try:
+            return await client.get_pmc_html_text(ids), client
+        finally:
+            client.close()
+
+    df, client = asyncio.run(run())
+
+    assert df.pmcid.tolist() == ["PMC3", "1", "PMC2"]  # "PMC1" duplicates "1"
+    assert "PMC2" in df.loc[2, "htmlText"]
+    assert fake_network["sessions"] == {id(client._session)}
+    assert fake_network["peak"] <= 3
+
+
+def test_html_cache_override_and_revalidation_report(monkeypatch):
+    import pandas as pd
+
+    caches = []
+
+    def fake_html(ids, *, cache=None):
+        caches.append(cache)
+        df = pd.DataFrame({"pmcid": ids, "htmlText": ["x"]})
+        df.attrs["revalidation"] = {"requests": 1, "not_modified": 1,
+                                    "bytes_saved": 10, "parse_seconds_saved": 0.5}
+        return df
+
+    monkeypatch.setattr(p, "get_pmc_html_text", fake_html)
+
+    async def run():
+        async with AsyncPubMed(max_in_flight=2, cache="default") as client:
+            return await client.get_pmc_html_text(["PMC1", "PMC2"], cache="mine")
+
+    df = asyncio.run(run())
+    assert caches == ["mine", "mine"]
+    assert df.attrs["revalidation"] == {"requests": 2, "not_modified": 2,
+                                        "bytes_saved": 20, "parse_seconds_saved": 1.0}
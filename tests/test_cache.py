@@ -0,0 +1,247 @@
+"""
+tests/test_cache.py
+
+ResponseCache behaviour (TTL, LRU eviction, key normalisation) and its use
+through the public ``cache=`` argument.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+import requests
+
+import searchpubmed.pubmed as p
+from searchpubmed.cache import ResponseCache
+
+
+class _Resp:
+    def __init__(self, content: bytes, code: int = 200):
+        self.content = content
+        self.text = content.decode()
+        self.status_code = code
+        self.ok = code == 200
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(response=self)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = ResponseCache(tmp_path / "http.sqlite")
+    yield c
+    c.close()
+
+
+@pytest.fixture(autouse=True)
+def _fast(monkeypatch):
+    monkeypatch.setattr(p.time, "sleep", lambda *_: None)
+
+
+def test_roundtrip_and_key_normalisation(cache):
+    cache.set("efetch", {"db": "pmc", "id": "1,2", "api_key": "secret"}, b"<x/>" * 100)
+
+    # parameter order and api_key do not matter
+    assert cache.get("efetch", {"id": "1,2", "db": "pmc"}) == b"<x/>" * 100
+    assert cache.get("efetch", {"id": "1,3", "db": "pmc"}) is None
+    assert cache.get("elink", {"id": "1,2", "db": "pmc"}) is None
+
+    # stored compressed
+    db = sqlite3.connect(cache.path)
+    assert db.execute("SELECT size FROM responses").fetchone()[0] < 400
+
+
+def test_per_endpoint_ttl(tmp_path, monkeypatch):
+    c = ResponseCache(tmp_path / "ttl.sqlite", ttls={"esearch": 10})
+    now = [1_000.0]
+    monkeypatch.setattr("searchpubmed.cache.time.time", lambda: now[0])
+    c.set("esearch", {"term": "x"}, b"a")
+    c.set("efetch", {"id": "1"}, b"b")
+
+    now[0] += 60
+    assert c.get("esearch", {"term": "x"}) is None  # expired after 10 s
+    assert c.get("efetch", {"id": "1"}) == b"b"      # 30-day default
+
+
+def test_lru_eviction(tmp_path, monkeypatch):
+    c = ResponseCache(tmp_path / "lru.sqlite", max_bytes=70, compress_level=0)
+    now = [0.0]
+    monkeypatch.setattr("searchpubmed.cache.time.time", lambda: now[0])
+    for key in ("a", "b"):
+        now[0] += 1
+        c.set("efetch", {"id": key}, b"x" * 20)
+    now[0] += 1
+    c.get("efetch", {"id": "a"})  # "a" is now the most recently used
+    now[0] += 1
+    c.set("efetch", {"id": "c"}, b"x" * 20)
+
+    assert c.get("efetch", {"id": "b"}) is None
+    assert c.get("efetch", {"id": "a"}) is not None
+    assert len(c) == 2
+
+
+def test_running_size_total(tmp_path, monkeypatch):
+    c = ResponseCache(tmp_path / "sz.sqlite", max_bytes=1_000, compress_level=0)
+    now = [0.0]
+    monkeypatch.setattr("searchpubmed.cache.time.time", lambda: now[0])
+    for i in range(100):
+        now[0] += 1
+        c.set("efetch", {"id": str(i % 60)}, b"x" * 90)  # later ones replace rows
+
+    stored = sqlite3.connect(c.path).execute("SELECT SUM(size) FROM responses")
+    assert c._total == stored.fetchone()[0] <= 1_000
+    assert c.get("efetch", {"id": "39"}) is not None  # the newest rows survive
+    assert c.get("efetch", {"id": "20"}) is None
+    assert ResponseCache(c.path)._total == c._total  # reloaded on open
+    c.clear()
+    assert c._total == 0
+
+
+def test_metadata_served_from_cache(monkeypatch, cache):
+    xml = (b"<PubmedArticleSet><PubmedArticle><MedlineCitation><PMID>7</PMID>"
+           b"<Article><ArticleTitle>T</ArticleTitle></Article></MedlineCitation>"
+           b"</PubmedArticle></PubmedArticleSet>")
+    calls = []
+    monkeypatch.setattr(p.requests.Session, "get",
+                        lambda *_a, **_k: calls.append(1) or _Resp(xml))
+
+    first = p.get_pubmed_metadata_pmid(["7"], cache=cache, api_key="k1")
+    second = p.get_pubmed_metadata_pmid(["7"], cache=cache, api_key="k2")
+
+    assert len(calls) == 1
+    assert first.equals(second) and second.loc[0, "title"] == "T"
+    assert cache.hits == 1
+
+
+def test_failures_are_not_cached(monkeypatch, cache):
+    monkeypatch.setattr(p.requests, "get", lambda *_a, **_k: _Resp(b"no", 500))
+    p.get_pmc_html_text(["PMC9"], max_retries=1, cache=cache)
+    assert len(cache) == 0
+
+    html = b"<html><div id='maincontent'><p>ok</p></div></html>"
+    monkeypatch.setattr(p.requests, "get", lambda *_a, **_k: _Resp(html))
+    p.get_pmc_html_text(["PMC9"], cache=cache)
+    monkeypatch.setattr(p.requests, "get", lambda *_a, **_k: pytest.fail("network"))
+    df = p.get_pmc_html_text(["PMC9"], cache=cache)
+    assert "ok" in df.loc[0, "htmlText"]
+
+
+class _Page(_Resp):
+    def __init__(self, content: bytes, code: int = 200, headers=None):
+        super().__init__(content, code)
+        self.headers = headers or {}
+
+
+def test_validators_survive_migration(tmp_path):
+    path = tmp_path / "old.sqlite"
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE responses (key TEXT PRIMARY KEY, endpoint TEXT, "
+               "created REAL, accessed REAL, size INTEGER, body BLOB)")
+    db.commit()
+    db.close()
+
+    c = ResponseCache(path)
+    c.set("oa", {"id": "PMC1"}, b"<OA/>", validators={"ETag": '"v1"'})
+    c.set("oa", {"id": "PMC2"}, b"<OA/>")
+    assert c.get_stale("oa", {"id": "PMC1"}) == (b"<OA/>", {"ETag": '"v1"'})
+    assert c.get_stale("oa", {"id": "PMC2"}) is None  # nothing to revalidate with
+    c.close()
+
+
+def test_not_modified_is_served_from_cache(monkeypatch, tmp_path):
+    c = ResponseCache(tmp_path / "rv.sqlite", ttls={"pmc-flat": 10})
+    now = [1_000.0]
+    monkeypatch.setattr("searchpubmed.cache.time.time", lambda: now[0])
+    html = b"<html><div id='maincontent'><p>unchanged</p></div></html>"
+    validators = {"ETag": '"abc"', "Last-Modified": "Tue, 01 Oct 2024 00:00:00 GMT"}
+    sent = []
+
+    def get(url, headers=None, **_k):
+        sent.append(headers)
+        if headers.get("If-None-Match") == '"abc"':
+            return _Page(b"", 304)
+        return _Page(html, headers=validators)
+
+    monkeypatch.setattr(p.requests, "get", get)
+    first = p.get_pmc_html_text(["PMC5"], cache=c)
+    assert "If-None-Match" not in sent[0]
+    assert first.attrs["revalidation"]["requests"] == 0
+
+    now[0] += 60  # expired: revalidate instead of downloading again
+    with monkeypatch.context() as m:
+        m.setattr(p.htmlparse, "main_html", lambda _h: pytest.fail("reparsed"))
+        second = p.get_pmc_html_text(["PMC5"], cache=c)
+
+    assert sent[1]["If-None-Match"] == '"abc"'
+    assert sent[1]["If-Modified-Since"] == validators["Last-Modified"]
+    assert second.loc[0, "htmlText"] == first.loc[0, "htmlText"]
+    stats = second.attrs["revalidation"]
+    assert stats["requests"] == stats["not_modified"] == 1
+    assert stats["bytes_saved"] == len(html)
+    assert stats["parse_seconds_saved"] > 0
+
+    # the 304 renewed the entry: fresh again, no request at all
+    p.get_pmc_html_text(["PMC5"], cache=c)
+    assert len(sent) == 2
+    c.close()
+
+
+def test_changed_page_replaces_entry(monkeypatch, tmp_path):
+    c = ResponseCache(tmp_path / "rv.sqlite", ttls={"oa": 10})
+    now = [1_000.0]
+    monkeypatch.setattr("searchpubmed.cache.time.time", lambda: now[0])
+    versions = iter([
+        _Page(b'<OA><record pmcid="PMC1" license="CC BY"/></OA>',
+              headers={"ETag": '"1"'}),
+        _Page(b'<OA><record pmcid="PMC1" license="CC0"/></OA>',
+              headers={"ETag": '"2"'}),
+    ])
+    sent = []
+
+    def get(*_a, headers=None, **_k):
+        sent.append(headers)
+        return next(versions)
+
+    monkeypatch.setattr(p.requests, "get", get)
+
+    assert p.get_pmc_licenses(["PMC1"], cache=c) == {"PMC1": "CC BY"}
+    now[0] += 60
+    stats = p.RevalidationStats()
+    assert p.get_pmc_licenses(["PMC1"], cache=c, revalidation=stats) == {"PMC1": "CC0"}
+    assert sent[1]["If-None-Match"] == '"1"'
+    assert (stats.requests, stats.not_modified, stats.bytes_saved) == (1, 0, 0)
+    assert c.get_stale("oa", {"id": "PMC1"})[1] == {"ETag": '"2"'}
+    c.close()
+
+
+def test_full_text_revalidates_without_stats(monkeypatch, tmp_path):
+    c = ResponseCache(tmp_path / "rv.sqlite", ttls={"pmc-flat": 10})
+    now = [1_000.0]
+    monkeypatch.setattr("searchpubmed.cache.time.time", lambda: now[0])
+    html = b"<html><div id='maincontent'><p>" + b"word " * 500 + b"</p></div></html>"
+    sent = []
+
+    def get(url, headers=None, **_k):
+        sent.append(headers)
+        if headers.get("If-None-Match") == '"e1"':
+            return _Page(b"", 304)
+        return _Page(html, headers={"ETag": '"e1"'})
+
+    monkeypatch.setattr(p.requests, "get", get)
+    monkeypatch.setattr(p.requests.Session, "get", lambda _s, *a, **k: get(*a, **k))
+    first = p.get_pmc_full_text("PMC7", cache=c)
+    assert c.get_stale("pmc-flat", {"id": "PMC7"})[1] == {"ETag": '"e1"'}
+
+    # the entry written by get_pmc_full_text is revalidated by get_pmc_html_text
+    now[0] += 60
+    df = p.get_pmc_html_text(["PMC7"], cache=c)
+    assert sent[-1]["If-None-Match"] == '"e1"'
+    assert df.attrs["revalidation"]["not_modified"] == 1
+    assert "word" in df.loc[0, "htmlText"]
+
+    now[0] += 60
+    assert p.get_pmc_full_text("PMC7", cache=c) == first
+    assert sent[-1]["If-None-Match"] == '"e1"' and len(sent) == 3
+    c.close()
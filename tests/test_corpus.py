@@ -0,0 +1,78 @@
+"""
+tests/test_corpus.py
+
+chunk_jats_corpus fans JATS chunking out over worker processes and returns
+one long-format table in input order, with per-article errors.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from searchpubmed.corpus import (CHUNK_COLUMNS, chunk_jats_corpus,
+                                 iter_jats_corpus_chunks)
+from searchpubmed.pubmed import extract_full_text_from_xml, get_jats_text_chunks
+
+
+def _article(i: int) -> str:
+    return (f"<article><front><article-title>Title {i}</article-title></front><body>"
+            f"<sec><title>Methods</title><p>Paragraph one of article {i}.</p>"
+            f"<p>Paragraph two of article {i}.</p></sec></body></article>")
+
+
+ARTICLES = [(f"PMC{i}", _article(i)) for i in range(12)]
+
+
+def test_rows_match_single_article_api_in_order():
+    df = chunk_jats_corpus(ARTICLES, processes=0, min_len=1)
+
+    assert list(df.columns) == list(CHUNK_COLUMNS)
+    assert df.pmcid.unique().tolist() == [pmcid for pmcid, _ in ARTICLES]
+    one = df[df.pmcid == "PMC3"]
+    expected = get_jats_text_chunks(_article(3), min_len=1)
+    assert one.text.tolist() == [text for text, _ in expected]
+    assert one.chunk.tolist() == list(range(len(expected)))
+    assert one.section.tolist() == [meta["section"] for _, meta in expected]
+    assert df.error.isna().all()
+
+
+def test_process_pool_is_deterministic():
+    serial = chunk_jats_corpus(ARTICLES, processes=0, min_len=1)
+    pooled = chunk_jats_corpus(iter(ARTICLES), processes=2, chunksize=1, min_len=1)
+    pd.testing.assert_frame_equal(serial, pooled)
+
+
+def test_errors_are_recorded_per_article():
+    frame = pd.DataFrame({"pmcid": ["PMC1", "PMC2", "PMC3", "PMC4"],
+                          "fullXML": [_article(1), "N/A", "<article><p>", _article(4)]})
+    df = chunk_jats_corpus(frame, processes=0)
+
+    errors = df.set_index("pmcid").error.dropna()
+    assert errors.index.tolist() == ["PMC2", "PMC3"]
+    assert errors["PMC2"] == "ValueError: no XML"
+    assert errors["PMC3"].startswith("ParseError")
+    assert df[df.pmcid == "PMC2"].text.isna().all()
+    assert {"PMC1", "PMC4"} <= set(df.pmcid[df.error.isna()])
+
+
+def test_full_text_one_row_per_article():
+    df = chunk_jats_corpus(ARTICLES[:2], processes=0, full_text=True)
+    assert df.pmcid.tolist() == ["PMC0", "PMC1"]
+    assert df.text.tolist() == [extract_full_text_from_xml(x) for _, x in ARTICLES[:2]]
+
+
+def test_arrow_output():
+    pytest.importorskip("pyarrow")
+    table = chunk_jats_corpus(ARTICLES[:2], processes=0, output="arrow")
+    assert table.column_names == list(CHUNK_COLUMNS)
+
+
+def test_iter_batches_by_article():
+    frames = list(iter_jats_corpus_chunks(iter(ARTICLES), batch_size=5, processes=0,
+                                          min_len=1))
+
+    assert [f.pmcid.nunique() for f in frames] == [5, 5, 2]
+    whole = pd.concat(frames, ignore_index=True).astype(CHUNK_COLUMNS)
+    pd.testing.assert_frame_equal(whole, chunk_jats_corpus(ARTICLES, processes=0,
+                                                           min_len=1))
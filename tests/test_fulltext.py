@@ -0,0 +1,109 @@
+"""
+tests/test_fulltext.py
+
+TieredFullText tries its tiers in order, stops per article at the first
+acceptable text, and books requests / bytes / hits per tier.
+"""
+
+from __future__ import annotations
+
+import pytest
+import requests
+
+import searchpubmed.pubmed as p
+from searchpubmed.cache import ResponseCache
+from searchpubmed.fulltext import Tier, TieredFullText
+
+LONG = "word " * 20
+
+
+class _Resp:
+    def __init__(self, text: str):
+        self.text = text
+        self.content = text.encode()
+        self.status_code = 200
+        self.ok = True
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def fake_pmc(monkeypatch):
+    calls = []
+
+    def fake_get(url, params=None, **_):
+        if "efetch" in url:
+            calls.append(("xml", params["id"]))
+            arts = "".join(
+                f'<article><article-id pub-id-type="pmc">{i[3:]}</article-id>'
+                f"<body><p>{LONG if i == 'PMC2' else 'stub'}</p></body></article>"
+                for i in params["id"].split(","))
+            return _Resp(f"<pmc-articleset>{arts}</pmc-articleset>")
+        pid = url.split("/articles/")[1].split("/")[0]
+        if "format=flat" in url:
+            calls.append(("flat", pid))
+            return _Resp(f"<p>{LONG if pid == 'PMC1' else 'short'}</p>")
+        calls.append(("html", pid))
+        if pid == "PMC4":
+            raise requests.ConnectionError("down")
+        return _Resp(f"<main><script>x()</script><p>{LONG} page {pid}</p></main>")
+
+    monkeypatch.setattr(p.requests, "get", fake_get)
+    return calls
+
+
+def test_tiers_short_circuit_per_article(fake_pmc):
+    fetcher = TieredFullText(["flat", Tier("xml", batch_size=10), "html"], min_chars=50)
+    df = fetcher.fetch(["1", "PMC2", "3", "4"])
+
+    assert df.source.tolist() == ["flat", "xml", "html", "flat"]
+    assert df.accepted.tolist() == [True, True, True, False]
+    assert "page PMC3" in df.loc[2, "text"] and "x()" not in df.loc[2, "text"]
+    assert df.loc[3, "text"] == "short"  # longest text kept when nothing passes
+    # the XML tier saw only what flat HTML did not settle, in one request
+    assert [c for c in fake_pmc if c[0] == "xml"] == [("xml", "PMC2,PMC3,PMC4")]
+    assert [c[1] for c in fake_pmc if c[0] == "html"] == ["PMC3", "PMC4"]
+
+    stats = fetcher.stats_frame().set_index("tier")
+    assert stats.loc["flat", "attempted"] == 4 and stats.loc["flat", "hits"] == 1
+    assert stats.loc["xml", "requests"] == 1 and stats.loc["xml", "hit_rate"] == 1 / 3
+    assert stats.loc["html", "requests"] == 2 and stats.loc["html", "hits"] == 1
+    assert stats.loc["flat", "bytes"] > 0
+    assert df.attrs["tier_stats"]["xml"]["hits"] == 1
+
+
+def test_cache_tier_serves_accepted_texts(fake_pmc, tmp_path):
+    cache = ResponseCache(tmp_path / "c.sqlite")
+    first = TieredFullText(["cache", "flat", "xml"], min_chars=50, cache=cache)
+    first.fetch(["PMC1", "PMC2"])
+    fake_pmc.clear()
+
+    again = TieredFullText(["cache", "flat", "xml"], min_chars=50, cache=cache)
+    df = again.fetch(["PMC1", "PMC2"])
+
+    assert df.source.tolist() == ["cache", "cache"]
+    assert fake_pmc == []
+    assert again.stats["cache"].hits == 2 and again.stats["flat"].attempted == 0
+
+
+def test_xml_errors_counted(monkeypatch, caplog):
+    def fake_get(url, **_):
+        if "efetch" in url:
+            raise requests.ConnectionError("down")
+        return _Resp("<p>short</p>")
+
+    monkeypatch.setattr(p.requests, "get", fake_get)
+    monkeypatch.setattr(p.time, "sleep", lambda *_: None)
+    fetcher = TieredFullText(["flat", "xml"], min_chars=50, max_retries=1)
+    df = fetcher.fetch(["PMC1", "PMC2"])
+
+    assert df.source.tolist() == ["flat", "flat"]
+    assert fetcher.stats["xml"].errors == 2 and fetcher.stats["flat"].errors == 0
+    assert df.attrs["tier_stats"]["xml"]["errors"] == 2
+    assert "PMC1: EFetch failed – network-error" in caplog.text
+
+
+def test_unknown_tier():
+    with pytest.raises(ValueError, match="tier must be one of"):
+        Tier("pdf")
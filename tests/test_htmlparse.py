@@ -0,0 +1,91 @@
+"""
+tests/test_htmlparse.py
+
+The HTML backends extract the same #maincontent text as a full
+BeautifulSoup parse did, and agree with each other exactly.
+"""
+
+from __future__ import annotations
+
+import sys
+
+import bs4
+import pytest
+
+from searchpubmed import htmlparse
+
+PAGE = """<html><head><title>T</title><script>var x = 1;</script></head><body>
+<nav><p>Skip to content</p></nav>
+<div id="maincontent"><h1>Heading</h1>
+  <p>First <b>bold</b> paragraph.</p><style>.a{}</style>
+  <aside><p>Related</p></aside>
+  <div><p>Second <!-- note -->paragraph.</p></div>
+</div>
+<footer><p>Footer</p></footer></body></html>"""
+
+PARAGRAPHS = "First bold paragraph. Second paragraph."
+PAGE_TEXT = "T Heading First bold paragraph. Second paragraph."
+
+
+@pytest.fixture(autouse=True)
+def _reset_backend():
+    yield
+    htmlparse.set_html_backend(None)
+
+
+@pytest.fixture(params=["bs4", "lxml"])
+def backend(request):
+    if request.param == "lxml":
+        pytest.importorskip("lxml.html")
+    htmlparse.set_html_backend(request.param)
+    return request.param
+
+
+def _full_soup_main(html):
+    """What the scrapers did before: parse everything, then find #maincontent."""
+    soup = bs4.BeautifulSoup(html, "html.parser")
+    main = soup.find(id="maincontent") or soup
+    for tag in main.find_all(["script", "style", "nav", "footer", "aside"]):
+        tag.decompose()
+    return main
+
+
+def test_default_backend_is_bs4():
+    assert htmlparse.get_html_backend() == "bs4"
+
+
+def test_bs4_strainer_matches_full_parse():
+    page = PAGE.replace("<!-- note -->", "")
+    assert htmlparse.main_html(page) == str(_full_soup_main(page))
+    assert htmlparse.main_paragraph_text(page) == " ".join(
+        p.get_text(" ", strip=True) for p in _full_soup_main(page).find_all("p"))
+
+
+def test_text(backend):
+    assert htmlparse.main_paragraph_text(PAGE) == PARAGRAPHS
+    assert htmlparse.page_text(PAGE) == PAGE_TEXT
+    assert "Related" not in htmlparse.main_html(PAGE)
+
+
+def test_without_maincontent_uses_whole_page(backend):
+    page = PAGE.replace('id="maincontent"', "")
+    assert htmlparse.main_paragraph_text(page) == PARAGRAPHS
+    assert "Footer" not in htmlparse.main_html(page)
+
+
+def test_comments_dropped_alike(backend):
+    page = '<div id="maincontent"><p>a<!-- c -->b</p><p>x <!--y-->z</p></div>'
+    assert (htmlparse.main_html(page)
+            == '<div id="maincontent"><p>ab</p><p>x z</p></div>')
+    assert htmlparse.main_paragraph_text(page) == "ab x z"
+    assert htmlparse.page_text(page) == "ab x z"
+
+
+def test_unknown_or_missing_backend(monkeypatch):
+    with pytest.raises(ValueError, match="backend must be one of"):
+        htmlparse.set_html_backend("html5lib")
+    monkeypatch.setitem(sys.modules, "lxml", None)
+    monkeypatch.setitem(sys.modules, "lxml.html", None)
+    with pytest.raises(ImportError):
+        htmlparse.set_html_backend("lxml")
+    assert htmlparse.get_html_backend() == "bs4"
@@ -0,0 +1,82 @@
+"""
+tests/test_idconv.py
+
+map_pmids_to_pmcids(backend="idconv") against a local HTTP stand-in for the
+PMC ID Converter API – real sockets, no traffic leaves the machine.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pytest
+
+import searchpubmed.pubmed as p
+
+_KNOWN = {
+    "111": {"pmcid": "PMC555", "doi": "10.1/a"},
+    "222": {"pmcid": "PMC666", "doi": "10.1/b"},
+}
+
+
+class _IdConvHandler(BaseHTTPRequestHandler):
+    requests_seen: list[list[str]] = []
+
+    def do_GET(self):  # noqa: N802 – http.server naming
+        ids = parse_qs(urlparse(self.path).query)["ids"][0].split(",")
+        type(self).requests_seen.append(ids)
+        records = [
+            {"pmid": pmid, **_KNOWN[pmid]} if pmid in _KNOWN
+            else {"requested-id": pmid, "status": "error", "errmsg": "not found"}
+            for pmid in ids
+        ]
+        body = json.dumps({"status": "ok", "records": records}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def idconv_server(monkeypatch):
+    _IdConvHandler.requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _IdConvHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(p, "_IDCONV_URL", f"http://127.0.0.1:{server.server_port}/")
+    monkeypatch.setattr(p.time, "sleep", lambda *_: None)
+    yield _IdConvHandler
+    server.shutdown()
+    server.server_close()
+
+
+def test_idconv_backend(idconv_server):
+    df = p.map_pmids_to_pmcids(["111", "999", "222", "111"], backend="idconv",
+                               batch_size=2)
+
+    assert list(df.columns) == ["pmid", "pmcid", "doi"]
+    by_pmid = df.set_index("pmid")
+    assert by_pmid.loc["111", "pmcid"] == "PMC555"
+    assert by_pmid.loc["222", "doi"] == "10.1/b"
+    assert pd.isna(by_pmid.loc["999", "pmcid"])
+    assert len(df) == 3
+    # de-duplicated input split into ≤ batch_size chunks
+    assert sorted(map(len, idconv_server.requests_seen)) == [1, 2]
+
+
+def test_idconv_caps_batch_at_200(idconv_server):
+    p.map_pmids_to_pmcids([str(i) for i in range(450)], backend="idconv")
+    assert max(map(len, idconv_server.requests_seen)) == 200
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        p.map_pmids_to_pmcids(["1"], backend="nope")
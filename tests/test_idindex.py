@@ -0,0 +1,71 @@
+"""
+tests/test_idindex.py
+
+Offline PMID → PMCID index built from a miniature PMC-ids.csv.gz.
+"""
+
+from __future__ import annotations
+
+import gzip
+
+import pytest
+
+import searchpubmed.pubmed as p
+from searchpubmed.idindex import PmcIdIndex, build_pmc_id_index, main
+
+_CSV = (
+    "Journal Title,ISSN,eISSN,Year,Volume,Issue,Page,DOI,PMCID,PMID,"
+    "Manuscript Id,Release Date\n"
+    "J A,,,2001,1,1,1,10.1/a,PMC13900,11250746,,live\n"
+    "J B,,,2002,1,1,1,10.1/b,PMC13901,,,live\n"            # no PMID → skipped
+    '"J C, D",,,2003,1,1,1,10.1/c,PMC500,222,,live\n'
+    "J E,,,2004,1,1,1,10.1/e,PMC501,222,,live\n"            # PMID with two PMCIDs
+    "J A,,,2001,1,1,1,10.1/a,PMC13900,11250746,,live\n"     # duplicate pair
+)
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    src = tmp_path / "PMC-ids.csv.gz"
+    with gzip.open(src, "wt", encoding="utf-8") as fh:
+        fh.write(_CSV)
+    out = tmp_path / "pmc-ids.npy"
+    assert build_pmc_id_index(src, out) == 3
+    return out
+
+
+def test_lookup(index_path):
+    idx = PmcIdIndex(index_path)
+    hits, missing = idx.lookup(["222", "999", "11250746", "abc"])
+
+    assert len(idx) == 3
+    assert hits.values.tolist() == [
+        ["222", "PMC500"], ["222", "PMC501"], ["11250746", "PMC13900"]]
+    assert missing == ["999", "abc"]
+
+
+def test_map_pmids_uses_index_first(monkeypatch, index_path):
+    sent: list[str] = []
+
+    def fake_post(_self, _url, *, data, **_kw):
+        sent.extend(v for k, v in data if k == "id")
+        return type("R", (), {"ok": True, "status_code": 200,
+                              "content": b"<eLinkResult/>",
+                              "raise_for_status": lambda self: None})()
+
+    monkeypatch.setattr(p.requests.Session, "post", fake_post)
+    monkeypatch.setattr(p.time, "sleep", lambda *_: None)
+
+    df = p.map_pmids_to_pmcids(["11250746", "999", "222"], index=index_path)
+
+    assert sent == ["999"]  # only the index miss reached ELink
+    assert df[df.pmid == "11250746"].pmcid.tolist() == ["PMC13900"]
+    assert sorted(df[df.pmid == "222"].pmcid) == ["PMC500", "PMC501"]
+    assert list(df.columns) == ["pmid", "pmcid"]
+
+
+def test_cli(tmp_path, capsys):
+    src = tmp_path / "PMC-ids.csv"
+    src.write_text(_CSV)
+    main([str(src), str(tmp_path / "ids.npy")])
+    assert "3 PMID/PMCID pairs" in capsys.readouterr().out
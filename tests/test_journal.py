@@ -0,0 +1,97 @@
+"""
+tests/test_journal.py
+
+run_resumable skips finished batches on re-invocation, retries failed ones,
+and never leaves partial outputs behind.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from searchpubmed.journal import JobJournal, batch_key, run_resumable
+
+
+def _fetch(calls, fail=()):
+    def fetch(batch, *, batch_size, **_kw):
+        calls.append(list(batch))
+        if set(batch) & set(fail):
+            raise RuntimeError("boom")
+        return pd.DataFrame({"pmid": batch, "title": [f"T{i}" for i in batch]})
+    return fetch
+
+
+def test_resume_skips_finished_batches(tmp_path):
+    ids = [str(i) for i in range(1, 7)]
+    calls: list[list[str]] = []
+
+    first = run_resumable(_fetch(calls, fail={"3"}), ids, job_id="j", root=tmp_path,
+                          batch_size=2, format="pickle")
+    assert first.failed() == [batch_key(["3", "4"])]
+
+    calls.clear()
+    again = run_resumable(_fetch(calls), ids, job_id="j", root=tmp_path,
+                          batch_size=2, format="pickle")
+    assert calls == [["3", "4"]]                 # only the failed batch re-ran
+    assert again.failed() == []
+    assert sorted(again.load().pmid) == ids
+    assert sorted(p.name for p in (tmp_path / "j").iterdir()) == sorted(
+        ["_journal.json"] + [f"part-{batch_key(b)}.pkl"
+                             for b in (["1", "2"], ["3", "4"], ["5", "6"])])
+
+
+def test_placeholder_batch_is_failed(tmp_path):
+    def fetch(batch, **_kw):
+        return pd.DataFrame({"pmid": ["N/A"] * len(batch),
+                             "title": ["N/A"] * len(batch)})
+
+    journal = run_resumable(fetch, ["1"], job_id="p", root=tmp_path, format="pickle")
+    assert journal.failed() and journal.outputs() == []
+
+
+def test_reported_errors_fail_the_batch(tmp_path):
+    def fetch(batch, **_kw):
+        frame = pd.DataFrame({"pmid": batch, "title": ["T", "N/A"]})
+        frame.attrs["errors"] = {batch[1]: "http-500"}
+        return frame
+
+    journal = run_resumable(fetch, ["1", "2"], job_id="e", root=tmp_path,
+                            format="pickle")
+    key = batch_key(["1", "2"])
+    assert journal.failed() == [key] and journal.outputs() == []
+    assert journal.entries[key]["error"] == "1 IDs failed (http-500)"
+
+
+@pytest.mark.parametrize("rows", [[], ["N/A"]])
+def test_clean_empty_batch_is_done(tmp_path, rows):
+    def fetch(batch, **_kw):
+        frame = pd.DataFrame({"pmid": rows, "title": rows})
+        frame.attrs["errors"] = {}
+        return frame
+
+    journal = run_resumable(fetch, ["1"], job_id="z", root=tmp_path, format="pickle")
+    assert journal.failed() == [] and len(journal.outputs()) == 1
+
+
+def test_crash_while_writing_leaves_nothing(tmp_path, monkeypatch):
+    def broken(self, path, *a, **k):
+        with open(path, "wb") as fh:
+            fh.write(b"half")
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(pd.DataFrame, "to_pickle", broken)
+    with pytest.raises(KeyboardInterrupt):
+        run_resumable(_fetch([]), ["1"], job_id="c", root=tmp_path, format="pickle")
+
+    assert [p.name for p in (tmp_path / "c").iterdir()] == []
+    assert JobJournal("c", tmp_path).entries == {}
+
+
+def test_missing_output_is_refetched(tmp_path):
+    calls: list[list[str]] = []
+    journal = run_resumable(_fetch(calls), ["1"], job_id="m", root=tmp_path,
+                            format="pickle")
+    journal.outputs()[0].unlink()
+    run_resumable(_fetch(calls), ["1"], job_id="m", root=tmp_path, format="pickle")
+    assert calls == [["1"], ["1"]]
@@ -0,0 +1,45 @@
+"""
+tests/test_lazy_import.py
+
+``import searchpubmed`` loads no heavy dependency, leaves logging alone and
+still resolves every public name on demand.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import searchpubmed
+
+
+def _run(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", textwrap.dedent(code)],
+                          check=True, capture_output=True, text=True).stdout
+
+
+def test_import_is_light_and_side_effect_free():
+    out = _run("""
+        import logging, sys
+        root = logging.getLogger()
+        before = (root.level, list(root.handlers))
+        import searchpubmed.pubmed
+        heavy = {"pandas", "requests", "bs4", "numpy", "dateparser"} & set(sys.modules)
+        print(sorted(heavy), (root.level, list(root.handlers)) == before)
+    """)
+    assert out.split() == ["[]", "True"]
+
+
+def test_public_names_resolve_lazily():
+    for name in searchpubmed.__all__:
+        assert getattr(searchpubmed, name) is not None
+    assert set(searchpubmed.__all__) <= set(dir(searchpubmed))
+    assert searchpubmed.get_pmid_from_pubmed.__module__ == "searchpubmed.pubmed"
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        searchpubmed.not_a_name
@@ -0,0 +1,80 @@
+"""
+tests/test_oa_bulk.py
+
+iter_oa_tarballs streams JATS members out of OA bulk tarballs into
+get_pmc_full_xml-shaped frames, in archive order, with per-member errors.
+"""
+
+from __future__ import annotations
+
+import io
+import tarfile
+
+import pandas as pd
+import pytest
+
+import searchpubmed.pubmed as p
+from searchpubmed.oa_bulk import ingest_oa_tarballs, iter_oa_tarballs
+
+
+def _nxml(i: int) -> bytes:
+    return (f'<?xml version="1.0"?>\n'
+            f'<!DOCTYPE article PUBLIC "-//NLM//DTD JATS" "JATS.dtd">\n'
+            f'<article xmlns:xlink="http://www.w3.org/1999/xlink"><front><article-meta>'
+            f'<article-id pub-id-type="pmc">{i}</article-id></article-meta></front>'
+            f'<body><sec><title>Intro</title><p>Body of article {i}.</p></sec></body>'
+            f'</article>').encode()
+
+
+def _tarball(path, members):
+    with tarfile.open(path, "w:gz") as tar:
+        for name, data in members:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return path
+
+
+@pytest.fixture
+def packages(tmp_path):
+    first = _tarball(tmp_path / "oa_comm_xml.PMC001xxxxxx.tar.gz", [
+        ("PMC001xxxxxx/PMC1.xml", _nxml(1)),
+        ("PMC001xxxxxx/README.txt", b"not xml"),
+        ("PMC001xxxxxx/PMC2.xml", b"<PubmedArticle><MedlineCitation/></PubmedArticle>"),
+    ])
+    second = _tarball(tmp_path / "oa_comm_xml.PMC002xxxxxx.tar.gz", [
+        ("J_Test/j-test-3.nxml", _nxml(3)),
+        ("J_Test/broken.nxml", b"<article><body>"),
+    ])
+    return [first, second]
+
+
+def test_rows_match_get_pmc_full_xml_schema(packages):
+    frames = list(iter_oa_tarballs(packages, processes=0, batch_size=3))
+    df = pd.concat(frames, ignore_index=True)
+
+    assert [len(f) for f in frames] == [3, 1]
+    assert dict(df.dtypes.astype(str)) == p._PMC_XML_DTYPES
+    assert df.pmcid.tolist() == ["PMC1", "PMC2", "PMC3", "N/A"]
+    assert df.xmlKind.tolist() == ["pmc", "medline", "pmc", "pmc"]
+    assert df.loc[0, "fullXML"] == _nxml(1).decode()  # stored byte-exact
+    assert df.loc[2, "fullText"] == "Intro\n\nBody of article 3."
+    assert df.loc[1, "fullText"] == "N/A"
+    assert frames[0].attrs["errors"] == {
+        "PMC2": "ValueError: not JATS full text (medline)"}
+    assert list(frames[1].attrs["errors"]) == ["J_Test/broken.nxml"]
+
+
+def test_process_pool_matches_serial(packages):
+    serial = pd.concat(iter_oa_tarballs(packages, processes=0, keep_xml=False))
+    pooled = pd.concat(iter_oa_tarballs(packages, processes=2, chunksize=1,
+                                        keep_xml=False, chunks=True))
+    assert "fullXML" not in pooled.columns
+    pd.testing.assert_frame_equal(serial, pooled.drop(columns="textChunks"))
+
+
+def test_ingest_writes_parquet(packages, tmp_path):
+    pytest.importorskip("pyarrow")
+    sink = ingest_oa_tarballs(packages, tmp_path / "out", processes=0, batch_size=2)
+    assert sink.batches == 2
+    assert sink.dataset().count_rows() == 4
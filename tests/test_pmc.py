@@ -56,3 +56,151 @@ def test_scrape_standard_html(monkeypatch):
     monkeypatch.setattr(p.requests, "get", lambda *_a, **_k: html)
     out = p._scrape_pmc_standard_html("PMC100")
     assert "big text" in out
+
+
+# ------- get_pmc_html_text(max_workers>1) keeps order on a pooled session ----
+def test_get_pmc_html_text_concurrent(monkeypatch):
+    import threading
+    sessions, done = set(), threading.Event()
+
+    def fake_get(session, url, **_k):
+        sessions.add(id(session))
+        pid = url.split("/articles/")[1].split("/")[0]
+        if pid == "PMC1":          # first article finishes last
+            done.wait(1)
+        else:
+            done.set()
+        return _Resp(text=f"<div id='maincontent'><p>{pid}</p><nav>x</nav></div>")
+
+    closed = []
+    monkeypatch.setattr(p.requests.Session, "get", fake_get)
+    monkeypatch.setattr(p.requests.Session, "close",
+                        lambda session: closed.append(id(session)))
+    df = p.get_pmc_html_text(["PMC1", "2", "PMC3"], max_workers=3)
+
+    assert df.pmcid.tolist() == ["PMC1", "2", "PMC3"]
+    assert ["PMC1" in t and "<nav>" not in t
+            for t in df.htmlText] == [True, False, False]
+    assert len(sessions) == 1 and closed == list(sessions)
+
+    # a session installed by searchpubmed.aio is reused and left open
+    pooled = p._pooled_session(2)
+    token = p._POOLED_SESSION.set(pooled)
+    try:
+        p.get_pmc_html_text(["PMC3"], max_workers=2)
+    finally:
+        p._POOLED_SESSION.reset(token)
+    assert id(pooled) in sessions and len(closed) == 1
+
+
+# ------ get_pmc_full_xml(stream=True) matches the one-shot parse, with xmlns ---
+def test_get_pmc_full_xml_stream(monkeypatch):
+    body = GOOD_XML.content.replace(b"<article>", b'<article xmlns="urn:jats">')
+
+    class _Streamed(_Resp):
+        def iter_content(self, chunk_size):
+            yield from (self.content[i:i + 16]
+                        for i in range(0, len(self.content), 16))
+
+    monkeypatch.setattr(p.requests.Session, "get",
+                        lambda *a, **k: _Streamed(content=body))
+    streamed = p.get_pmc_full_xml(["42"], stream=True)
+    monkeypatch.setattr(p.requests.Session, "get", lambda *a, **k: _Resp(content=body))
+    whole = p.get_pmc_full_xml(["42"])
+
+    assert streamed.equals(whole)
+    assert streamed.pmcid.tolist() == ["PMC42"]
+    assert streamed.loc[0, "fullText"] != "N/A"
+
+
+# ------------- fullText from the live tree; fullXML optional -----------------
+def test_get_pmc_full_xml_text_without_xml(monkeypatch):
+    monkeypatch.setattr(p.requests.Session, "get", lambda *a, **k: GOOD_XML)
+    monkeypatch.setattr(p.ET, "tostring", lambda *a, **k: pytest.fail("serialised"))
+    df = p.get_pmc_full_xml(["42", "43"], keep_xml=False, chunks=True)
+    assert "fullXML" not in df.columns
+    assert df.pmcid.tolist() == ["PMC42", "PMC43"]
+    article = GOOD_XML.text.split("<articles>")[1].split("</articles>")[0]
+    assert df.loc[0, "fullText"] == p.extract_full_text_from_xml(article)
+    assert df.loc[0, "textChunks"] == p.get_jats_text_chunks(article, text_only=True)
+    assert df.loc[1, "fullText"] == "N/A" and df.loc[1, "xmlKind"] == "unknown"
+
+
+# -------------- extract_full_text_from_xml: nested sections -----------------
+def test_full_text_nested_sections_each_paragraph_once():
+    depth = 6
+    xml = ("<article><front><abstract><title>Abstract</title><sec><p>A0</p></sec>"
+           "</abstract></front><body>")
+    xml += "".join(f"<sec><title>S{i}</title><p>P{i}<list><p>L{i}</p></list></p>"
+                   for i in range(depth))
+    xml += "</sec>" * depth + "<p>stray</p></body></article>"
+    text = p.extract_full_text_from_xml(xml)
+    blocks = text.split("\n\n")
+    assert blocks[:2] == ["Abstract", "A0"]
+    for i in range(depth):
+        assert blocks.count(f"S{i}") == 1
+        assert text.count(f"P{i}") == 1 and text.count(f"L{i}") == 1
+    assert blocks[2:] == [b for i in range(depth) for b in (f"S{i}", f"P{i}L{i}")]
+
+
+# ------------------ slice_xml: fullXML verbatim from the payload --------------
+SLICE_BODY = b"""<?xml version='1.0'?>
+<pmc-articleset xmlns="urn:jats" xmlns:xlink="http://www.w3.org/1999/xlink">
+<article article-type="research">
+  <front><article-meta>
+    <article-id pub-id-type="pmc">42</article-id></article-meta></front>
+  <body><sec><title>Intro</title>
+    <p>See <ext-link xlink:href="http://x">x</ext-link>.</p>
+  <supplementary-material/></sec></body>
+</article>
+<article xmlns:mml="http://www.w3.org/1998/Math/MathML">
+  <front><article-meta>
+    <article-id pub-id-type="pmc">43</article-id></article-meta></front>
+  <abstract><p><mml:math><mml:mi>x</mml:mi></mml:math> caf\xc3\xa9</p></abstract>
+</article>
+</pmc-articleset>"""
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_get_pmc_full_xml_slice_xml(monkeypatch, stream):
+    class _Streamed(_Resp):
+        def iter_content(self, chunk_size):
+            yield from (self.content[i:i + 7] for i in range(0, len(self.content), 7))
+
+    monkeypatch.setattr(p.requests.Session, "get",
+                        lambda *a, **k: _Streamed(content=SLICE_BODY))
+    sliced = p.get_pmc_full_xml(["42", "43"], slice_xml=True, stream=stream)
+    rebuilt = p.get_pmc_full_xml(["42", "43"], stream=stream)
+
+    text = SLICE_BODY.decode()
+    starts = [text.index("<article article-type"), text.index("<article xmlns:mml")]
+    ends = [text.index("</article>", s) + len("</article>") for s in starts]
+    assert sliced.fullXML.tolist() == [text[s:e] for s, e in zip(starts, ends)]
+    cols = ["pmcid", "fullText", "isFullText", "hasSuppMat", "xmlKind"]
+    assert sliced[cols].equals(rebuilt[cols])
+    assert sliced.hasSuppMat.tolist() == [True, False]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_article_slices_empty_element(stream):
+    body = (b'<pmc-articleset><article/><article a="x>y"><!-- c --></article>'
+            b'<article></article><article ></article ><article>a/></article>'
+            b'<article b="1>"/></pmc-articleset>')
+
+    class _Streamed(_Resp):
+        def iter_content(self, chunk_size):
+            yield from (self.content[i:i + 5] for i in range(0, len(self.content), 5))
+
+    raws = [raw for _, raw in
+            p._iter_article_slices(_Streamed(content=body), "article", stream=stream)]
+    assert raws == ["<article/>", '<article a="x>y"><!-- c --></article>',
+                    "<article></article>", "<article ></article >",
+                    "<article>a/></article>", '<article b="1>"/>']
+
+
+def test_get_pmc_full_xml_slice_xml_malformed(monkeypatch):
+    monkeypatch.setattr(p.requests.Session, "get",
+                        lambda *a, **k: _Resp(content=b"<pmc-articleset><article>"))
+    df = p.get_pmc_full_xml(["42"], slice_xml=True)
+    assert df.loc[0, "fullXML"] == "N/A"
+    assert df.attrs["errors"] == {"PMC42": "parse-error"}
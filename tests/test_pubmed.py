@@ -93,6 +93,172 @@ def test_get_pmid_total_failure(monkeypatch):
     assert p.get_pmid_from_pubmed("x") == []
 
 
+def _history_post(total: int, fail_at: int | None = None):
+    """Fake ESearch backend serving *total* PMIDs through a history server."""
+    calls: list[dict] = []
+
+    def fake_post(_url, *, data, **_kw):
+        calls.append(dict(data))
+        start, size = int(data["retstart"]), int(data["retmax"])
+        if fail_at is not None and start == fail_at:
+            raise requests.ConnectionError("dropped")
+        ids = "".join(f"<Id>{i}</Id>" for i in range(start, min(start + size, total)))
+        xml = (f"<eSearchResult><Count>{total}</Count><QueryKey>1</QueryKey>"
+               f"<WebEnv>ENV</WebEnv><IdList>{ids}</IdList></eSearchResult>")
+        return DummyResp(content=xml.encode())
+
+    return fake_post, calls
+
+
+def test_iter_pmid_pages_uses_history(monkeypatch):
+    import searchpubmed.pubmed as p
+
+    fake_post, calls = _history_post(total=7)
+    monkeypatch.setattr(p.requests, "post", fake_post)
+
+    pages = list(p.iter_pmid_pages("cancer", page_size=3))
+
+    assert pages == [["0", "1", "2"], ["3", "4", "5"], ["6"]]
+    assert calls[0]["usehistory"] == "y" and calls[0]["term"] == "cancer"
+    assert all(c["WebEnv"] == "ENV" and c["term"] == "#1" for c in calls[1:])
+
+
+def test_iter_pmid_pages_resume(monkeypatch):
+    import searchpubmed.pubmed as p
+
+    fake_post, _ = _history_post(total=7, fail_at=3)
+    monkeypatch.setattr(p.requests, "post", fake_post)
+
+    got: list[str] = []
+    with pytest.raises(requests.RequestException):
+        for page in p.iter_pmid_pages("cancer", page_size=3):
+            got.extend(page)
+    assert got == ["0", "1", "2"]
+
+    fake_post, _ = _history_post(total=7)
+    monkeypatch.setattr(p.requests, "post", fake_post)
+    for page in p.iter_pmid_pages("cancer", page_size=3, retstart=len(got)):
+        got.extend(page)
+    assert got == [str(i) for i in range(7)]
+
+
+def test_get_pmid_paginate(monkeypatch):
+    import searchpubmed.pubmed as p
+
+    fake_post, _ = _history_post(total=5)
+    monkeypatch.setattr(p.requests, "post", fake_post)
+
+    assert p.get_pmid_from_pubmed("x", paginate=True, page_size=2) == [
+        "0", "1", "2", "3", "4"]
+
+
+def test_get_pmid_date_slicing(monkeypatch):
+    import re
+    from datetime import date, timedelta
+    import searchpubmed.pubmed as p
+
+    # 40 articles over 2019-2020, clustered so some months need day-level slices
+    corpus = {str(i): date(2019, 1, 1) + timedelta(days=(i * 17) % 700)
+              for i in range(30)}
+    corpus.update({str(100 + i): date(2020, 3, 1 + i % 5) for i in range(10)})
+    fetched: list[int] = []
+
+    def fake_post(_url, *, data, **_kw):
+        m = re.search(r'"([\d/]+)"\[dp\] : "([\d/]+)"\[dp\]', data["term"])
+        lo, hi = (date(*map(int, (v + "/1/1").split("/")[:3])) for v in m.groups())
+        if "/" not in m[2]:
+            hi = date(hi.year, 12, 31)
+        hits = sorted(k for k, d in corpus.items() if lo <= d <= hi)
+        if data.get("rettype") == "count":
+            return DummyResp(content=f"<eSearchResult><Count>{len(hits)}</Count>"
+                                     f"</eSearchResult>".encode())
+        fetched.append(len(hits))
+        ids = "".join(f"<Id>{h}</Id>" for h in hits[: int(data["retmax"])])
+        return DummyResp(content=f"<eSearchResult><IdList>{ids}</IdList>"
+                                 f"</eSearchResult>".encode())
+
+    monkeypatch.setattr(p.requests, "post", fake_post)
+    q = 'cancer AND ("2019"[dp] : "2020"[dp])'
+    out = p.get_pmid_from_pubmed(q, date_slicing=True, slice_threshold=4)
+
+    assert sorted(out) == sorted(corpus)  # nothing lost, nothing duplicated
+    assert fetched and max(fetched) <= 4
+
+
+@pytest.mark.parametrize("failures, expected", [(2, ["1", "2"]), (99, [])])
+def test_get_pmid_date_slicing_window_failure(monkeypatch, failures, expected):
+    import searchpubmed.pubmed as p
+
+    left = {"n": failures}
+
+    def fake_post(_url, *, data, **_kw):
+        if data.get("rettype") == "count":
+            hits = 5 if '"2019"[dp] : "2020"[dp]' in data["term"] else 1
+            return DummyResp(content=f"<eSearchResult><Count>{hits}</Count>"
+                                     f"</eSearchResult>".encode())
+        if "2019/" in data["term"] and left["n"]:
+            left["n"] -= 1
+            raise requests.ConnectionError("reset")
+        pmid = "1" if "2019/" in data["term"] else "2"
+        return DummyResp(content=f"<eSearchResult><IdList><Id>{pmid}</Id></IdList>"
+                                 f"</eSearchResult>".encode())
+
+    monkeypatch.setattr(p.requests, "post", fake_post)
+    monkeypatch.setattr(p.time, "sleep", lambda _s: None)
+    q = 'cancer AND ("2019"[dp] : "2020"[dp])'
+    # a window that keeps failing empties the result instead of thinning it
+    assert p.get_pmid_from_pubmed(q, date_slicing=True, slice_threshold=4,
+                                  max_retries=3) == expected
+
+
+def test_split_window_granularity():
+    from datetime import date
+    import searchpubmed.pubmed as p
+
+    assert p._split_window(date(2010, 1, 1), date(2013, 12, 31)) == [
+        (date(2010, 1, 1), date(2011, 12, 31)), (date(2012, 1, 1), date(2013, 12, 31))]
+    assert (p._split_window(date(2010, 1, 1), date(2010, 12, 31))[0][1]
+            == date(2010, 6, 30))
+    assert (p._split_window(date(2010, 2, 1), date(2010, 2, 28))[1][0]
+            == date(2010, 2, 15))
+    assert p._split_window(date(2010, 2, 1), date(2010, 2, 1)) is None
+
+
+# --------------------------------------------------------------------------- #
+# count_pubmed()                                                              #
+# --------------------------------------------------------------------------- #
+
+def test_count_pubmed_cached(monkeypatch):
+    import searchpubmed.pubmed as p
+
+    monkeypatch.setattr(p, "_COUNT_CACHE", {})
+    calls: list[dict] = []
+
+    def fake_post(_url, *, data, **_kw):
+        calls.append(dict(data))
+        return DummyResp(content=b"<eSearchResult><Count>1234</Count></eSearchResult>")
+
+    monkeypatch.setattr(p.requests, "post", fake_post)
+
+    assert p.count_pubmed("cancer  AND\n english[lang]") == 1234
+    assert p.count_pubmed("cancer AND english[lang]") == 1234  # same normalised key
+    assert len(calls) == 1 and calls[0]["rettype"] == "count"
+
+    assert p.count_pubmed("cancer AND english[lang]", ttl=0) == 1234
+    assert len(calls) == 2
+
+
+def test_count_pubmed_failure_not_cached(monkeypatch):
+    import searchpubmed.pubmed as p
+
+    monkeypatch.setattr(p, "_COUNT_CACHE", {})
+    monkeypatch.setattr(p.requests, "post",
+                        lambda *_a, **_k: DummyResp(text="boom", status=500))
+
+    assert p.count_pubmed("x", max_retries=1) is None
+    assert p._COUNT_CACHE == {}
+
+
 # --------------------------------------------------------------------------- #
 # map_pmids_to_pmcids()                                                       #
 # --------------------------------------------------------------------------- #
@@ -132,6 +298,73 @@ def test_map_pmids_http_error(monkeypatch):
     assert pd.isna(df.loc[0, "pmcid"])
 
 
+def test_map_pmids_bisects_failed_batch(monkeypatch):
+    import searchpubmed.pubmed as p
+    sent = []
+
+    def fake_post(*_a, data, **_k):
+        ids = [v for k, v in data if k == "id"]
+        sent.append(ids)
+        if "13" in ids:
+            return DummyResp(text="bad id", status=400)
+        sets = "".join(f"<LinkSet><IdList><Id>{i}</Id></IdList><LinkSetDb><DbTo>pmc"
+                       f"</DbTo><Link><Id>9{i}</Id></Link></LinkSetDb></LinkSet>"
+                       for i in ids)
+        return DummyResp(content=f"<eLinkResult>{sets}</eLinkResult>".encode())
+
+    monkeypatch.setattr(p.requests.Session, "post", fake_post)
+    df = p.map_pmids_to_pmcids(["11", "12", "13", "14"])
+
+    assert df.set_index("pmid").pmcid.fillna("-").to_dict() == {
+        "11": "911", "12": "912", "14": "914", "13": "-"}
+    assert df.attrs["errors"] == {"13": "http-400"}
+    assert df.attrs["recovery_requests"] == len(sent) - 1 == 4
+
+
+def test_map_pmids_network_error_not_bisected(monkeypatch):
+    import searchpubmed.pubmed as p
+    calls = []
+
+    def down(*_a, **_k):
+        calls.append(1)
+        raise requests.ConnectionError("down")
+
+    monkeypatch.setattr(p.requests.Session, "post", down)
+    df = p.map_pmids_to_pmcids(["1", "2", "3"])
+
+    assert len(calls) == 1
+    assert df.attrs == {"errors": dict.fromkeys(["1", "2", "3"], "network-error"),
+                        "recovery_requests": 0}
+
+
+@pytest.mark.parametrize("status", [502, 503, 504])
+def test_map_pmids_gateway_error_not_bisected(monkeypatch, status):
+    import searchpubmed.pubmed as p
+    calls = []
+    monkeypatch.setattr(p.time, "sleep", lambda *_: None)
+    monkeypatch.setattr(p.requests.Session, "post", lambda *_a, **_k: (
+        calls.append(1) or DummyResp(text="gateway", status=status)))
+
+    df = p.map_pmids_to_pmcids([str(i) for i in range(8)], max_retries=2)
+
+    assert len(calls) == 2  # the retries, no split
+    assert set(df.attrs["errors"].values()) == {f"http-{status}"}
+    assert df.attrs["recovery_requests"] == 0
+
+
+def test_bisection_capped_per_batch():
+    import searchpubmed.pubmed as p
+
+    def attempt(ids, first):
+        raise p._BatchFailed("http-400", True)
+
+    results, errors, recovery = p._fetch_bisecting(
+        [str(i) for i in range(200)], attempt, max_recovery=10)
+
+    assert results == [] and recovery <= 10
+    assert errors == dict.fromkeys(map(str, range(200)), "http-400")
+
+
 # --------------------------------------------------------------------------- #
 # get_pubmed_metadata_pmid()                                                  #
 # --------------------------------------------------------------------------- #
@@ -188,6 +421,160 @@ def test_metadata_parsing(monkeypatch):
     assert row.meshTags == "Cats"
 
 
+class _StreamResp(DummyResp):
+    """Streamed response: the body only comes out of ``iter_content``."""
+
+    def __init__(self, body: bytes, chunk: int = 7):
+        super().__init__(content=body)
+        self._chunk = chunk
+
+    def iter_content(self, chunk_size):
+        body = self.content
+        for i in range(0, len(body), self._chunk):
+            yield body[i:i + self._chunk]
+
+
+def test_metadata_streaming_matches_batch_parse(monkeypatch):
+    import searchpubmed.pubmed as p
+    kwargs = []
+
+    def fake_get(*_a, **k):
+        kwargs.append(k)
+        return _StreamResp(_EFETCH_XML.content)
+
+    monkeypatch.setattr(p.requests.Session, "get", fake_get)
+    streamed = p.get_pubmed_metadata_pmid(["111"], stream=True)
+    monkeypatch.setattr(p.requests.Session, "get", lambda *_a, **_k: _EFETCH_XML)
+
+    assert_frame_equal(streamed, p.get_pubmed_metadata_pmid(["111"]))
+    assert kwargs[0]["stream"] is True
+
+
+def test_iter_articles_clears_each_article():
+    import searchpubmed.pubmed as p
+    body = (b'<set xmlns="urn:x">'
+            + b"".join(b"<article><id>%d</id></article>" % i for i in range(5))
+            + b"</set>")
+    held = []
+    for art in p._iter_articles(_StreamResp(body), "article", stream=True):
+        assert art.findtext("id") is not None   # default namespace stripped
+        held.append(art)
+
+    assert all(len(a) == 0 for a in held)       # cleared once consumed
+
+
+def test_metadata_streaming_truncated_batch(monkeypatch):
+    import searchpubmed.pubmed as p
+    body = _EFETCH_XML.content.replace(b"</PubmedArticleSet>", b"<PubmedArticle><Medl")
+    monkeypatch.setattr(p.requests.Session, "get", lambda *_a, **_k: _StreamResp(body))
+
+    df = p.get_pubmed_metadata_pmid(["111", "222"], stream=True)
+
+    assert df.title.tolist() == ["A great discovery", "N/A"]
+
+
+@pytest.mark.parametrize("xml, expected", [
+    ("<PubDate><Year>2024</Year><Month>Jan</Month><Day>15</Day></PubDate>",
+     "2024-01-15"),
+    ("<PubDate><Year>2024</Year><Month>Sept</Month></PubDate>", "2024-09-01"),
+    ("<PubDate><Year>2024</Year><Month>02</Month><Day>30</Day></PubDate>",
+     "2024-02-30"),
+    ("<PubDate><Year>2024</Year></PubDate>", "2024"),
+    ("<PubDate><MedlineDate>1998 Dec-1999 Jan</MedlineDate></PubDate>",
+     "1998-12-01"),
+    ("<PubDate><MedlineDate>2019 Mar 4-8</MedlineDate></PubDate>", "2019-03-04"),
+    ("<PubDate><MedlineDate>2000 Spring</MedlineDate></PubDate>", "2000"),
+])
+def test_medline_pubdate_without_dateparser(monkeypatch, xml, expected):
+    import sys
+    import xml.etree.ElementTree as ET
+    import searchpubmed.pubmed as p
+    monkeypatch.setitem(sys.modules, "dateparser", None)  # any import fails
+    p._iso_date.cache_clear()
+
+    assert p._medline_pubdate(ET.fromstring(xml)) == expected
+
+
+def test_jats_pubdate_zero_pads():
+    import xml.etree.ElementTree as ET
+    import searchpubmed.pubmed as p
+    elem = ET.fromstring(
+        "<pub-date><day>5</day><month>3</month><year>2020</year></pub-date>")
+    assert p._jats_pubdate(elem) == "2020-03-05"
+
+
+def test_month_only_dates_agree():
+    import xml.etree.ElementTree as ET
+    import searchpubmed.pubmed as p
+
+    shapes = [
+        p._medline_pubdate(ET.fromstring(
+            "<PubDate><Year>1998</Year><Month>Dec</Month></PubDate>")),
+        p._medline_pubdate(ET.fromstring(
+            "<PubDate><MedlineDate>1998 Dec</MedlineDate></PubDate>")),
+        p._jats_pubdate(ET.fromstring(
+            "<pub-date><month>12</month><year>1998</year></pub-date>")),
+    ]
+    assert shapes == ["1998-12-01"] * 3
+
+
+def test_iter_metadata_yields_each_batch_before_next_request(monkeypatch):
+    import searchpubmed.pubmed as p
+    calls = []
+
+    def fake_get(*_a, params, **_k):
+        calls.append(params["id"])
+        arts = "".join(f"<PubmedArticle><MedlineCitation><PMID>{i}</PMID><Article>"
+                       f"<ArticleTitle>T{i}</ArticleTitle></Article></MedlineCitation>"
+                       f"</PubmedArticle>" for i in params["id"].split(","))
+        body = f"<PubmedArticleSet>{arts}</PubmedArticleSet>"
+        return DummyResp(content=body.encode())
+
+    monkeypatch.setattr(p.requests.Session, "get", fake_get)
+    gen = p.iter_pubmed_metadata_pmid(["3", "1", "2", "3"], batch_size=2)
+
+    first = next(gen)
+    assert calls == ["3,1"]                        # second batch not fetched yet
+    assert first.pmid.tolist() == ["3", "1"]       # EFetch order, unsorted
+    assert (first.dtypes == "string").all()
+    rest = list(gen)
+    assert [f.pmid.tolist() for f in rest] == [["2"]]
+    assert list(p.iter_pubmed_metadata_pmid([])) == []
+
+
+def test_iter_metadata_pmcid_failed_batch(monkeypatch):
+    import searchpubmed.pubmed as p
+    monkeypatch.setattr(p.requests.Session, "get",
+                        lambda *_a, **_k: DummyResp(text="nope", status=500))
+
+    (frame,) = p.iter_pubmed_metadata_pmcid(["1", "PMC2"], max_retries=1)
+
+    assert frame.pmcid.tolist() == ["PMC1", "PMC2"]
+    assert list(frame.columns) == ["pmcid", "pmid", "title", "abstract", "journal",
+                                   "publicationDate", "doi", "firstAuthor",
+                                   "lastAuthor", "authorAffiliations", "meshTags",
+                                   "keywords"]
+
+
+def test_metadata_bisects_down_to_bad_record(monkeypatch):
+    import searchpubmed.pubmed as p
+
+    def fake_get(*_a, params, **_k):
+        ids = params["id"].split(",")
+        arts = "".join(f"<PubmedArticle><MedlineCitation><PMID>{i}</PMID><Article>"
+                       f"<ArticleTitle>{'<b' if i == '3' else 'T' + i}</ArticleTitle>"
+                       f"</Article></MedlineCitation></PubmedArticle>" for i in ids)
+        body = f"<PubmedArticleSet>{arts}</PubmedArticleSet>"
+        return DummyResp(content=body.encode())
+
+    monkeypatch.setattr(p.requests.Session, "get", fake_get)
+    df = p.get_pubmed_metadata_pmid(["1", "2", "3", "4"])
+
+    assert df.pmid.tolist() == ["1", "2", "3", "4"]       # real PMID, not "N/A"
+    assert df.title.tolist() == ["T1", "T2", "N/A", "T4"]
+    assert df.attrs == {"errors": {"3": "parse-error"}, "recovery_requests": 4}
+
+
 def test_metadata_http_failure(monkeypatch):
     import searchpubmed.pubmed as p
     monkeypatch.setattr(p.requests.Session, "get",
@@ -216,7 +603,8 @@ def test_full_text_html_then_xml(monkeypatch):
             return DummyResp(content=xml.encode())
         raise AssertionError("Unexpected URL")
 
-    monkeypatch.setattr(p.requests, "get", fake_get)
+    monkeypatch.setattr(p.requests.Session, "get",
+                        lambda _s, *a, **k: fake_get(*a, **k))
 
     out = p.get_pmc_full_text("123", xml_fallback_min_chars=20)
     assert out == {"PMC123": "Very long text here"}  # PMC prefix added, XML used
@@ -226,7 +614,7 @@ def test_full_text_html_then_xml(monkeypatch):
 def test_full_text_complete_failure(monkeypatch):
     import searchpubmed.pubmed as p
 
-    monkeypatch.setattr(p.requests, "get",
+    monkeypatch.setattr(p.requests.Session, "get",
                         lambda *_a, **_k: (_ for _ in ()).throw(
                             requests.RequestException("boom")))
 
@@ -234,6 +622,34 @@ def test_full_text_complete_failure(monkeypatch):
     assert out == {"PMC1": "N/A", "PMC2": "N/A"}
 
 
+def test_full_text_batches_xml_fallback(monkeypatch):
+    import searchpubmed.pubmed as p
+
+    efetch_ids = []
+
+    def fake_get(url, params=None, **_):
+        if "?format=flat" in url:
+            pid = url.split("/articles/")[1].split("/")[0]
+            text = "long " * 10 if pid == "PMC1" else "short"
+            return DummyResp(text=f"<p>{text}</p>")
+        efetch_ids.append(params["id"])
+        arts = "".join(
+            f'<article><article-id pub-id-type="pmc">{i[3:]}</article-id>'
+            f"<body><p>XML text of {i}</p></body></article>"
+            for i in params["id"].split(",") if i != "PMC3")
+        return DummyResp(content=f"<pmc-articleset>{arts}</pmc-articleset>".encode())
+
+    monkeypatch.setattr(p.requests.Session, "get",
+                        lambda _s, *a, **k: fake_get(*a, **k))
+
+    out = p.get_pmc_full_text(["1", "PMC2", "3", "4", "5"], xml_fallback_min_chars=30,
+                              xml_batch_size=3, return_source=True)
+    assert efetch_ids == ["PMC2,PMC3,PMC4", "PMC5"]  # one request per batch
+    assert out["PMC1"] == (("long " * 10).strip(), "flat-html")
+    assert out["PMC2"] == ("XML text of PMC2", "xml")
+    assert out["PMC3"] == ("short", "flat-html")  # not returned: flat text kept
+    assert list(out) == ["PMC1", "PMC2", "PMC3", "PMC4", "PMC5"]
+
 # --- a minimal OA-service XML payload we’ll inject ---------------
 _SAMPLE_XML = """<?xml version='1.0' encoding='UTF-8'?>
 <oa status="ok">
@@ -0,0 +1,79 @@
+"""
+tests/test_ratelimit.py
+
+Token-bucket arithmetic, the per-key registry, and cross-process sharing of
+one bucket file.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import time
+
+import pytest
+
+from searchpubmed import ratelimit
+from searchpubmed.ratelimit import RateLimiter, get_rate_limiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000.0]
+    slept: list[float] = []
+
+    def fake_sleep(s):
+        slept.append(s)
+        now[0] += s
+
+    monkeypatch.setattr(ratelimit.time, "time", lambda: now[0])
+    monkeypatch.setattr(ratelimit.time, "sleep", fake_sleep)
+    return now, slept
+
+
+def test_bucket_only_waits_when_in_debt(clock):
+    now, slept = clock
+    lim = RateLimiter(4, burst=2)
+
+    assert lim.acquire() == 0 and lim.acquire() == 0   # burst
+    assert lim.acquire() == pytest.approx(0.25)        # one token per 1/4 s
+    now[0] += 10                                       # long idle → refilled
+    assert lim.acquire() == 0
+    assert slept == [pytest.approx(0.25)]
+
+
+def test_registry_defaults(tmp_path, monkeypatch):
+    monkeypatch.setenv("SEARCHPUBMED_RATELIMIT_DIR", str(tmp_path))
+    monkeypatch.setattr(ratelimit, "_REGISTRY", {})
+
+    anon, keyed = get_rate_limiter(), get_rate_limiter("k")
+    assert (anon.rate, keyed.rate) == (3.0, 10.0)
+    assert get_rate_limiter("k") is keyed
+    assert anon.path.parent == tmp_path and anon.path != keyed.path
+    assert get_rate_limiter(scope="pmc-html").rate == ratelimit.PMC_HTML_RATE
+
+
+def _worker(path: str, n: int, go, out) -> None:
+    lim = RateLimiter(40, path=path)
+    go.wait()
+    for _ in range(n):
+        lim.acquire()
+        out.put(time.time())
+
+
+@pytest.mark.skipif(ratelimit.fcntl is None, reason="needs fcntl")
+def test_bucket_shared_across_processes(tmp_path):
+    ctx = mp.get_context("spawn")
+    out, go = ctx.Queue(), ctx.Event()
+    path = str(tmp_path / "shared.bucket")
+    procs = [ctx.Process(target=_worker, args=(path, 6, go, out)) for _ in range(2)]
+    for proc in procs:
+        proc.start()
+    time.sleep(1.0)  # let both workers import and block on the event
+    go.set()
+    stamps = sorted(out.get(timeout=30) for _ in range(12))
+    for proc in procs:
+        proc.join()
+
+    # 12 tokens at 40/s with burst 1 need at least 11/40 s in aggregate;
+    # two private buckets would finish in about 5/40 s
+    assert stamps[-1] - stamps[0] >= 11 / 40 - 0.02
@@ -0,0 +1,82 @@
+"""
+tests/test_sink.py
+
+ParquetSink: partitioning, string / large_string columns, append with
+schema evolution, and the metadata driver writing batch by batch.
+"""
+
+from __future__ import annotations
+
+import sys
+
+import pandas as pd
+import pytest
+
+import searchpubmed.pubmed as p
+from searchpubmed import sink as sink_mod
+
+try:
+    import pyarrow as pa
+except ImportError:  # optional dependency
+    pa = None
+
+needs_pyarrow = pytest.mark.skipif(pa is None, reason="needs pyarrow")
+
+
+def test_missing_pyarrow_message(monkeypatch, tmp_path):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ImportError, match=r"searchpubmed\[parquet\]"):
+        sink_mod.ParquetSink(tmp_path)
+
+
+@needs_pyarrow
+def test_year_partitions_and_reopen(tmp_path):
+    s = sink_mod.ParquetSink(tmp_path, partition_by="year")
+    s.write(pd.DataFrame({"pmid": ["1", "2"],
+                          "publicationDate": ["2020-01-01", "N/A"]}).astype("string"))
+
+    reopened = sink_mod.ParquetSink(tmp_path, partition_by="year")
+    reopened.write(pd.DataFrame({"pmid": ["3"], "publicationDate": ["2021"],
+                                 "fullText": ["body"]}).astype("string"))
+
+    assert {d.name for d in tmp_path.glob("year=*")} == {
+        "year=2020", "year=2021", "year=unknown"}
+    assert reopened.schema.field("pmid").type == pa.string()
+    assert reopened.schema.field("fullText").type == pa.large_string()
+    assert reopened.schema.metadata is None                 # no pandas blob
+
+    got = reopened.dataset().to_table().sort_by("pmid").to_pydict()
+    assert got["pmid"] == ["1", "2", "3"]
+    assert got["fullText"] == [None, None, "body"]            # evolved column
+    assert got["year"] == ["2020", "unknown", "2021"]
+
+
+@needs_pyarrow
+def test_batch_partitions_keep_types_of_all_null_batches(tmp_path):
+    s = sink_mod.ParquetSink(tmp_path)
+    s.write([{"pmcid": "PMC1", "isFullText": True}])
+    s.write([{"pmcid": "PMC2", "isFullText": None}])
+
+    assert s.batches == 2 and s.rows == 2
+    assert sorted(d.name for d in tmp_path.glob("batch=*")) == ["batch=0", "batch=1"]
+    table = s.dataset().to_table().sort_by("pmcid")
+    assert table["isFullText"].to_pylist() == [True, None]
+    with pytest.raises(pa.ArrowTypeError):
+        s.write([{"pmcid": "PMC3", "isFullText": "yes"}])
+
+
+@needs_pyarrow
+def test_write_pubmed_metadata_streams_batches(tmp_path, monkeypatch):
+    seen = []
+
+    def fake_iter(ids, **kwargs):
+        for i in ids:
+            seen.append(i)
+            yield pd.DataFrame({"pmid": [i],
+                                "publicationDate": [f"20{i}0"]}).astype("string")
+
+    monkeypatch.setattr(p, "iter_pubmed_metadata_pmid", fake_iter)
+    s = sink_mod.write_pubmed_metadata(["1", "2"], tmp_path / "meta", batch_size=1)
+
+    assert seen == ["1", "2"] and s.rows == 2
+    assert sorted(s.dataset().to_table()["year"].to_pylist()) == ["2010", "2020"]